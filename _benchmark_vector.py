@@ -0,0 +1,98 @@
+"""
+_benchmark_vector.py
+
+Times the slotted Vector3f against GenericVector, the path every Vector3f
+took through attribute lists before.  Then a whole batch of Vector3fs
+against one Vector3fArray.
+
+python _benchmark_vector.py
+"""
+
+import timeit
+
+from src.ext.pyMultiD.vector import GenericVector, Vector3f
+from src.ext.pyMultiD.vector_array import get_vector_array
+
+
+class GenericVector3f(GenericVector):
+    """
+    parameters
+        float
+        float
+        float
+    """
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        super().__init__(x, y, z, attributes=["X", "Y", "Z"], attribute_type=float)
+
+
+NUMBER = 20000
+
+OPERATIONS = {
+    "create": "V(1.0, 2.0, 3.0)",
+    "add": "a + b",
+    "sub": "a - b",
+    "mul scalar": "a * 2.0",
+    "div scalar": "a / 2.0",
+    "eq": "a == b",
+    "dot": "a.dot(b)",
+    "distance": "a.distance(b)",
+    "magnitude": "a.magnitude()",
+    "normalize": "a.normalize()",
+    "translate": "a.translate(b)",
+    "values": "a.get_values_as_list()",
+}
+
+
+def time_operation(vector_type: type, statement: str) -> float:
+    """
+    parameters
+        type
+        str
+    returns
+        float
+            microseconds per operation, best of 5
+    """
+
+    namespace = {
+        "V": vector_type,
+        "a": vector_type(1.0, 2.0, 3.0),
+        "b": vector_type(4.0, 5.0, 6.0),
+    }
+    return (
+        min(timeit.repeat(statement, globals=namespace, number=NUMBER, repeat=5))
+        / NUMBER
+        * 1e6
+    )
+
+
+print(f"{'operation':<12} {'generic us':>11} {'slotted us':>11} {'speedup':>8}")
+for name, statement in OPERATIONS.items():
+    generic = time_operation(GenericVector3f, statement)
+    slotted = time_operation(Vector3f, statement)
+    print(f"{name:<12} {generic:>11.3f} {slotted:>11.3f} {generic / slotted:>7.1f}x")
+
+
+BATCH = 10000
+
+BATCH_OPERATIONS = {
+    "translate": ("for v in vs: v.translate(b)", "va.translate(b)"),
+    "rotate": ("for v in vs: v.rotate(30, 45, 60)", "va.rotate(30, 45, 60)"),
+    "normalize": ("[v.normalize() for v in vs]", "va.normalize()"),
+    "dot": ("[v.dot(b) for v in vs]", "va.dot(b)"),
+}
+
+vectors = [Vector3f(float(i), 2.0, 3.0) for i in range(BATCH)]
+namespace = {
+    "b": Vector3f(4.0, 5.0, 6.0),
+    "va": get_vector_array(vectors),
+    "vs": vectors,
+}
+
+print()
+print(f"{BATCH} Vector3fs")
+print(f"{'operation':<12} {'single ms':>11} {'array ms':>11} {'speedup':>8}")
+for name, (single, batch) in BATCH_OPERATIONS.items():
+    single = min(timeit.repeat(single, globals=namespace, number=1, repeat=3)) * 1e3
+    batch = min(timeit.repeat(batch, globals=namespace, number=1, repeat=3)) * 1e3
+    print(f"{name:<12} {single:>11.3f} {batch:>11.3f} {single / batch:>7.1f}x")
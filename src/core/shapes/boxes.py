@@ -6,21 +6,40 @@ in the form of a bigger box.
 """
 
 
+import math
+
+from ...ext.pyGraphics.instanced_shape import InstancedShape
 from ...ext.pyGraphics.shape import Shape
 from ...ext.pyGraphics.shapes.box import generate_box
 from ...ext.pyGraphics.vertex import VertexPositionNormalTexture
+from ...ext.pyHelpers.type_validation import type_validation
 from ...ext.pyMultiD.vector import Vector2f, Vector3f
 
 
+# Neighbouring cell of each generate_box face, y+, x+, x-, z+, z-, y-
+FACE_OFFSETS = [(0, 1, 0), (1, 0, 0), (-1, 0, 0), (0, 0, 1), (0, 0, -1), (0, -1, 0)]
+
+
 def generate_boxes(
     count,
     size=1.0,
     texture_minimums=[Vector2f(0.0, 0.0)] * 6,
     texture_size=Vector2f(1.0, 1.0),
+    cull_interior=False,
+    merge_faces=False,
 ):
     """
     parameters
         int
+        (optional)
+            float
+            list<Vector2f>
+            Vector2f
+            bool
+                only faces with no box beside them, the visible shell
+            bool
+                merge the shell's faces, one per side, each stretching its
+                texture over the whole side
     returns
         Shape
     """
@@ -31,24 +50,74 @@ def generate_boxes(
     elif not isinstance(size, float) or size <= 0.0:
         raise ValueError("Size must be an float and greater than 0.0")
 
-    # Shape to Return
-    shape = Shape(VertexPositionNormalTexture)
+    type_validation([cull_interior, merge_faces], bool)
 
     box_size = Vector3f(size, size, size)
 
-    for x in range(count):
-        for y in range(count):
-            for z in range(count):
-                box_minimum = Vector3f(float(x), float(y), float(z)) * box_size
-                box_maximum = box_minimum + box_size
-
-                shape.add(
-                    generate_box(
-                        box_minimum,
-                        box_maximum,
-                        texture_minimums,
-                        texture_size,
-                    )
+    cells = [
+        (x, y, z) for x in range(count) for y in range(count) for z in range(count)
+    ]
+    occupied = set(cells)
+
+    # Every side is one coplanar face, so merged, we're one big box.  That
+    # only holds while the pile fills its bounds, a sparse pile has holes
+    # and steps one box can't cover.
+    if merge_faces:
+        minimum = [min(cell[i] for cell in occupied) for i in range(3)]
+        maximum = [max(cell[i] for cell in occupied) + 1 for i in range(3)]
+        if len(occupied) != math.prod(b - a for (a, b) in zip(minimum, maximum)):
+            raise ValueError("Merge Faces needs the boxes to fill a block.")
+
+        return generate_box(
+            Vector3f(*[float(i) for i in minimum]) * box_size,
+            Vector3f(*[float(i) for i in maximum]) * box_size,
+            texture_minimums,
+            texture_size,
+        )
+
+    # One box, placed at each spot
+    if not cull_interior:
+        boxes = InstancedShape(
+            generate_box(
+                Vector3f(),
+                box_size,
+                texture_minimums,
+                texture_size,
+            )
+        )
+
+        for cell in cells:
+            boxes.add(Vector3f(*[float(i) for i in cell]) * box_size)
+
+        return boxes.get_shape(deduplicate=True)
+
+    # One box for each set of faces without a neighbour, placed at each of
+    # its spots.  Boxes without any are hidden, so skipped.
+    boxes = {}
+    for cell in cells:
+        faces_toggle_list = [
+            tuple(c + o for (c, o) in zip(cell, offset)) not in occupied
+            for offset in FACE_OFFSETS
+        ]
+        if not any(faces_toggle_list):
+            continue
+
+        key = tuple(faces_toggle_list)
+        if key not in boxes:
+            boxes[key] = InstancedShape(
+                generate_box(
+                    Vector3f(),
+                    box_size,
+                    texture_minimums,
+                    texture_size,
+                    faces_toggle_list,
                 )
+            )
+
+        boxes[key].add(Vector3f(*[float(i) for i in cell]) * box_size)
+
+    shape = Shape(VertexPositionNormalTexture)
+    for box in boxes.values():
+        shape.extend(box.get_shape(), deduplicate=True)
 
     return shape
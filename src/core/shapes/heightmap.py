@@ -25,6 +25,7 @@ def generate_heightmap(
     texture_minimum_side=Vector2f(0.0, 0.0),
     texture_minimum_top=Vector2f(0.0, 0.0),
     texture_size=Vector2f(1.0, 1.0),
+    generate_sides=True,
 ):
     """
     parameters
@@ -33,13 +34,16 @@ def generate_heightmap(
             Vector2f
             Vector2f
             Vector2f
+            bool
+                the sides down from our edges, leave off for chunks with
+                neighbours
     returns
         Shape
     """
 
     type_validation(
-        [json, texture_minimum_side, texture_minimum_top, texture_size],
-        [object, Vector2f, Vector2f, Vector2f],
+        [json, texture_minimum_side, texture_minimum_top, texture_size, generate_sides],
+        [object, Vector2f, Vector2f, Vector2f, bool],
     )
 
     if "heights" not in json or "length" not in json or "width" not in json:
@@ -70,6 +74,9 @@ def generate_heightmap(
                 )
             )
 
+    if not generate_sides:
+        return shape
+
     # X Sides
     for x in range(1, width):
         for z in [0, length - 1]:
@@ -198,15 +205,125 @@ def generate_heightmap(
     return shape
 
 
-def generate_blocked_heightmap(data: list) -> Shape:
+def generate_blocked_heightmap(
+    data: list[int],
+    width: int,
+    length: int,
+    texture_minimum_side: Vector2f = Vector2f(0.0, 0.0),
+    texture_minimum_top: Vector2f = Vector2f(0.0, 0.0),
+    texture_size: Vector2f = Vector2f(1.0, 1.0),
+) -> Shape:
     """
     parameter
         list[int]
+            block count of each column, x + width * z
+        int
+        int
+        (optional)
+            Vector2f
+            Vector2f
+            Vector2f
     return
         Shape
+
+    Greedy meshing.  For each axis, each slice between columns is a mask of
+    the block faces showing there, facing one way.  Masks are merged into
+    rectangles, each one quad, its texture stretched over it.
     """
 
     type_validation(data, [int])
+    type_validation(
+        [width, length, texture_minimum_side, texture_minimum_top, texture_size],
+        [int, int, Vector2f, Vector2f, Vector2f],
+    )
+
+    if width <= 0 or length <= 0:
+        raise ValueError("Width and Length must be greater than 0.")
+    elif len(data) != width * length:
+        raise ValueError("Data must hold Width * Length heights.")
+    elif any(h < 0 for h in data):
+        raise ValueError("Heights must be >= 0.")
+
+    # Outside the map is empty
+    def get_height(x, z):
+        if x < 0 or x >= width or z < 0 or z >= length:
+            return 0
+        return data[x + width * z]
+
+    shape = Shape(VertexPositionNormalTexture)
+
+    def add_face(axis, position, outward, a_axis, b_axis, rectangle, texture_minimum):
+        """
+        A quad on the plane axis = position, facing outward (1/-1), over
+        the rectangle (a0, b0, a1, b1) of the other two axes.
+        """
+        a0, b0, a1, b1 = rectangle
+
+        def get_point(a, b):
+            point = [0.0] * 3
+            point[axis] = float(position)
+            point[a_axis] = float(a)
+            point[b_axis] = float(b)
+            return Vector3f(*point)
+
+        corners = [
+            (get_point(a0, b0), Vector2f(0.0, 0.0)),
+            (get_point(a1, b0), Vector2f(texture_size.X, 0.0)),
+            (get_point(a1, b1), Vector2f(texture_size.X, texture_size.Y)),
+            (get_point(a0, b1), Vector2f(0.0, texture_size.Y)),
+        ]
+
+        # Counter clockwise seen from outside
+        if (a_axis == (axis + 1) % 3) != (outward > 0):
+            corners.reverse()
+
+        normal = [0.0] * 3
+        normal[axis] = float(outward)
+        normal = Vector3f(*normal)
+
+        for i in [0, 1, 2, 0, 2, 3]:
+            shape.add(
+                VertexPositionNormalTexture(
+                    corners[i][0], normal, texture_minimum + corners[i][1]
+                )
+            )
+
+    # Tops, one slice per height, and bottoms
+    for height in sorted(set(data) - {0}):
+        mask = [
+            [get_height(x, z) == height for z in range(length)] for x in range(width)
+        ]
+        for rectangle in _get_rectangles(mask):
+            add_face(1, height, 1, 0, 2, rectangle, texture_minimum_top)
+
+    mask = [[get_height(x, z) > 0 for z in range(length)] for x in range(width)]
+    for rectangle in _get_rectangles(mask):
+        add_face(1, 0, -1, 0, 2, rectangle, texture_minimum_side)
+
+    # X Sides, between columns x - 1 and x
+    heights = range(max(data))
+    for x in range(width + 1):
+        for outward in [1, -1]:
+            inside, outside = (x - 1, x) if outward > 0 else (x, x - 1)
+            mask = [
+                [get_height(outside, z) <= y < get_height(inside, z) for y in heights]
+                for z in range(length)
+            ]
+            for rectangle in _get_rectangles(mask):
+                add_face(0, x, outward, 2, 1, rectangle, texture_minimum_side)
+
+    # Z Sides, between columns z - 1 and z
+    for z in range(length + 1):
+        for outward in [1, -1]:
+            inside, outside = (z - 1, z) if outward > 0 else (z, z - 1)
+            mask = [
+                [get_height(x, outside) <= y < get_height(x, inside) for y in heights]
+                for x in range(width)
+            ]
+            for rectangle in _get_rectangles(mask):
+                add_face(2, z, outward, 0, 1, rectangle, texture_minimum_side)
+
+    return shape
 
 
 def generate_heightmap_json(width, length, octaves=10, seed=1, name="test"):
@@ -256,3 +373,38 @@ def get_slice_from_heightmap(json, z):
     width = json["width"]
 
     return heights[length * z : width + length * z]
+
+
+def _get_rectangles(mask: list[list[bool]]) -> list[tuple[int, int, int, int]]:
+    """
+    parameters
+        list[list[bool]]
+    returns
+        list[tuple(int, int, int, int)]
+            a0, b0, a1, b1, a1/b1 exclusive
+
+    Each rectangle grows along b while set, then along a while the whole
+    next row is.  Cells are cleared as they're used, changing the mask.
+    """
+
+    rectangles = []
+    for a in range(len(mask)):
+        for b in range(len(mask[a])):
+            if not mask[a][b]:
+                continue
+
+            b1 = b + 1
+            while b1 < len(mask[a]) and mask[a][b1]:
+                b1 += 1
+
+            a1 = a + 1
+            while a1 < len(mask) and all(mask[a1][b:b1]):
+                a1 += 1
+
+            for i in range(a, a1):
+                for j in range(b, b1):
+                    mask[i][j] = False
+
+            rectangles.append((a, b, a1, b1))
+
+    return rectangles
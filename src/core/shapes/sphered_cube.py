@@ -4,7 +4,7 @@ sphered_cube
 
 from ...ext.pyMultiD.vector import Vector2f, Vector3f
 
-from ...ext.pyGraphics.shape import Shape
+from ...ext.pyGraphics.instanced_shape import InstancedShape
 from ...ext.pyGraphics.shapes.box import generate_box
 
 
@@ -13,13 +13,13 @@ def sphered_cube(block_size, radius):
     parameters
         float
         float
+    returns
+        Shape
     """
 
     if not isinstance(block_size, (int, float)) or not isinstance(radius, (int, float)):
         raise ValueError("Expected an Int or Float for block size and radius.")
 
-    shape = Shape()
-
     # The idea is we start at center.  We then go as far along the z axis as we can and
     # begin usign a spiral system to add boxes all the way back along the z axis.
     center = Vector3f(0.0, 0.0, 0.0)
@@ -32,6 +32,16 @@ def sphered_cube(block_size, radius):
     half_block_size = block_size / 2
     half_block = Vector3f(half_block_size, half_block_size, half_block_size)
 
+    # One block, placed at each spot
+    blocks = InstancedShape(
+        generate_box(
+            half_block * -1.0,
+            half_block,
+            [Vector2f(0.0, 0.0)] * 6,
+            Vector2f(1.0, 1.0),
+        )
+    )
+
     # Start at max for moving along the z-axis
     current_z_axis = z_axis_max
 
@@ -79,14 +89,7 @@ def sphered_cube(block_size, radius):
 
                 # Block in our radius?
                 if current_block.distance(center) <= radius:
-                    b = generate_box(
-                        current_block - half_block,
-                        current_block + half_block,
-                        [Vector2f(0.0, 0.0)] * 6,
-                        Vector2f(1.0, 1.0),
-                    )
-
-                    shape.add(b)
+                    blocks.add(current_block)
 
                     # Keep our Loop going
                     found = True
@@ -99,4 +102,4 @@ def sphered_cube(block_size, radius):
         if current_z_axis <= -z_axis_max:
             break
 
-    return shape
+    return blocks.get_shape(deduplicate=True)
@@ -2,6 +2,7 @@
 tiled.py
 """
 
+from ....ext.pyGraphics.instanced_shape import InstancedShape
 from ....ext.pyGraphics.shape import Shape
 from ....ext.pyGraphics.vertex import VertexPositionNormalTexture
 from ....ext.pyHelpers.type_validation import type_validation
@@ -44,7 +45,17 @@ def generate_tiled(
     ):
         raise ValueError("All Texture Minimums must be Vector2fs")
 
-    shape = Shape(VertexPositionNormalTexture)
+    # One tile for each Texture Minimum, placed at each of its spots
+    tiles = [
+        InstancedShape(
+            create_tile(
+                tile_height,
+                texture_minimum=texture_minimum,
+                texture_size=texture_size,
+            )
+        )
+        for texture_minimum in texture_minimums[:2]
+    ]
 
     for i in range(width):
         for j in range(length):
@@ -52,16 +63,11 @@ def generate_tiled(
                 continue
 
             texture_minimum_index = ((i % 2) + (j % 2)) % 2
-            texture_minimum = texture_minimums[texture_minimum_index]
 
-            tile = create_tile(
-                tile_height,
-                texture_minimum=texture_minimum,
-                texture_size=texture_size,
-            )
+            tiles[texture_minimum_index].add(Vector3f(float(i), 0.0, float(j)))
 
-            tile.translate(Vector3f(float(i), 0.0, float(j)))
-
-            shape.add(tile)
+    shape = Shape(VertexPositionNormalTexture)
+    for tile in tiles:
+        shape.add(tile.get_shape(deduplicate=True))
 
     return shape
@@ -0,0 +1,367 @@
+"""
+chunked_world.py
+
+A heightmap world split into square chunks, each its own Shape.
+
+Chunks hold chunk size + 1 heights per side, so neighbours share their
+edge row and their Shapes meet.  A chunk loading next to a loaded one
+copies their shared edge rather than sampling it again.  Only loaded
+chunks are kept, edits to a chunk rebuild (and re-export) just it, and any
+neighbour sharing the edit.
+
+Edits are also kept by position, apart from the chunks, so they outlive an
+unload and are there again on a reload.
+"""
+
+from array import array
+
+from perlin_noise import PerlinNoise
+
+from ...ext.pyGraphics.objfile import objfile
+from ...ext.pyGraphics.shape import Shape
+from ...ext.pyHelpers.type_validation import type_validation
+from ...ext.pyMultiD.vector import Vector2f, Vector3f
+
+from ..shapes.heightmap import generate_heightmap
+
+
+class ChunkedWorld:
+    """
+    parameters
+        int
+            cells per chunk side
+        (optional)
+            int
+            int
+            float
+                world units per unit of noise
+            Vector2f
+            Vector2f
+            Vector2f
+    """
+
+    __slots__ = [
+        "__chunk_size",
+        "__dirty",
+        "__edits",
+        "__heights",
+        "__noise",
+        "__noise_scale",
+        "__shapes",
+        "__texture_minimum_side",
+        "__texture_minimum_top",
+        "__texture_size",
+    ]
+
+    def __init__(
+        self,
+        chunk_size: int,
+        octaves: int = 10,
+        seed: int = 1,
+        noise_scale: float = 64.0,
+        texture_minimum_side: Vector2f = Vector2f(0.0, 0.0),
+        texture_minimum_top: Vector2f = Vector2f(0.0, 0.0),
+        texture_size: Vector2f = Vector2f(1.0, 1.0),
+    ):
+        type_validation(
+            [
+                chunk_size,
+                octaves,
+                seed,
+                noise_scale,
+                texture_minimum_side,
+                texture_minimum_top,
+                texture_size,
+            ],
+            [int, int, int, float, Vector2f, Vector2f, Vector2f],
+        )
+
+        if chunk_size <= 0:
+            raise ValueError("Chunk Size must be greater than 0.")
+        elif noise_scale <= 0.0:
+            raise ValueError("Noise Scale must be greater than 0.0.")
+
+        self.__chunk_size = chunk_size
+        self.__dirty = set()
+        self.__edits = {}
+        self.__heights = {}
+        self.__noise = PerlinNoise(octaves=octaves, seed=seed)
+        self.__noise_scale = noise_scale
+        self.__shapes = {}
+        self.__texture_minimum_side = texture_minimum_side
+        self.__texture_minimum_top = texture_minimum_top
+        self.__texture_size = texture_size
+
+    def __repr__(self) -> str:
+        """
+        returns
+            string
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            string
+        """
+        return f"{len(self.__heights)} chunks of {self.__chunk_size}"
+
+    def export(
+        self,
+        name: str,
+        image_name: str | None = None,
+        image_path: str = "./",
+        path: str = "./",
+    ) -> list[tuple[int, int]]:
+        """
+        parameters
+            str
+            (optional)
+                str/None
+                str
+                str
+        returns
+            list[tuple(int, int)]
+                the chunks exported
+
+        Writes an obj of each chunk changed since it was last exported,
+        named name_x_z.
+        """
+
+        type_validation(name, str)
+
+        exported = self.get_dirty_chunks()
+        for chunk in exported:
+            objfile(
+                self.get_shape(*chunk),
+                f"{name}_{chunk[0]}_{chunk[1]}",
+                image_name,
+                image_path,
+                path,
+            )
+            self.__dirty.discard(chunk)
+
+        return exported
+
+    def get_chunk_size(self) -> int:
+        """
+        returns
+            int
+        """
+        return self.__chunk_size
+
+    def __get_chunks_holding(self, x: int, z: int) -> list[tuple[int, int]]:
+        """
+        parameters
+            int
+            int
+        returns
+            list[tuple(int, int)]
+                the loaded chunks holding the height, up to four on corners
+        """
+
+        chunks_x = [x // self.__chunk_size]
+        if x % self.__chunk_size == 0:
+            chunks_x.append(chunks_x[0] - 1)
+
+        chunks_z = [z // self.__chunk_size]
+        if z % self.__chunk_size == 0:
+            chunks_z.append(chunks_z[0] - 1)
+
+        return [
+            (chunk_x, chunk_z)
+            for chunk_x in chunks_x
+            for chunk_z in chunks_z
+            if (chunk_x, chunk_z) in self.__heights
+        ]
+
+    def get_dirty_chunks(self) -> list[tuple[int, int]]:
+        """
+        returns
+            list[tuple(int, int)]
+                loaded chunks changed since they were last exported
+        """
+        return sorted(self.__dirty)
+
+    def get_height(self, x: int, z: int) -> float:
+        """
+        parameters
+            int
+            int
+        returns
+            float
+        """
+
+        type_validation([x, z], int)
+
+        chunks = self.__get_chunks_holding(x, z)
+        if len(chunks) == 0:
+            raise ValueError(f"No loaded chunk holds {x}, {z}.")
+
+        return self.__heights[chunks[0]][self.__get_height_index(chunks[0], x, z)]
+
+    def __get_height_index(self, chunk: tuple[int, int], x: int, z: int) -> int:
+        """
+        parameters
+            tuple(int, int)
+            int
+            int
+        returns
+            int
+        """
+        x -= chunk[0] * self.__chunk_size
+        z -= chunk[1] * self.__chunk_size
+        return x + (self.__chunk_size + 1) * z
+
+    def get_loaded_chunks(self) -> list[tuple[int, int]]:
+        """
+        returns
+            list[tuple(int, int)]
+        """
+        return sorted(self.__heights)
+
+    def get_shape(self, chunk_x: int, chunk_z: int) -> Shape:
+        """
+        parameters
+            int
+            int
+        returns
+            Shape
+
+        Cached, only rebuilt after the chunk changes.  Positions are in
+        world space.
+        """
+
+        type_validation([chunk_x, chunk_z], int)
+
+        chunk = (chunk_x, chunk_z)
+        if chunk not in self.__heights:
+            raise ValueError(f"Chunk {chunk_x}, {chunk_z} isn't loaded.")
+
+        if chunk not in self.__shapes:
+            size = self.__chunk_size + 1
+            shape = generate_heightmap(
+                {
+                    "name": f"{chunk_x}_{chunk_z}",
+                    "width": size,
+                    "length": size,
+                    "heights": self.__heights[chunk].tolist(),
+                },
+                self.__texture_minimum_side,
+                self.__texture_minimum_top,
+                self.__texture_size,
+                False,
+            )
+            shape.translate(
+                Vector3f(
+                    float(chunk_x * self.__chunk_size),
+                    0.0,
+                    float(chunk_z * self.__chunk_size),
+                )
+            )
+            self.__shapes[chunk] = shape
+
+        return self.__shapes[chunk]
+
+    def is_loaded(self, chunk_x: int, chunk_z: int) -> bool:
+        """
+        parameters
+            int
+            int
+        returns
+            bool
+        """
+        return (chunk_x, chunk_z) in self.__heights
+
+    def load_chunk(self, chunk_x: int, chunk_z: int):
+        """
+        parameters
+            int
+            int
+
+        Takes each height from our edits, then from a loaded neighbour
+        sharing it, then from our noise.  Its Shape is built when first
+        asked for.
+        """
+
+        type_validation([chunk_x, chunk_z], int)
+
+        chunk = (chunk_x, chunk_z)
+        if chunk in self.__heights:
+            return
+
+        start_x = chunk_x * self.__chunk_size
+        start_z = chunk_z * self.__chunk_size
+        self.__heights[chunk] = array(
+            "d",
+            [
+                self.__sample_height(start_x + x, start_z + z)
+                for z in range(self.__chunk_size + 1)
+                for x in range(self.__chunk_size + 1)
+            ],
+        )
+        self.__dirty.add(chunk)
+
+    def __sample_height(self, x: int, z: int) -> float:
+        """
+        parameters
+            int
+            int
+        returns
+            float
+        """
+
+        if (x, z) in self.__edits:
+            return self.__edits[(x, z)]
+
+        chunks = self.__get_chunks_holding(x, z)
+        if len(chunks) > 0:
+            return self.__heights[chunks[0]][self.__get_height_index(chunks[0], x, z)]
+
+        return round(
+            self.__noise([x / self.__noise_scale, z / self.__noise_scale]),
+            2,
+        )
+
+    def set_height(self, x: int, z: int, height: float):
+        """
+        parameters
+            int
+            int
+            float
+
+        Changes the height in every loaded chunk holding it, marking them
+        dirty.  Kept for any chunk holding it that loads later, too.
+        """
+
+        type_validation([x, z, height], [int, int, float])
+
+        chunks = self.__get_chunks_holding(x, z)
+        if len(chunks) == 0:
+            raise ValueError(f"No loaded chunk holds {x}, {z}.")
+
+        self.__edits[(x, z)] = height
+
+        for chunk in chunks:
+            index = self.__get_height_index(chunk, x, z)
+            if self.__heights[chunk][index] != height:
+                self.__heights[chunk][index] = height
+                self.__shapes.pop(chunk, None)
+                self.__dirty.add(chunk)
+
+    def unload_chunk(self, chunk_x: int, chunk_z: int):
+        """
+        parameters
+            int
+            int
+
+        Drops the chunk and its Shape.  Edits to it are kept, for when it
+        loads again.
+        """
+
+        type_validation([chunk_x, chunk_z], int)
+
+        chunk = (chunk_x, chunk_z)
+        self.__heights.pop(chunk, None)
+        self.__shapes.pop(chunk, None)
+        self.__dirty.discard(chunk)
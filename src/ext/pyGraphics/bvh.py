@@ -0,0 +1,590 @@
+"""
+bvh.py
+
+A bounding volume hierarchy over a Shape's triangles, for ray and region
+queries.
+
+Built top down with binned SAH (surface area heuristic), each split tries
+BIN_COUNT bins per axis and keeps the cheapest.  Nodes are flat arrays,
+6 bounds and 2 ints each.  A leaf's ints are its first triangle (in our
+ordered triangles) and count.  An internal node's are its left child and
+0, its right child is always left + 1.
+
+Refitting reads the Shape's positions again and rebuilds the bounds bottom
+up, keeping the tree, so is cheap after translate (or any transform).
+"""
+
+import math
+
+from array import array
+
+from ..pyHelpers.type_validation import type_validation
+from ..pyMultiD.aabb import AABB3f
+from ..pyMultiD.vector import Vector3f
+
+from .shape import Shape
+
+
+# Bins tried per axis when splitting
+BIN_COUNT = 12
+
+# Triangles a leaf can hold
+LEAF_SIZE = 4
+
+# Below this a ray and a triangle are parallel
+RAY_EPSILON = 1e-9
+
+
+class BVH:
+    """
+    parameters
+        Shape
+    """
+
+    __slots__ = [
+        "__bounds",
+        "__counts",
+        "__firsts",
+        "__positions",
+        "__shape",
+        "__triangles",
+    ]
+
+    def __init__(self, shape: Shape):
+        type_validation(shape, Shape)
+
+        if "vp" not in shape.get_order():
+            raise ValueError("Shape must have positions.")
+        elif not shape.is_valid():
+            raise ValueError("Shape must be made of triangles.")
+
+        self.__shape = shape
+        self.__positions = self.__get_positions()
+        self.__build()
+
+    def __repr__(self) -> str:
+        """
+        returns
+            string
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            string
+        """
+        return f"{self.get_node_count()} nodes, {len(self.__triangles)} triangles"
+
+    def __build(self):
+        """
+        Splits our triangles, largest nodes first, until each fits a leaf
+        or no split is cheaper than not splitting.
+        """
+
+        count = len(self.__positions) // 9
+
+        self.__triangles = array("I", range(count))
+        self.__bounds = array("d")
+        self.__firsts = array("I")
+        self.__counts = array("I")
+
+        # Each triangle's bounds, and their centers, which we split on
+        triangle_bounds = [self.__get_triangles_bounds_of([t]) for t in range(count)]
+        centroids = array(
+            "d",
+            [(b[i] + b[i + 3]) * 0.5 for b in triangle_bounds for i in range(3)],
+        )
+
+        self.__add_node(0, count)
+        stack = [0]
+        while len(stack) > 0:
+            node = stack.pop()
+            first, count = self.__firsts[node], self.__counts[node]
+
+            split = self.__get_split(node, first, count, centroids, triangle_bounds)
+            if split is None:
+                continue
+
+            axis, position = split
+
+            # Partition in place, left of the split first
+            triangles = self.__triangles
+            i, j = first, first + count - 1
+            while i <= j:
+                if centroids[triangles[i] * 3 + axis] < position:
+                    i += 1
+                else:
+                    triangles[i], triangles[j] = triangles[j], triangles[i]
+                    j -= 1
+
+            left_count = i - first
+            if left_count == 0 or left_count == count:
+                continue
+
+            left = self.__add_node(first, left_count)
+            self.__add_node(i, count - left_count)
+
+            self.__firsts[node] = left
+            self.__counts[node] = 0
+
+            stack.extend([left, left + 1])
+
+    def __add_node(self, first: int, count: int) -> int:
+        """
+        parameters
+            int
+            int
+        returns
+            int
+                the new node
+
+        A leaf over the triangles, bounding them.
+        """
+
+        node = len(self.__firsts)
+        self.__firsts.append(first)
+        self.__counts.append(count)
+        self.__bounds.extend(self.__get_triangles_bounds(first, count))
+        return node
+
+    def get_bounds(self) -> AABB3f:
+        """
+        returns
+            AABB3f
+        """
+
+        return AABB3f(Vector3f(*self.__bounds[0:3]), Vector3f(*self.__bounds[3:6]))
+
+    def get_first_hit(
+        self,
+        origin: Vector3f,
+        direction: Vector3f,
+        max_distance: float = math.inf,
+    ) -> tuple[int, float] | None:
+        """
+        parameters
+            Vector3f
+            Vector3f
+            (optional)
+                float
+                    in lengths of direction
+        returns
+            tuple(int, float)/None
+                the nearest triangle hit (its index in the Shape's
+                triangles) and distance, in lengths of direction
+
+        Both sides of a triangle are hit.
+        """
+
+        type_validation([origin, direction, max_distance], [Vector3f, Vector3f, float])
+
+        return self.__trace(
+            origin.get_values_as_list(), direction.get_values_as_list(), max_distance
+        )
+
+    def get_node_count(self) -> int:
+        """
+        returns
+            int
+        """
+        return len(self.__firsts)
+
+    def get_overlapping(self, aabb: AABB3f) -> list[int]:
+        """
+        parameters
+            AABB3f
+        returns
+            list[int]
+                triangles (their index in the Shape's triangles) whose
+                bounds overlap the AABB, sorted
+        """
+
+        type_validation(aabb, AABB3f)
+
+        minimum = aabb.Minimum.get_values_as_list()
+        maximum = aabb.Maximum.get_values_as_list()
+        positions = self.__positions
+
+        overlapping = []
+        stack = [0]
+        while len(stack) > 0:
+            node = stack.pop()
+            bounds = self.__bounds[node * 6 : node * 6 + 6]
+            if any(
+                bounds[axis + 3] < minimum[axis] or bounds[axis] > maximum[axis]
+                for axis in range(3)
+            ):
+                continue
+
+            first, count = self.__firsts[node], self.__counts[node]
+            if count == 0:
+                stack.extend([first, first + 1])
+                continue
+
+            for t in self.__triangles[first : first + count]:
+                p = positions[t * 9 : t * 9 + 9]
+                if all(
+                    max(p[axis], p[axis + 3], p[axis + 6]) >= minimum[axis]
+                    and min(p[axis], p[axis + 3], p[axis + 6]) <= maximum[axis]
+                    for axis in range(3)
+                ):
+                    overlapping.append(t)
+
+        return sorted(overlapping)
+
+    def __get_positions(self) -> array:
+        """
+        returns
+            array[float]
+                9 per triangle, its three positions
+        """
+
+        stride = self.__shape.get_indices_stride()
+        vp_index = self.__shape.get_order().index("vp")
+        vp = self.__shape.get_vertex_array(vp_index)
+
+        positions = array("d")
+        for i in self.__shape.get_indices_array()[vp_index::stride]:
+            positions.extend(vp[i * 3 : i * 3 + 3])
+        return positions
+
+    def get_shape(self) -> Shape:
+        """
+        returns
+            Shape
+        """
+        return self.__shape
+
+    def __get_split(
+        self,
+        node: int,
+        first: int,
+        count: int,
+        centroids: array,
+        triangle_bounds: list[list[float]],
+    ) -> tuple[int, float] | None:
+        """
+        parameters
+            int
+            int
+            int
+            array[float]
+            list[list[float]]
+        returns
+            tuple(int, float)/None
+                axis and position, None if we're better as a leaf
+
+        Binned SAH, bins span our centroids, the cost of a split is each
+        side's surface area by its triangle count.
+        """
+
+        if count <= LEAF_SIZE:
+            return None
+
+        triangles = self.__triangles[first : first + count]
+
+        best = None
+        best_cost = _get_surface_area(self.__bounds[node * 6 : node * 6 + 6]) * count
+        for axis in range(3):
+            values = [centroids[t * 3 + axis] for t in triangles]
+            low, high = min(values), max(values)
+            if low == high:
+                continue
+
+            scale = BIN_COUNT / (high - low)
+            bin_counts = [0] * BIN_COUNT
+            bin_bounds = [_get_empty_bounds() for _ in range(BIN_COUNT)]
+            for t, value in zip(triangles, values):
+                b = min(int((value - low) * scale), BIN_COUNT - 1)
+                bin_counts[b] += 1
+                _expand_bounds(bin_bounds[b], triangle_bounds[t])
+
+            # Sweep from the right, then left, costing each plane between bins
+            right_costs = [0.0] * BIN_COUNT
+            bounds, total = _get_empty_bounds(), 0
+            for b in range(BIN_COUNT - 1, 0, -1):
+                _expand_bounds(bounds, bin_bounds[b])
+                total += bin_counts[b]
+                right_costs[b] = _get_surface_area(bounds) * total
+
+            bounds, total = _get_empty_bounds(), 0
+            for b in range(BIN_COUNT - 1):
+                _expand_bounds(bounds, bin_bounds[b])
+                total += bin_counts[b]
+                cost = _get_surface_area(bounds) * total + right_costs[b + 1]
+                if cost < best_cost:
+                    best_cost = cost
+                    best = (axis, low + (b + 1) / scale)
+
+        return best
+
+    def __get_triangles_bounds(self, first: int, count: int) -> list[float]:
+        """
+        parameters
+            int
+            int
+        returns
+            list[float]
+                minimum then maximum
+        """
+        return self.__get_triangles_bounds_of(self.__triangles[first : first + count])
+
+    def __get_triangles_bounds_of(self, triangles: list[int]) -> list[float]:
+        """
+        parameters
+            list[int]
+        returns
+            list[float]
+                minimum then maximum
+        """
+
+        positions = self.__positions
+        bounds = _get_empty_bounds()
+        for t in triangles:
+            for corner in range(t * 9, t * 9 + 9, 3):
+                for axis in range(3):
+                    value = positions[corner + axis]
+                    if value < bounds[axis]:
+                        bounds[axis] = value
+                    if value > bounds[axis + 3]:
+                        bounds[axis + 3] = value
+        return bounds
+
+    def is_hit(
+        self,
+        origin: Vector3f,
+        direction: Vector3f,
+        max_distance: float = math.inf,
+    ) -> bool:
+        """
+        parameters
+            Vector3f
+            Vector3f
+            (optional)
+                float
+                    in lengths of direction
+        returns
+            bool
+
+        Stops at the first triangle hit, for line of sight.
+        """
+
+        type_validation([origin, direction, max_distance], [Vector3f, Vector3f, float])
+
+        return (
+            self.__trace(
+                origin.get_values_as_list(),
+                direction.get_values_as_list(),
+                max_distance,
+                True,
+            )
+            is not None
+        )
+
+    def refit(self):
+        """
+        Reads the Shape's positions again, then rebuilds our bounds from the
+        leaves up.  Children always come after their parents, so that's
+        just our nodes in reverse.  The Shape's triangles must not have
+        changed, rebuild a BVH if they have.
+        """
+
+        positions = self.__get_positions()
+        if len(positions) != len(self.__positions):
+            raise ValueError("Shape's triangles changed, build a new BVH.")
+
+        self.__positions = positions
+
+        bounds = self.__bounds
+        for node in range(self.get_node_count() - 1, -1, -1):
+            first, count = self.__firsts[node], self.__counts[node]
+            if count == 0:
+                node_bounds = bounds[first * 6 : first * 6 + 6].tolist()
+                _expand_bounds(node_bounds, bounds[first * 6 + 6 : first * 6 + 12])
+            else:
+                node_bounds = self.__get_triangles_bounds(first, count)
+            bounds[node * 6 : node * 6 + 6] = array("d", node_bounds)
+
+    def __trace(
+        self,
+        origin: list[float],
+        direction: list[float],
+        max_distance: float,
+        any_hit: bool = False,
+    ) -> tuple[int, float] | None:
+        """
+        parameters
+            list[float]
+            list[float]
+            float
+            (optional)
+                bool
+                    stop at the first hit, not the nearest
+        returns
+            tuple(int, float)/None
+
+        Nearer children are visited first, and nodes further than our
+        nearest hit so far are skipped.
+        """
+
+        inverse = [math.inf if d == 0.0 else 1.0 / d for d in direction]
+        positions = self.__positions
+
+        nearest = None
+        stack = [(0, self.__get_ray_entry(0, origin, inverse, max_distance))]
+        while len(stack) > 0:
+            node, entry = stack.pop()
+            if entry is None or entry > max_distance:
+                continue
+
+            first, count = self.__firsts[node], self.__counts[node]
+            if count == 0:
+                entries = [
+                    (child, self.__get_ray_entry(child, origin, inverse, max_distance))
+                    for child in [first, first + 1]
+                ]
+                entries = [e for e in entries if e[1] is not None]
+
+                # Push the nearer last, so it's popped first
+                entries.sort(key=lambda e: e[1], reverse=True)
+                stack.extend(entries)
+                continue
+
+            for t in self.__triangles[first : first + count]:
+                distance = _get_ray_triangle_distance(
+                    origin, direction, positions[t * 9 : t * 9 + 9]
+                )
+                if distance is not None and distance <= max_distance:
+                    if any_hit:
+                        return (t, distance)
+                    max_distance = distance
+                    nearest = (t, distance)
+
+        return nearest
+
+    def __get_ray_entry(
+        self,
+        node: int,
+        origin: list[float],
+        inverse: list[float],
+        max_distance: float,
+    ) -> float | None:
+        """
+        parameters
+            int
+            list[float]
+            list[float]
+            float
+        returns
+            float/None
+                distance the ray enters the node, None if it misses
+
+        Slab test, each axis clips the ray to between its planes.
+        """
+
+        bounds = self.__bounds
+        near, far = 0.0, max_distance
+        for axis in range(3):
+            low = bounds[node * 6 + axis]
+            high = bounds[node * 6 + axis + 3]
+            if inverse[axis] == math.inf:
+                if origin[axis] < low or origin[axis] > high:
+                    return None
+                continue
+
+            t1 = (low - origin[axis]) * inverse[axis]
+            t2 = (high - origin[axis]) * inverse[axis]
+            if t1 > t2:
+                t1, t2 = t2, t1
+            near = max(near, t1)
+            far = min(far, t2)
+            if near > far:
+                return None
+
+        return near
+
+
+def _expand_bounds(bounds: list[float], other: list[float]):
+    """
+    parameters
+        list[float]
+        list[float]
+
+    Expands the first bounds, in place, to hold the second.
+    """
+    for axis in range(3):
+        bounds[axis] = min(bounds[axis], other[axis])
+        bounds[axis + 3] = max(bounds[axis + 3], other[axis + 3])
+
+
+def _get_empty_bounds() -> list[float]:
+    """
+    returns
+        list[float]
+            minimum then maximum, inside out so anything expands it
+    """
+    return [math.inf] * 3 + [-math.inf] * 3
+
+
+def _get_ray_triangle_distance(
+    origin: list[float], direction: list[float], p: list[float]
+) -> float | None:
+    """
+    parameters
+        list[float]
+        list[float]
+        list[float]
+            9, the triangle's positions
+    returns
+        float/None
+
+    Moller Trumbore, either side of the triangle.
+    """
+
+    e1 = [p[3] - p[0], p[4] - p[1], p[5] - p[2]]
+    e2 = [p[6] - p[0], p[7] - p[1], p[8] - p[2]]
+
+    h = [
+        direction[1] * e2[2] - direction[2] * e2[1],
+        direction[2] * e2[0] - direction[0] * e2[2],
+        direction[0] * e2[1] - direction[1] * e2[0],
+    ]
+    a = e1[0] * h[0] + e1[1] * h[1] + e1[2] * h[2]
+    if abs(a) < RAY_EPSILON:
+        return None
+
+    f = 1.0 / a
+    s = [origin[0] - p[0], origin[1] - p[1], origin[2] - p[2]]
+    u = f * (s[0] * h[0] + s[1] * h[1] + s[2] * h[2])
+    if u < 0.0 or u > 1.0:
+        return None
+
+    q = [
+        s[1] * e1[2] - s[2] * e1[1],
+        s[2] * e1[0] - s[0] * e1[2],
+        s[0] * e1[1] - s[1] * e1[0],
+    ]
+    v = f * (direction[0] * q[0] + direction[1] * q[1] + direction[2] * q[2])
+    if v < 0.0 or u + v > 1.0:
+        return None
+
+    distance = f * (e2[0] * q[0] + e2[1] * q[1] + e2[2] * q[2])
+    return distance if distance >= 0.0 else None
+
+
+def _get_surface_area(bounds: list[float]) -> float:
+    """
+    parameters
+        list[float]
+            minimum then maximum
+    returns
+        float
+    """
+
+    x = bounds[3] - bounds[0]
+    y = bounds[4] - bounds[1]
+    z = bounds[5] - bounds[2]
+    if x < 0.0 or y < 0.0 or z < 0.0:
+        return 0.0
+    return 2.0 * (x * y + y * z + z * x)
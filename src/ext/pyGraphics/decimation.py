@@ -0,0 +1,361 @@
+"""
+decimation.py
+
+Reduces a Shape's triangle count with quadric error metrics.
+
+Surface Simplification Using Quadric Error Metrics
+Garland, Heckbert 1997
+
+Each position keeps the sum of the planes of its triangles, as a 4x4
+symmetric matrix (10 values).  Collapsing an edge moves one position onto
+the other, costing the summed quadrics evaluated at the kept position.
+Cheapest collapses go first, from a heap.
+
+Collapses are half edge, so no new positions are made, the kept position's
+texture coordinate carries over.  Normals around a collapse are found again
+from the triangles left.  Positions on a border (an edge with one triangle)
+are never removed, so neighbouring chunks still line up, nor, by default,
+are positions with more than one texture coordinate (a UV seam).
+"""
+
+import heapq
+import math
+
+from ..pyHelpers.type_validation import type_validation
+
+from .shape import Shape
+
+
+# Furthest a triangle's normal may turn from where it started, as a cosine
+TURN_COSINE = 0.5
+
+
+def _get_normal(a: list[float], b: list[float], c: list[float]) -> list[float]:
+    """
+    parameters
+        list[float]
+        list[float]
+        list[float]
+    returns
+        list[float]
+            not normalized
+    """
+
+    u = [b[i] - a[i] for i in range(3)]
+    v = [c[i] - a[i] for i in range(3)]
+    return [
+        u[1] * v[2] - u[2] * v[1],
+        u[2] * v[0] - u[0] * v[2],
+        u[0] * v[1] - u[1] * v[0],
+    ]
+
+
+def _get_quadric(a: list[float], b: list[float], c: list[float]) -> list[float]:
+    """
+    parameters
+        list[float]
+        list[float]
+        list[float]
+    returns
+        list[float]
+            aa, ab, ac, ad, bb, bc, bd, cc, cd, dd
+
+    The quadric of the triangle's plane, empty (zeroes) when degenerate.
+    """
+
+    n = _get_normal(a, b, c)
+    length = math.sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2])
+    if length == 0.0:
+        return [0.0] * 10
+
+    x, y, z = [i / length for i in n]
+    d = -(x * a[0] + y * a[1] + z * a[2])
+
+    return [x * x, x * y, x * z, x * d, y * y, y * z, y * d, z * z, z * d, d * d]
+
+
+def _get_quadric_error(q: list[float], p: list[float]) -> float:
+    """
+    parameters
+        list[float]
+        list[float]
+    returns
+        float
+    """
+
+    x, y, z = p
+    return (
+        q[0] * x * x
+        + 2.0 * q[1] * x * y
+        + 2.0 * q[2] * x * z
+        + 2.0 * q[3] * x
+        + q[4] * y * y
+        + 2.0 * q[5] * y * z
+        + 2.0 * q[6] * y
+        + q[7] * z * z
+        + 2.0 * q[8] * z
+        + q[9]
+    )
+
+
+def decimate_shape(
+    shape: Shape,
+    target_count: int | None = None,
+    max_error: float | None = None,
+    preserve_seams: bool = True,
+) -> dict:
+    """
+    parameters
+        Shape
+        (optional)
+            int/None
+                triangles to stop at
+            float/None
+                collapse cost to stop at
+            bool
+                don't remove positions with more than one texture
+                coordinate (a UV seam), so each texture region, an atlas
+                tile too, keeps to its own coordinates.  Tiled heightmaps
+                are seams throughout, off decimates them, but the texture
+                slides.
+    returns
+        { before, after }
+            triangle counts
+
+    Collapses edges, cheapest first, until we reach the target count or
+    the next collapse would cost more than the max error.  At least one of
+    those must be given.  Changes the Shape in place.
+    """
+
+    type_validation(shape, Shape)
+    type_validation(preserve_seams, bool)
+
+    if target_count is None and max_error is None:
+        raise ValueError("Target Count or Max Error must be given.")
+    elif target_count is not None and (
+        not isinstance(target_count, int) or target_count < 0
+    ):
+        raise ValueError("Target Count must be an int >= 0 or None.")
+    elif max_error is not None and (not isinstance(max_error, float) or max_error < 0):
+        raise ValueError("Max Error must be a float >= 0.0 or None.")
+    elif "vp" not in shape.get_order():
+        raise ValueError("Shape must have positions.")
+    elif not shape.is_valid():
+        raise ValueError("Shape must be made of triangles.")
+
+    order = shape.get_order()
+    stride = shape.get_indices_stride()
+    vp_index = order.index("vp")
+    vn_index = order.index("vn") if "vn" in order else None
+    vt_index = order.index("vt") if "vt" in order else None
+    indices = shape.get_indices_array()
+    before = len(indices) // (stride * 3)
+
+    # Positions by value, so vertices that were never merged still collapse
+    position_ids = {}
+    positions = []
+    vp_ids = []
+    for i in range(shape.get_vertex_count(vp_index)):
+        values = tuple(shape.get_vertex_values(vp_index, i))
+        if values not in position_ids:
+            position_ids[values] = len(positions)
+            positions.append(list(values))
+        vp_ids.append(position_ids[values])
+
+    # Per triangle, its position ids and the whole indice of each corner
+    triangles = []
+    corners = []
+    for t in range(0, len(indices), stride * 3):
+        triangles.append([vp_ids[indices[t + k * stride + vp_index]] for k in range(3)])
+        corners.append(
+            [tuple(indices[t + k * stride : t + (k + 1) * stride]) for k in range(3)]
+        )
+    alive = [True] * len(triangles)
+    normals = [_get_normal(*[positions[p] for p in t]) for t in triangles]
+
+    # Triangles around each position
+    position_triangles = [set() for _ in positions]
+    for t in range(len(triangles)):
+        for p in triangles[t]:
+            position_triangles[p].add(t)
+
+    quadrics = [[0.0] * 10 for _ in positions]
+    for t in range(len(triangles)):
+        q = _get_quadric(*[positions[p] for p in triangles[t]])
+        for p in triangles[t]:
+            quadrics[p] = [a + b for (a, b) in zip(quadrics[p], q)]
+
+    # Locked positions are never removed, borders, seams, anything odd
+    locked = [False] * len(positions)
+    edges = {}
+    for t in range(len(triangles)):
+        a, b, c = triangles[t]
+        if a == b or b == c or c == a:
+            locked[a] = locked[b] = locked[c] = True
+            continue
+        for edge in [(a, b), (b, c), (c, a)]:
+            edge = (min(edge), max(edge))
+            edges[edge] = edges.get(edge, 0) + 1
+    for (a, b), uses in edges.items():
+        if uses != 2:
+            locked[a] = locked[b] = True
+
+    # Normals each position started with, only those with one are found
+    # again, more is a hard edge
+    if vn_index is not None:
+        position_normals = [set() for _ in positions]
+        for t in range(len(triangles)):
+            for k in range(3):
+                position_normals[triangles[t][k]].add(
+                    tuple(shape.get_vertex_values(vn_index, corners[t][k][vn_index]))
+                )
+
+    if preserve_seams and vt_index is not None:
+        textures = [set() for _ in positions]
+        for t in range(len(triangles)):
+            for k in range(3):
+                textures[triangles[t][k]].add(
+                    tuple(shape.get_vertex_values(vt_index, corners[t][k][vt_index]))
+                )
+        for p in range(len(positions)):
+            if len(textures[p]) > 1:
+                locked[p] = True
+
+    def get_neighbours(p: int) -> set:
+        neighbours = set()
+        for t in position_triangles[p]:
+            neighbours.update(triangles[t])
+        neighbours.discard(p)
+        return neighbours
+
+    # Bumped whenever a position's neighbourhood changes, stale heap entries
+    # are skipped when popped.
+    versions = [0] * len(positions)
+    heap = []
+
+    def push(v: int, u: int):
+        if locked[v]:
+            return
+        q = [a + b for (a, b) in zip(quadrics[v], quadrics[u])]
+        heapq.heappush(
+            heap,
+            (_get_quadric_error(q, positions[u]), v, u, versions[v], versions[u]),
+        )
+
+    for a, b in edges:
+        push(a, b)
+        push(b, a)
+
+    # Positions whose triangles a collapse changed
+    reshaped = set()
+
+    count = before
+    while len(heap) > 0 and (target_count is None or count > target_count):
+        cost, v, u, v_version, u_version = heapq.heappop(heap)
+
+        if v_version != versions[v] or u_version != versions[u]:
+            continue
+        elif max_error is not None and cost > max_error:
+            break
+
+        shared = [t for t in position_triangles[v] if u in triangles[t]]
+        if len(shared) != 2:
+            continue
+
+        # Only the two triangles on the edge may share neighbours, otherwise
+        # we'd fold the surface onto itself.
+        opposite = set()
+        for t in shared:
+            opposite.update(triangles[t])
+        if get_neighbours(v) & get_neighbours(u) != opposite - {u, v}:
+            continue
+
+        # No triangle may flip, or be squashed flat.  We check against the
+        # normals we started with too, or small turns add up to a flip, or
+        # to slivers stood up along a border.
+        flips = False
+        for t in position_triangles[v]:
+            if t in shared:
+                continue
+            points = [positions[p] for p in triangles[t]]
+            old = _get_normal(*points)
+            points[triangles[t].index(v)] = positions[u]
+            new = _get_normal(*points)
+            turn = sum(a * b for (a, b) in zip(normals[t], new))
+            limit = TURN_COSINE * math.sqrt(
+                sum(a * a for a in normals[t]) * sum(b * b for b in new)
+            )
+            if sum(a * b for (a, b) in zip(old, new)) <= 0.0 or turn <= limit:
+                flips = True
+                break
+        if flips:
+            continue
+
+        # The kept corner, from the edge, so we stay on this side of any seam
+        kept = [corners[t][triangles[t].index(u)] for t in shared]
+        if (
+            preserve_seams
+            and vt_index is not None
+            and kept[0][vt_index] != kept[1][vt_index]
+            and shape.get_vertex_values(vt_index, kept[0][vt_index])
+            != shape.get_vertex_values(vt_index, kept[1][vt_index])
+        ):
+            continue
+        corner = kept[0]
+
+        for t in shared:
+            alive[t] = False
+            for p in triangles[t]:
+                position_triangles[p].discard(t)
+            count -= 1
+
+        for t in position_triangles[v]:
+            k = triangles[t].index(v)
+            triangles[t][k] = u
+            corners[t][k] = corner
+            position_triangles[u].add(t)
+        position_triangles[v] = set()
+        locked[v] = True
+
+        quadrics[u] = [a + b for (a, b) in zip(quadrics[v], quadrics[u])]
+
+        changed = get_neighbours(u) | {u}
+        reshaped.update(changed)
+        for p in changed:
+            versions[p] += 1
+        for p in changed:
+            for n in get_neighbours(p):
+                push(p, n)
+                push(n, p)
+
+    # Area weighted, as Shape.compute_normals smooths
+    if vn_index is not None:
+        for p in reshaped:
+            if len(position_normals[p]) != 1:
+                continue
+            # A zero normal was never given, so stays
+            elif position_normals[p] == {(0.0, 0.0, 0.0)}:
+                continue
+
+            normal = [0.0, 0.0, 0.0]
+            for t in position_triangles[p]:
+                face = _get_normal(*[positions[q] for q in triangles[t]])
+                normal = [a + b for (a, b) in zip(normal, face)]
+            length = math.sqrt(sum(a * a for a in normal))
+            if length == 0.0:
+                continue
+
+            index = shape.add_vertex_values(vn_index, [a / length for a in normal])
+            for t in position_triangles[p]:
+                k = triangles[t].index(p)
+                corner = list(corners[t][k])
+                corner[vn_index] = index
+                corners[t][k] = tuple(corner)
+
+    shape.set_indices(
+        i for t in range(len(triangles)) if alive[t] for c in corners[t] for i in c
+    )
+    shape.compact()
+    shape.recompute_bounds()
+
+    return {"before": before, "after": count}
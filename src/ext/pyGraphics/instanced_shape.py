@@ -0,0 +1,187 @@
+"""
+instanced_shape.py
+
+One prototype Shape, drawn many times.  Each instance is a 4x4 affine,
+stored flat (16 values, row major) in one array.  The prototype is only
+copied out per instance when a single Shape is asked for.
+"""
+
+from array import array
+
+from ..pyHelpers.type_validation import type_validation
+from ..pyMultiD.aabb import AABB3f
+from ..pyMultiD.matrix import Matrix, matmul
+from ..pyMultiD.matrix4 import Matrix4, get_translation_matrix4, transform_normals
+from ..pyMultiD.vector import Vector3f
+
+from .shape import Shape
+
+
+class InstancedShape:
+    """
+    parameters
+        Shape
+    """
+
+    __slots__ = ["__prototype", "__transforms"]
+
+    def __init__(self, prototype: Shape):
+        type_validation(prototype, Shape)
+
+        self.__prototype = prototype
+        self.__transforms = array("d")
+
+    def __repr__(self) -> str:
+        """
+        returns
+            string
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            string
+        """
+        return f"{self.get_count()} x {self.__prototype}"
+
+    def add(self, value: "Matrix | Matrix4 | Vector3f"):
+        """
+        parameters
+            Matrix(4x4), Matrix4 or Vector3f
+                a Vector3f is a translation
+        """
+
+        type_validation(value, [Matrix, Matrix4, Vector3f])
+
+        if isinstance(value, Vector3f):
+            value = get_translation_matrix4(*value.get_values_as_list())
+        elif isinstance(value, Matrix) and (
+            value.get_rows_length() != 4 or value.get_columns_length() != 4
+        ):
+            raise ValueError("Transform must be a 4x4 Matrix.")
+
+        self.__transforms.extend(value.get_values_as_list())
+
+    def get_aabb(self) -> AABB3f:
+        """
+        returns
+            AABB3f
+
+        Our prototype's AABB corners, through each transform.
+        """
+
+        if self.get_count() == 0:
+            return AABB3f()
+
+        aabb = self.__prototype.get_aabb()
+        minimum = aabb.Minimum.get_values_as_list()
+        maximum = aabb.Maximum.get_values_as_list()
+
+        new_minimum = [float("inf")] * 3
+        new_maximum = [float("-inf")] * 3
+        for i in range(self.get_count()):
+            m = self.__transforms[i * 16 : (i + 1) * 16]
+            for axis in range(3):
+                low = high = m[axis * 4 + 3]
+                for j in range(3):
+                    a = m[axis * 4 + j] * minimum[j]
+                    b = m[axis * 4 + j] * maximum[j]
+                    low += min(a, b)
+                    high += max(a, b)
+                new_minimum[axis] = min(new_minimum[axis], low)
+                new_maximum[axis] = max(new_maximum[axis], high)
+
+        return AABB3f(Vector3f(*new_minimum), Vector3f(*new_maximum))
+
+    def get_count(self) -> int:
+        """
+        returns
+            int
+        """
+        return len(self.__transforms) // 16
+
+    def get_prototype(self) -> Shape:
+        """
+        returns
+            Shape
+        """
+        return self.__prototype
+
+    def get_shape(self, deduplicate: bool = False) -> Shape:
+        """
+        parameters
+            (optional)
+                bool
+                    merge vertices shared between instances
+        returns
+            Shape
+
+        Expands every instance into one Shape.
+        """
+
+        type_validation(deduplicate, bool)
+
+        order = self.__prototype.get_order()
+        stride = self.__prototype.get_indices_stride()
+        prototype_vertices = [
+            self.__prototype.get_vertex_array(v) for v in range(stride)
+        ]
+        prototype_indices = self.__prototype.get_indices_array()
+        counts = [self.__prototype.get_vertex_count(v) for v in range(stride)]
+
+        # Every instance straight into one set of arrays, so the lookups are
+        # only built once, as the Shape takes them
+        vertices = [array("d") for _ in range(stride)]
+        indices = array("I")
+        for i in range(self.get_count()):
+            # Only the affine part is applied, as with Shape.transform
+            matrix = Matrix4(
+                self.__transforms[i * 16 : i * 16 + 12].tolist() + [0.0, 0.0, 0.0, 1.0]
+            )
+
+            for v in range(stride):
+                values = prototype_vertices[v]
+                if order[v] == "vp":
+                    values = matmul(matrix.get_matrix(), values, True)
+                elif order[v] == "vn":
+                    normals = transform_normals(matrix.get_linear(), values)
+                    if normals is not None:
+                        values = normals
+                vertices[v].extend(values)
+
+            indices.extend(
+                prototype_indices[j] + i * counts[j % stride]
+                for j in range(len(prototype_indices))
+            )
+
+        shape = Shape(self.__prototype.get_type())
+        shape.extend_arrays(vertices, indices, deduplicate)
+        return shape
+
+    def get_transform(self, index: int) -> Matrix:
+        """
+        parameters
+            int
+        returns
+            Matrix(4x4)
+        """
+
+        type_validation(index, int)
+
+        if index < 0 or index >= self.get_count():
+            raise ValueError(f"Index must be within range({self.get_count()}).")
+
+        m = Matrix(4, 4)
+        for i in range(16):
+            m.set_value(i // 4, i % 4, self.__transforms[index * 16 + i])
+        return m
+
+    def get_transforms_array(self) -> array:
+        """
+        returns
+            array[float]
+
+        Flat transforms, 16 values (row major) per instance.
+        """
+        return self.__transforms
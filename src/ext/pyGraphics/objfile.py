@@ -36,6 +36,7 @@ import os
 
 from shutil import copyfile
 
+from ..pyHelpers.files import dump_json_data
 from ..pyHelpers.type_validation import type_validation
 from ..pyMultiD.vector import Vector3f
 
@@ -84,38 +85,19 @@ def objfile(
         if valid_image:
             file.writelines(f"\nmtllib {name}.mtl\n")
 
-        # Positions
-        if "vp" in shape.get_order():
-            vp_index = shape.get_order().index("vp")
-            file.writelines(
-                "\nv "
-                + "\nv ".join(
-                    " ".join(map(str, vp.get_values_as_list()))
-                    for vp in shape.get_vertex_by_index(vp_index)
-                )
-            )
-
-        # Normals
-        if "vn" in shape.get_order():
-            vn_index = shape.get_order().index("vn")
-            file.writelines(
-                "\nvn "
-                + "\nvn ".join(
-                    " ".join(map(str, vn.get_values_as_list()))
-                    for vn in shape.get_vertex_by_index(vn_index)
-                )
-            )
-
-        # TexCoords
-        if "vt" in shape.get_order():
-            vt_index = shape.get_order().index("vt")
-            file.writelines(
-                "\nvt "
-                + "\nvt ".join(
-                    " ".join(map(str, vt.get_values_as_list()))
-                    for vt in shape.get_vertex_by_index(vt_index)
+        # Positions, Normals, TexCoords
+        for prefix, attribute in [("v", "vp"), ("vn", "vn"), ("vt", "vt")]:
+            if attribute in shape.get_order():
+                v = shape.get_order().index(attribute)
+                size = shape.get_vertex_size(v)
+                values = shape.get_vertex_array(v)
+                file.writelines(
+                    f"\n{prefix} "
+                    + f"\n{prefix} ".join(
+                        " ".join(map(str, values[i : i + size]))
+                        for i in range(0, len(values), size)
+                    )
                 )
-            )
 
         # Add Material
         file.writelines("\n\n")
@@ -125,21 +107,23 @@ def objfile(
             file.writelines("usemtl Default")
         file.writelines("\n")
 
-        # Iterate Faces
-        file.writelines(
-            "f "
-            + "\nf ".join(
-                [
-                    " ".join(
-                        [
-                            "/".join([str(i + 1) for i in indice])
-                            for indice in shape.get_indices()[triangle : triangle + 3]
-                        ]
-                    )
-                    for triangle in range(0, len(shape.get_indices()), 3)
-                ]
+        # Iterate Faces, three indices per face
+        stride = shape.get_indices_stride()
+        with shape.get_indices_view() as indices:
+            file.writelines(
+                "f "
+                + "\nf ".join(
+                    [
+                        " ".join(
+                            [
+                                "/".join([str(i + 1) for i in indices[j : j + stride]])
+                                for j in range(triangle, triangle + stride * 3, stride)
+                            ]
+                        )
+                        for triangle in range(0, len(indices), stride * 3)
+                    ]
+                )
             )
-        )
 
         file.writelines(f"\n\n# END OF FILE")
 
@@ -173,3 +157,39 @@ def objfile(
                 f"illum {illum}\n"
                 f"map_Kd {image_name}"
             )
+
+
+def instanced_objfile(
+    instanced_shape,
+    name: str,
+    image_name: str | None = None,
+    image_path: str = "./",
+    path: str = "./",
+):
+    """
+    parameters
+        InstancedShape
+        str
+        (optional)
+        str/None
+        str
+        str
+
+    Obj has no instancing, so we write the prototype once as an obj, and
+    each instance's transform (4x4, row major) to a json beside it.
+    """
+
+    objfile(instanced_shape.get_prototype(), name, image_name, image_path, path)
+
+    transforms = instanced_shape.get_transforms_array()
+    dump_json_data(
+        name,
+        path,
+        {
+            "name": name,
+            "model": f"{name}.obj",
+            "transforms": [
+                transforms[i : i + 16].tolist() for i in range(0, len(transforms), 16)
+            ],
+        },
+    )
@@ -1,10 +1,29 @@
 """
 shape.py
+
+Vertices are stored by attribute (vp/vn/vt), each as one flat array of
+components.  Indices are one flat array, with a stride of the number of
+attributes.  Vectors are only created when asked for through the getters.
 """
 
+import itertools
+import math
+
+from array import array
+from typing import Iterable, Iterator
+
+from ..pyHelpers.math import divide_by_zero
 from ..pyHelpers.type_validation import type_validation
 from ..pyMultiD.aabb import AABB3f
-from ..pyMultiD.vector import Vector, Vector3f
+from ..pyMultiD.matrix import Matrix, matmul
+from ..pyMultiD.matrix4 import (
+    Matrix4,
+    get_rotation_matrix4,
+    get_scale_matrix4,
+    get_translation_matrix4,
+    transform_normals,
+)
+from ..pyMultiD.vector import Vector, Vector2f, Vector3f
 
 from .vertex import (
     Vertex,
@@ -14,15 +33,60 @@ from .vertex import (
 )
 
 
+# Vector type stored by each attribute in get_order
+ATTRIBUTE_TYPES = {"vp": Vector3f, "vn": Vector3f, "vt": Vector2f}
+
+# Number of components stored by each attribute in get_order
+ATTRIBUTE_SIZES = {"vp": 3, "vn": 3, "vt": 2}
+
+
 class Shape:
     """
     parameters
         Vertex
+        (optional)
+            int/None
+                decimal places to round to when looking up existing vertices,
+                None looks up on exact values
+            bool
+                defer transforms until our vertices are next read
+            float/None
+                when adding, reuse any vertex within this distance (per
+                component) instead, None doesn't weld
+
+    Each attribute keeps a lookup of its values to their vertex index, so
+    we don't have to search the whole vertex list when adding.  Welding
+    looks up in a grid of epsilon sized cells instead, checking the cells
+    around ours for anything close enough.
+
+    When deferred, transform (and so rotate/scale/translate/center_on_origin)
+    only composes its matrix with any pending ones.  The composed matrix is
+    applied in a single pass the next time vertices are read or changed.
+    Our AABB is always updated straight away.
+
+    Our AABB only holds our positions, it is empty until we have one.
     """
 
-    __slots__ = ["__aabb", "__indices", "__type", "__vertices"]
-
-    def __init__(self, type: Vertex):
+    __slots__ = [
+        "__aabb",
+        "__bounding_sphere",
+        "__deferred",
+        "__epsilon",
+        "__indices",
+        "__lookups",
+        "__pending_transform",
+        "__precision",
+        "__type",
+        "__vertices",
+    ]
+
+    def __init__(
+        self,
+        type: Vertex,
+        precision: int | None = None,
+        deferred: bool = False,
+        epsilon: float | None = None,
+    ):
         allowed_types = (
             VertexPosition,
             VertexPositionNormal,
@@ -31,11 +95,25 @@ class Shape:
 
         if type not in allowed_types:
             raise ValueError(f"{type} must be of {allowed_types}")
-
-        self.__aabb = AABB3f()
-        self.__indices = []
+        elif precision is not None and not isinstance(precision, int):
+            raise ValueError("Precision must be an int or None.")
+        elif epsilon is not None and (not isinstance(epsilon, float) or epsilon <= 0):
+            raise ValueError("Epsilon must be a float > 0.0 or None.")
+        elif precision is not None and epsilon is not None:
+            raise ValueError("Use either Precision or Epsilon, not both.")
+
+        type_validation(deferred, bool)
+
+        self.__aabb = None
+        self.__bounding_sphere = None
+        self.__deferred = deferred
+        self.__epsilon = epsilon
+        self.__indices = array("I")
+        self.__pending_transform = None
+        self.__precision = precision
         self.__type = type
-        self.__vertices = [[] for _ in self.get_order()]
+        self.__vertices = [array("d") for _ in self.get_order()]
+        self.__lookups = [{} for _ in self.get_order()]
 
     def __repr__(self) -> str:
         """
@@ -59,38 +137,86 @@ class Shape:
 
         # Value is a Shape
         if isinstance(value, Shape):
-            for i in value.get_indices():
-                self.add(self.__type(*value.get_indice_value_by_indice(i)))
+            self.extend(value, deduplicate=True)
 
         # Value is a Vertex of Type we want (can't use isinstance, that factors in inheritance)
         elif type(value) == self.__type:
-            # Return a List of Vectors
-            vars = value.get()
+            self.__add_values([v.get_values_as_list() for v in value.get()])
+
+    def __add_values(self, values: list[list[float]]):
+        """
+        parameters
+            list[list[float]]
 
-            # We have a position?  If so, update our AABB
-            if "vp" in self.get_order():
-                # Position Index
-                vp_index = self.get_order().index("vp")
+        Values are in the order of get_order.  Finds indices of existing
+        values, or adds new, then adds the indices.
+        """
 
-                # Expand AABB
-                self.__aabb.expand(vars[vp_index])
+        self.apply_transforms()
 
-            # Indices of each vertices
-            indices = []
+        # We have a position?  If so, update our AABB
+        if "vp" in self.get_order():
+            self.__expand_bounds(values[self.get_order().index("vp")])
 
-            # Iterate, finding indices, or adding new.
-            for i in range(len(vars)):
-                # Not yet in?
-                if vars[i] not in self.__vertices[i]:
-                    indices.append(len(self.__vertices[i]))
-                    self.__vertices[i].append(vars[i])
+        # Iterate, finding indices, or adding new.
+        for i in range(len(values)):
+            self.__indices.append(self.__find_or_add_vertex(i, values[i]))
 
-                # Already in
-                else:
-                    indices.append(self.__vertices[i].index(vars[i]))
+    def add_vertex_values(self, v: int, values: list[float]) -> int:
+        """
+        parameters
+            int
+                index into get_order
+            list[float]
+        returns
+            int
 
-            # Add indices
-            self.__indices.append(indices)
+        Index of the vertex matching the values, adding it if we have none.
+        No indices are added, use set_indices to point at it.
+        """
+
+        type_validation(v, int)
+
+        if v < 0 or v >= self.get_indices_stride():
+            raise ValueError(f"V must be within range({self.get_indices_stride()}).")
+        elif len(values) != self.get_vertex_size(v):
+            raise ValueError(f"Expected {self.get_vertex_size(v)} Values.")
+
+        self.apply_transforms()
+
+        if self.get_order()[v] == "vp":
+            self.__expand_bounds(values)
+
+        return self.__find_or_add_vertex(v, [float(i) for i in values])
+
+    def __add_to_lookup(self, v: int, values: list[float], index: int):
+        """
+        parameters
+            int
+            list[float]
+            int
+
+        Exact lookups keep the first vertex with a key, matching
+        list.index.  Epsilon lookups keep every vertex in the cell.
+        """
+        key = self.__get_lookup_key(values)
+
+        if self.__epsilon is None:
+            self.__lookups[v].setdefault(key, index)
+        else:
+            self.__lookups[v].setdefault(key, []).append(index)
+
+    def apply_transforms(self):
+        """
+        Applies any deferred transforms to our vertices.
+        """
+
+        if self.__pending_transform is None:
+            return
+
+        matrix = self.__pending_transform
+        self.__pending_transform = None
+        self.__transform_vertices(matrix)
 
     def center_on_origin(self):
         """
@@ -98,36 +224,36 @@ class Shape:
         Positions to origin
         """
 
-        # Do we have the Position element?
-        if "vp" not in self.get_order():
+        # Do we have the Position element, and any positions?
+        if "vp" not in self.get_order() or self.__aabb is None:
             return
 
-        # Index of our Vertex Position
-        vp_index = self.get_order().index("vp")
-
         # Current AABB Center
         aabb_center = self.__aabb.get_center()
 
-        # Iterate Vertices, adjusting positions
-        for vp in self.__vertices[vp_index]:
-            vp.translate(aabb_center * -1.0)
-
-        # Adjust AABB
-        self.__aabb.Maximum -= aabb_center
-        self.__aabb.Minimum -= aabb_center
+        # Adjust positions, this moves our AABB and rebuilds our lookup too
+        self.translate(aabb_center * -1.0)
 
-    def cull_vertices(self):
+    def cull_vertices(self, match_winding: bool = False):
         """
+        parameters
+            (optional)
+                bool
+                    only match triangles wound the same way
+
         So.  Culling is in threes.  We are looking for Triangles we already
         have.  If we have two triangles in the same spot, we shouldn't need
         either.
 
-        We iterate Indices, checking positions in threes for other samesies.
-        If we find another pair, we need to clear both sets of Indices (including Normals, Textures)
+        Each triangle is keyed on its position indices, sorted, or rotated to
+        start at the lowest index when matching winding.  Any key we see more
+        than once has all of its triangles removed (including Normals, Textures)
 
         Check box faces section for orienting triangles
         """
 
+        type_validation(match_winding, bool)
+
         # For starts, we need a multiple of three indices.
         if not self.is_valid():
             return
@@ -139,48 +265,138 @@ class Shape:
         # Index of our Vertex Position
         vp_index = self.get_order().index("vp")
 
-        # Indices we need to delete
-        indices_to_delete = []
+        # Position indices, one per indice
+        stride = self.get_indices_stride()
+        positions = self.__indices[vp_index::stride]
 
-        # Iterate Triangles
-        for i in range(0, len(self.__indices), 3):
-            # Indice Indexes we are looking at
-            indice_indexes = [i + j for j in range(3)]
+        # Key of each Triangle, and how many times we've seen it
+        keys = []
+        counts = {}
+        for i in range(0, len(positions), 3):
+            triangle = positions[i : i + 3].tolist()
 
-            # Triangle we are using for comparison
-            triangle = [
-                self.__indices[indice_index][vp_index]
-                for indice_index in indice_indexes
-            ]
+            if match_winding:
+                first = triangle.index(min(triangle))
+                key = tuple(triangle[first:] + triangle[:first])
+            else:
+                key = tuple(sorted(triangle))
 
-            # Second iteration, we will find ourself.  That is okay.
-            for k in range(0, len(self.__indices), 3):
-                # Indices to compare against
-                indice_indexes_to_compare = [k + j for j in range(3)]
+            keys.append(key)
+            counts[key] = counts.get(key, 0) + 1
 
-                # Triangle to compare against
-                triangle_to_compare = [
-                    self.__indices[indice_index][vp_index]
-                    for indice_index in indice_indexes_to_compare
-                ]
+        # Every indice of the Triangles we saw more than once
+        self.delete_indices(
+            i * 3 + j for i in range(len(keys)) if counts[keys[i]] > 1 for j in range(3)
+        )
+
+    def compact(self):
+        """
+        Drops every vertex no indice points at, remapping the indices
+        to match, in one pass per attribute.
+        """
+        self.apply_transforms()
+
+        stride = self.get_indices_stride()
+
+        for v in range(stride):
+            used = sorted(set(self.__indices[v::stride]))
 
-                # We equal!
-                if triangle == triangle_to_compare:
-                    for indice_index in indice_indexes_to_compare:
-                        if indice_index not in indice_indexes:
-                            indice_indexes.append(indice_index)
+            # Nothing unused?
+            if len(used) == self.get_vertex_count(v):
+                continue
 
-            # Okay.  If we have more than three indexes, that means we found
-            # duplicate triangles.
-            if len(indice_indexes) > 3:
-                for indice_index in indice_indexes:
-                    if indice_index not in indices_to_delete:
-                        indices_to_delete.append(indice_index)
+            self.__remap_vertices(v, used)
 
-        # Now, we delete.
-        indices_to_delete.sort(reverse=True)
-        for indice in indices_to_delete:
-            self.delete_indice_at_index(indice)
+        self.__bounding_sphere = None
+
+    def compute_normals(
+        self, mode: str = "smooth", angle_threshold: float | None = None
+    ):
+        """
+        parameters
+            (optional)
+                str
+                    "flat", each triangle's own normal, or "smooth", the
+                    area weighted normals of every triangle on the position
+                float/None
+                    smooth only, degrees, triangles turned further than this
+                    from ours aren't smoothed with, None smooths with all
+
+        Replaces our normals.  Face normals are found in one pass over our
+        indices, then summed per position (by index) and normalized.
+        """
+
+        if mode not in ["flat", "smooth"]:
+            raise ValueError('Mode must be "flat" or "smooth".')
+        elif angle_threshold is not None and (
+            not isinstance(angle_threshold, float) or angle_threshold < 0
+        ):
+            raise ValueError("Angle Threshold must be a float >= 0.0 or None.")
+        elif "vp" not in self.get_order() or "vn" not in self.get_order():
+            raise ValueError("Shape must have Positions and Normals.")
+        elif not self.is_valid():
+            raise ValueError("Indices must be made of triangles.")
+
+        self.apply_transforms()
+
+        stride = self.get_indices_stride()
+        vp_index = self.get_order().index("vp")
+        vn_index = self.get_order().index("vn")
+        vp = self.__vertices[vp_index]
+
+        # Position of each corner, three per triangle
+        corners = [i * 3 for i in self.__indices[vp_index::stride]]
+
+        # Face normals, U X V, their length is twice the triangle's area
+        faces = []
+        for t in range(0, len(corners), 3):
+            a, b, c = corners[t : t + 3]
+            ux, uy, uz = vp[b] - vp[a], vp[b + 1] - vp[a + 1], vp[b + 2] - vp[a + 2]
+            vx, vy, vz = vp[c] - vp[a], vp[c + 1] - vp[a + 1], vp[c + 2] - vp[a + 2]
+            faces.append((uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx))
+
+        if mode == "flat":
+            normals = [faces[i // 3] for i in range(len(corners))]
+
+        elif angle_threshold is None:
+            sums = {}
+            for i in range(len(corners)):
+                x, y, z = sums.get(corners[i], (0.0, 0.0, 0.0))
+                fx, fy, fz = faces[i // 3]
+                sums[corners[i]] = (x + fx, y + fy, z + fz)
+            normals = [sums[p] for p in corners]
+
+        else:
+            # Compare unit normals, the sums stay area weighted
+            units = []
+            for x, y, z in faces:
+                magnitude = math.sqrt(x * x + y * y + z * z)
+                units.append(tuple(divide_by_zero(i, magnitude) for i in (x, y, z)))
+            threshold = math.cos(math.radians(angle_threshold))
+
+            triangles = {}
+            for i in range(len(corners)):
+                triangles.setdefault(corners[i], []).append(i // 3)
+
+            normals = []
+            for i in range(len(corners)):
+                unit = units[i // 3]
+                x = y = z = 0.0
+                for t in triangles[corners[i]]:
+                    dot = sum(a * b for (a, b) in zip(unit, units[t]))
+                    if t == i // 3 or dot >= threshold:
+                        x, y, z = x + faces[t][0], y + faces[t][1], z + faces[t][2]
+                normals.append((x, y, z))
+
+        # Our old normals are all replaced, so start them again
+        self.__vertices[vn_index] = array("d")
+        self.__lookups[vn_index] = {}
+
+        for i in range(len(normals)):
+            magnitude = math.sqrt(sum(j * j for j in normals[i]))
+            self.__indices[i * stride + vn_index] = self.__find_or_add_vertex(
+                vn_index, [divide_by_zero(j, magnitude) for j in normals[i]]
+            )
 
     def delete_indice_at_index(self, index: int):
         """
@@ -193,57 +409,334 @@ class Shape:
 
         type_validation(index, int)
 
-        if index < 0 or index >= len(self.__indices):
+        self.delete_indices([index])
+
+    def delete_indices(self, indexes: Iterable[int]):
+        """
+        parameters
+            Iterable[int]
+
+        Removes every indice at the given indexes, then compacts so
+        vertices no longer used are removed too.  Indexes out of range
+        are ignored.
+        """
+
+        doomed = set(indexes)
+
+        type_validation(list(doomed), int)
+
+        doomed = {i for i in doomed if i >= 0 and i < self.get_indices_count()}
+        if len(doomed) == 0:
+            return
+
+        # Keep the indices we aren't deleting
+        stride = self.get_indices_stride()
+        indices = array("I")
+        for i in range(self.get_indices_count()):
+            if i not in doomed:
+                indices.extend(self.__indices[i * stride : (i + 1) * stride])
+        self.__indices = indices
+
+        # Now, drop what no longer has an indice.
+        self.compact()
+
+    def __expand_bounds(self, positions: list[float]):
+        """
+        parameters
+            list[float]
+                x, y, z for each position
+
+        One min/max per axis over the whole batch.
+        """
+
+        if len(positions) == 0:
+            return
+
+        self.__bounding_sphere = None
+
+        minimum = [min(positions[axis::3]) for axis in range(3)]
+        maximum = [max(positions[axis::3]) for axis in range(3)]
+
+        # First positions?
+        if self.__aabb is None:
+            self.__aabb = AABB3f(Vector3f(*minimum), Vector3f(*maximum))
             return
 
-        # These match up with Vertices
-        for i in range(len(self.__indices[index])):
-            # Index of the vertice
-            vertice_index = self.__indices[index][i]
-
-            # Does this same indice exist in indices at the same spot?
-            occurences = 0
-            for j in range(len(self.__indices)):
-                if vertice_index == self.__indices[j][i]:
-                    occurences += 1
-                    # We only care if we have more than one occurence
-                    if occurences > 1:
-                        break
-
-            # Yeap
-            if occurences == 1:
-                # Delete the Vertice
-                del self.__vertices[i][vertice_index]
-
-                # Now we iterate our indices
-                for j in range(len(self.__indices)):
-                    if self.__indices[j][i] > vertice_index:
-                        self.__indices[j][i] -= 1
-
-        # Delete the indice
-        del self.__indices[index]
+        aabb_minimum = self.__aabb.Minimum
+        aabb_maximum = self.__aabb.Maximum
+        aabb_minimum.X = min(aabb_minimum.X, minimum[0])
+        aabb_minimum.Y = min(aabb_minimum.Y, minimum[1])
+        aabb_minimum.Z = min(aabb_minimum.Z, minimum[2])
+        aabb_maximum.X = max(aabb_maximum.X, maximum[0])
+        aabb_maximum.Y = max(aabb_maximum.Y, maximum[1])
+        aabb_maximum.Z = max(aabb_maximum.Z, maximum[2])
+
+    def extend(self, shape: "Shape", deduplicate: bool = False):
+        """
+        parameters
+            Shape
+            (optional)
+                bool
+                    look up each of their vertices in ours, instead of
+                    appending them all
+
+        Appends another Shape's vertices and indices in bulk.  Their
+        indices are offset (or remapped when deduplicating) to point at
+        where their vertices end up in us.
+        """
+
+        type_validation([shape, deduplicate], [Shape, bool])
+
+        if shape.get_order() != self.get_order():
+            raise ValueError(f"Shape must have the order {self.get_order()}")
+
+        self.__extend_arrays(
+            [shape.get_vertex_array(v) for v in range(self.get_indices_stride())],
+            shape.get_indices_array(),
+            deduplicate,
+        )
+
+        # Their AABB already holds their positions
+        if "vp" in self.get_order() and shape.get_indices_count() > 0:
+            aabb = shape.get_aabb()
+            self.__expand_bounds(
+                aabb.Minimum.get_values_as_list() + aabb.Maximum.get_values_as_list()
+            )
+
+    def extend_arrays(
+        self,
+        vertex_arrays: list[Iterable[float]],
+        indices: Iterable[int],
+        deduplicate: bool = False,
+    ):
+        """
+        parameters
+            list[Iterable[float]]
+                flat components of each attribute, in get_order
+            Iterable[int]
+                flat, get_indices_stride values per indice, pointing into
+                the given vertices
+            (optional)
+                bool
+                    look up each given vertex in ours, instead of appending
+                    them all
+
+        As extend, from arrays rather than a Shape, so whole batches can be
+        built without a Shape (and its lookups) each.
+        """
+
+        type_validation(deduplicate, bool)
+
+        stride = self.get_indices_stride()
+        if len(vertex_arrays) != stride:
+            raise ValueError(f"Expected {stride} Vertex Arrays.")
+
+        vertex_arrays = [array("d", values) for values in vertex_arrays]
+        indices = array("I", indices)
+
+        if len(indices) % stride != 0:
+            raise ValueError(f"Indices Length must be a multiple of {stride}.")
+
+        for v in range(stride):
+            size = self.get_vertex_size(v)
+            if len(vertex_arrays[v]) % size != 0:
+                raise ValueError(
+                    f"{self.get_order()[v]} Length must be a multiple of {size}."
+                )
+            count = len(vertex_arrays[v]) // size
+            if any(i >= count for i in indices[v::stride]):
+                raise ValueError(f"{self.get_order()[v]} Indices must be < {count}.")
+
+        self.__extend_arrays(vertex_arrays, indices, deduplicate)
+
+        # Only the positions our indices use
+        if "vp" in self.get_order() and len(indices) > 0:
+            vp_index = self.get_order().index("vp")
+            positions = vertex_arrays[vp_index]
+            self.__expand_bounds(
+                [
+                    j
+                    for i in set(indices[vp_index::stride])
+                    for j in positions[i * 3 : i * 3 + 3]
+                ]
+            )
+
+    def __extend_arrays(
+        self, vertex_arrays: list[array], indices: array, deduplicate: bool
+    ):
+        """
+        parameters
+            list[array[float]]
+            array[int]
+            bool
+
+        extend and extend_arrays, once validated.  Each lookup is added to
+        once, for the whole batch.  Bounds are left to the caller.
+        """
+
+        self.apply_transforms()
+
+        stride = self.get_indices_stride()
+        new_indices = array("I", [0]) * len(indices)
+
+        for v in range(stride):
+            # Where each of their vertices ends up in us
+            size = self.get_vertex_size(v)
+            if deduplicate:
+                values = vertex_arrays[v]
+                remap = [
+                    self.__find_or_add_vertex(v, values[i : i + size].tolist())
+                    for i in range(0, len(values), size)
+                ]
+            else:
+                offset = self.get_vertex_count(v)
+                self.__vertices[v].extend(vertex_arrays[v])
+                self.__rebuild_lookup(v, offset)
+                remap = range(offset, self.get_vertex_count(v))
+
+            new_indices[v::stride] = array("I", [remap[i] for i in indices[v::stride]])
+
+        self.__indices.extend(new_indices)
+
+    def __find_or_add_vertex(self, v: int, values: list[float]) -> int:
+        """
+        parameters
+            int
+            list[float]
+        returns
+            int
+
+        Index of the vertex matching the values, adding it if we have none.
+        """
+        index = self.__find_vertex(v, values)
+
+        # Not yet in?
+        if index == -1:
+            index = self.get_vertex_count(v)
+            self.__vertices[v].extend(values)
+            self.__add_to_lookup(v, values, index)
+
+        return index
+
+    def __find_vertex(self, v: int, values: list[float]) -> int:
+        """
+        parameters
+            int
+            list[float]
+        returns
+            int
+                -1 if not found
+        """
+        key = self.__get_lookup_key(values)
+
+        if self.__epsilon is None:
+            return self.__lookups[v].get(key, -1)
+
+        for cell in itertools.product(*[(k - 1, k, k + 1) for k in key]):
+            for i in self.__lookups[v].get(cell, []):
+                if self.__is_within_epsilon(values, self.get_vertex_values(v, i)):
+                    return i
+
+        return -1
 
     def get(self) -> list[list[Vector]]:
         """
         returns
             list[list[Vector]]
         """
-        return [self.get_indice_value_by_index(i) for i in range(len(self.__indices))]
+        types = [ATTRIBUTE_TYPES[o] for o in self.get_order()]
+        return [
+            [t(*values) for (t, values) in zip(types, vertex)]
+            for vertex in self.iter_vertices()
+        ]
 
     def get_aabb(self) -> AABB3f:
         """
         returns
             AABB
+
+        Without positions, this is an AABB at the origin.
         """
+        if self.__aabb is None:
+            return AABB3f()
+
         return self.__aabb
 
+    def get_bounding_sphere(self) -> tuple[Vector3f, float]:
+        """
+        returns
+            tuple(Vector3f, float)
+                center, radius
+
+        Centered on our AABB, reaching our furthest position.  Cached
+        until our positions change.
+        """
+
+        if "vp" not in self.get_order() or self.__aabb is None:
+            return (Vector3f(), 0.0)
+
+        if self.__bounding_sphere is None:
+            center = self.__aabb.get_center().get_values_as_list()
+
+            vp = self.get_vertex_array(self.get_order().index("vp"))
+            radius_squared = max(
+                (x - center[0]) ** 2 + (y - center[1]) ** 2 + (z - center[2]) ** 2
+                for x, y, z in zip(vp[0::3], vp[1::3], vp[2::3])
+            )
+
+            self.__bounding_sphere = (center, math.sqrt(radius_squared))
+
+        center, radius = self.__bounding_sphere
+        return (Vector3f(*center), radius)
+
     def get_indices(self) -> list[list[int]]:
         """
         returns
             list[List[int]]
+
+        A copy, built from our indices array.
+        """
+        stride = self.get_indices_stride()
+        return [
+            self.__indices[i : i + stride].tolist()
+            for i in range(0, len(self.__indices), stride)
+        ]
+
+    def get_indices_array(self) -> array:
+        """
+        returns
+            array[int]
+
+        Flat, unsigned indices, get_indices_stride values per indice.
         """
         return self.__indices
 
+    def get_indices_count(self) -> int:
+        """
+        returns
+            int
+        """
+        return len(self.__indices) // self.get_indices_stride()
+
+    def get_indices_stride(self) -> int:
+        """
+        returns
+            int
+
+        Values per indice in our indices array, one per attribute.
+        """
+        return len(self.get_order())
+
+    def get_indices_view(self) -> memoryview:
+        """
+        returns
+            memoryview[int]
+
+        Our indices array without copying, read only.  Release it before
+        adding to the Shape, an array can't grow while it is viewed.
+        """
+        return memoryview(self.__indices).toreadonly()
+
     def get_indice_value_by_index(self, index: int) -> list[Vector]:
         """
         parameters
@@ -254,8 +747,11 @@ class Shape:
 
         type_validation(index, int)
 
-        if index < len(self.__indices) and index >= 0:
-            return self.get_indice_value_by_indice(self.__indices[index])
+        if index < self.get_indices_count() and index >= 0:
+            stride = self.get_indices_stride()
+            return self.get_indice_value_by_indice(
+                self.__indices[index * stride : (index + 1) * stride].tolist()
+            )
 
         return []
 
@@ -279,13 +775,6 @@ class Shape:
             self.get_vertex_by_indices_index(v, indice[v]) for v in range(len(indice))
         ]
 
-    def get_indices(self) -> list[list[int]]:
-        """
-        return
-            list[list[int]]
-        """
-        return self.__indices
-
     def get_order(self) -> list[str]:
         """
         return
@@ -307,18 +796,64 @@ class Shape:
 
         return []
 
+    def __get_lookup_key(self, values: list[float]) -> tuple[float]:
+        """
+        parameters
+            list[float]
+        returns
+            tuple[float]
+        """
+        if self.__epsilon is not None:
+            return tuple(math.floor(v / self.__epsilon) for v in values)
+        elif self.__precision is not None:
+            return tuple(round(v, self.__precision) for v in values)
+
+        return tuple(values)
+
+    def get_type(self) -> type:
+        """
+        returns
+            Vertex type
+        """
+        return self.__type
+
+    def get_vertex_array(self, v: int) -> array:
+        """
+        parameters
+            int
+        returns
+            array[float]
+
+        Flat components of the given attribute, get_vertex_size
+        values per vertex.
+        """
+
+        type_validation(v, int)
+
+        self.apply_transforms()
+
+        if v >= 0 and v < len(self.__vertices):
+            return self.__vertices[v]
+
+        return array("d")
+
     def get_vertex_by_index(self, v: int) -> list[Vector]:
         """
         parameters
             int
         returns
             list[Vector]
+
+        Vectors are copies, changing them doesn't change us.
         """
 
         type_validation(v, int)
 
         if v >= 0 and v < len(self.__vertices):
-            return self.__vertices[v]
+            return [
+                self.get_vertex_by_indices_index(v, i)
+                for i in range(self.get_vertex_count(v))
+            ]
 
         return []
 
@@ -334,17 +869,75 @@ class Shape:
         # We won't validate v, since we call another method that handles this
         type_validation(i, int)
 
-        if i >= 0 and i < len(self.__vertices[v]):
-            return self.get_vertex_by_index(v)[i]
+        if i >= 0 and i < self.get_vertex_count(v):
+            return ATTRIBUTE_TYPES[self.get_order()[v]](*self.get_vertex_values(v, i))
 
         return []
 
+    def get_vertex_count(self, v: int) -> int:
+        """
+        parameters
+            int
+        returns
+            int
+        """
+        return len(self.__vertices[v]) // self.get_vertex_size(v)
+
+    def get_vertex_size(self, v: int) -> int:
+        """
+        parameters
+            int
+        returns
+            int
+        """
+        return ATTRIBUTE_SIZES[self.get_order()[v]]
+
+    def get_vertex_values(self, v: int, i: int) -> list[float]:
+        """
+        parameters
+            int
+            int
+        returns
+            list[float]
+
+        No validation, used when walking our arrays.
+        """
+        self.apply_transforms()
+
+        size = self.get_vertex_size(v)
+        return self.__vertices[v][i * size : (i + 1) * size].tolist()
+
     def get_vertices(self) -> list[list[Vector]]:
         """
         return
             list[list[Vector]]
         """
-        return self.__vertices
+        return [self.get_vertex_by_index(v) for v in range(len(self.__vertices))]
+
+    def is_deferred(self) -> bool:
+        """
+        returns
+            bool
+        """
+        return self.__deferred
+
+    def __is_within_epsilon(
+        self, values: list[float], others: list[float], epsilon: float | None = None
+    ) -> bool:
+        """
+        parameters
+            list[float]
+            list[float]
+            (optional)
+                float/None
+                    our epsilon if None
+        returns
+            bool
+        """
+        if epsilon is None:
+            epsilon = self.__epsilon
+
+        return all(abs(a - b) <= epsilon for (a, b) in zip(values, others))
 
     def is_valid(self) -> bool:
         """
@@ -352,7 +945,132 @@ class Shape:
             bool
         """
 
-        return len(self.__indices) > 0 and len(self.__indices) % 3 == 0
+        return self.get_indices_count() > 0 and self.get_indices_count() % 3 == 0
+
+    def iter_triangles(self) -> Iterator[tuple[tuple[tuple[float, ...], ...], ...]]:
+        """
+        returns
+            Iterator[tuple(vertex, vertex, vertex)]
+                each vertex as from iter_vertices
+
+        Streams our triangles straight from our arrays.  A trailing
+        partial triangle is skipped.
+        """
+        vertices = self.iter_vertices()
+        return zip(vertices, vertices, vertices)
+
+    def iter_vertices(self) -> Iterator[tuple[tuple[float, ...], ...]]:
+        """
+        returns
+            Iterator[tuple[tuple[float, ...], ...]]
+                per indice, the values of each attribute, in get_order
+
+        Streams straight from our arrays, no validation and no Vectors.
+        Don't change the Shape while iterating.
+        """
+        self.apply_transforms()
+
+        stride = self.get_indices_stride()
+        sizes = [self.get_vertex_size(v) for v in range(stride)]
+        vertices = self.__vertices
+        indices = self.__indices
+
+        for i in range(0, len(indices), stride):
+            yield tuple(
+                tuple(values[j * size : (j + 1) * size])
+                for (values, size, j) in zip(vertices, sizes, indices[i : i + stride])
+            )
+
+    def optimize_vertex_fetch(self):
+        """
+        Reorders each attribute's vertices into the order our indices first
+        use them, so reading through the indices walks our arrays forward.
+        """
+        self.apply_transforms()
+
+        stride = self.get_indices_stride()
+
+        for v in range(stride):
+            # Vertices in the order they are first used
+            self.__remap_vertices(v, list(dict.fromkeys(self.__indices[v::stride])))
+
+    def recompute_bounds(self):
+        """
+        Rebuilds our AABB from our positions, one pass per axis.  Use after
+        bulk edits (culling, deleting, rotating) leave it larger than needed.
+        """
+
+        if "vp" not in self.get_order():
+            return
+
+        self.__aabb = None
+        self.__expand_bounds(self.get_vertex_array(self.get_order().index("vp")))
+
+    def __rebuild_lookup(self, v: int, start: int = 0):
+        """
+        parameters
+            int
+            (optional)
+                int
+                    first vertex to add, earlier vertices are kept
+
+        Our lookup keys are the values of the vertices, so whenever they
+        change in place (translate, delete) we rebuild.
+        """
+        if start == 0:
+            self.__lookups[v] = {}
+
+        for i in range(start, self.get_vertex_count(v)):
+            self.__add_to_lookup(v, self.get_vertex_values(v, i), i)
+
+    def __remap_vertices(self, v: int, used: list[int]):
+        """
+        parameters
+            int
+            list[int]
+                old vertex indexes, in their new order
+
+        Keeps only the used vertices of the attribute, in the given order,
+        remapping our indices to match.
+        """
+        size = self.get_vertex_size(v)
+        stride = self.get_indices_stride()
+
+        # Old index to new index
+        remap = {old: new for new, old in enumerate(used)}
+
+        vertices = array("d")
+        for old in used:
+            vertices.extend(self.__vertices[v][old * size : (old + 1) * size])
+        self.__vertices[v] = vertices
+
+        self.__indices[v::stride] = array(
+            "I", [remap[i] for i in self.__indices[v::stride]]
+        )
+
+        self.__rebuild_lookup(v)
+
+    def reorder_triangles(self, order: list[int]):
+        """
+        parameters
+            list[int]
+                every triangle index, in the order they should be
+        """
+
+        if not isinstance(order, list):
+            raise ValueError("Order must be a list of ints.")
+        elif not self.is_valid():
+            raise ValueError("Indices must be made of triangles.")
+        elif sorted(order) != list(range(self.get_indices_count() // 3)):
+            raise ValueError("Order must hold every triangle index once.")
+
+        triangle_stride = self.get_indices_stride() * 3
+        indices = array("I")
+        for t in order:
+            indices.extend(
+                self.__indices[t * triangle_stride : (t + 1) * triangle_stride]
+            )
+        self.__indices = indices
 
     def rotate(self, roll: float, pitch: float, yaw: float) -> "Shape":
         """
@@ -369,14 +1087,7 @@ class Shape:
 
         type_validation([roll, pitch, yaw], float)
 
-        # Do we have the Position element?
-        if "vp" not in self.get_order():
-            return self
-
-        vp_index = self.get_order().index("vp")
-
-        for v in self.__vertices[vp_index]:
-            v.rotate(roll, pitch, yaw)
+        return self.transform(get_rotation_matrix4(roll, pitch, yaw))
 
     def scale(self, scale: float) -> "Shape":
         """
@@ -388,14 +1099,138 @@ class Shape:
 
         type_validation(scale, float)
 
+        return self.transform(get_scale_matrix4(scale, scale, scale))
+
+    def set_deferred(self, deferred: bool):
+        """
+        parameters
+            bool
+
+        Turning deferring off applies anything pending.
+        """
+
+        type_validation(deferred, bool)
+
+        self.__deferred = deferred
+
+        if not deferred:
+            self.apply_transforms()
+
+    def set_indices(self, indices: Iterable[int]):
+        """
+        parameters
+            Iterable[int]
+                flat, get_indices_stride values per indice
+
+        Replaces our indices, keeping our vertices.  Compact after to drop
+        the ones no longer used, and recompute_bounds to shrink our AABB.
+        """
+
+        indices = array("I", indices)
+        stride = self.get_indices_stride()
+
+        if len(indices) % stride != 0:
+            raise ValueError(f"Indices Length must be a multiple of {stride}.")
+
+        for v in range(stride):
+            count = self.get_vertex_count(v)
+            if any(i >= count for i in indices[v::stride]):
+                raise ValueError(f"{self.get_order()[v]} Indices must be < {count}.")
+
+        self.__indices = indices
+        self.__bounding_sphere = None
+
+    def transform(self, matrix: "Matrix | Matrix4") -> "Shape":
+        """
+        parameters
+            Matrix(4x4), Matrix4
+        returns
+            Shape
+
+        Applies an affine to every position in one pass, or saves it for
+        later when deferred.  Normals get the inverse transpose of its top
+        left 3x3, then are normalized.  Our AABB is transformed from its
+        corners, rather than from every position.
+        """
+
+        type_validation(matrix, [Matrix, Matrix4])
+
+        if isinstance(matrix, Matrix):
+            if matrix.get_rows_length() != 4 or matrix.get_columns_length() != 4:
+                raise ValueError("Transform must be a 4x4 Matrix.")
+
+            # A Matrix's last row was never applied, only its affine part is
+            matrix = Matrix4(matrix.get_values_as_list()[0:12] + [0.0, 0.0, 0.0, 1.0])
+
         # Do we have the Position element?
         if "vp" not in self.get_order():
             return self
 
+        m = matrix.get_values_as_list()
+
+        # Deferred?  Compose with what's pending, applying ours last.
+        if self.__deferred:
+            pending = self.__pending_transform
+            if pending is None:
+                pending = Matrix4()
+            self.__pending_transform = matrix * pending
+        else:
+            self.apply_transforms()
+            self.__transform_vertices(matrix)
+
+        # Our positions are moving
+        self.__bounding_sphere = None
+
+        # AABB, each axis takes the smaller/larger of each corner value
+        if self.__aabb is not None:
+            minimum = self.__aabb.Minimum.get_values_as_list()
+            maximum = self.__aabb.Maximum.get_values_as_list()
+            new_minimum = []
+            new_maximum = []
+            for axis in range(3):
+                low = high = m[axis * 4 + 3]
+                for j in range(3):
+                    a = m[axis * 4 + j] * minimum[j]
+                    b = m[axis * 4 + j] * maximum[j]
+                    low += min(a, b)
+                    high += max(a, b)
+                new_minimum.append(float(low))
+                new_maximum.append(float(high))
+            self.__aabb = AABB3f(Vector3f(*new_minimum), Vector3f(*new_maximum))
+
+        return self
+
+    def __transform_vertices(self, matrix: Matrix4):
+        """
+        parameters
+            Matrix4
+
+        Positions get the whole affine.  Only the top left 3x3 matters to
+        normals, translations leave them alone so we skip those entirely.
+        Each goes through matmul as one block.
+        """
+
+        # Positions
         vp_index = self.get_order().index("vp")
+        self.__vertices[vp_index] = matmul(
+            matrix.get_matrix(), self.__vertices[vp_index], True
+        )
+
+        self.__rebuild_lookup(vp_index)
 
-        for v in self.__vertices[vp_index]:
-            v.scale(scale)
+        # Normals
+        if "vn" not in self.get_order():
+            return
+
+        vn_index = self.get_order().index("vn")
+        normals = transform_normals(matrix.get_linear(), self.__vertices[vn_index])
+
+        # Identity, or flattened?  Nothing to do.
+        if normals is None:
+            return
+
+        self.__vertices[vn_index] = normals
+        self.__rebuild_lookup(vn_index)
 
     def translate(self, translation: Vector3f) -> "Shape":
         """
@@ -407,11 +1242,64 @@ class Shape:
 
         type_validation(translation, Vector3f)
 
-        # Do we have the Position element?
-        if "vp" not in self.get_order():
-            return self
+        return self.transform(
+            get_translation_matrix4(*translation.get_values_as_list())
+        )
 
-        vp_index = self.get_order().index("vp")
+    def weld(self, epsilon: float | None = None):
+        """
+        parameters
+            (optional)
+                float/None
+                    our epsilon if None
+
+        Merges vertices within epsilon (per component) of each other, for
+        each attribute, keeping the first.  Vertices are bucketed in a grid
+        of epsilon sized cells, so each only checks the cells around it.
+        Indices are remapped, then we compact.  Triangles welded down to
+        a line or point are kept.
+        """
 
-        for v in self.__vertices[vp_index]:
-            v.translate(translation)
+        if epsilon is None:
+            epsilon = self.__epsilon
+        if not isinstance(epsilon, float) or epsilon <= 0:
+            raise ValueError("Epsilon must be a float > 0.0.")
+
+        self.apply_transforms()
+
+        stride = self.get_indices_stride()
+
+        for v in range(stride):
+            # Cell to the vertices we kept in it
+            grid = {}
+
+            # The vertex each of ours merges into
+            remap = []
+
+            for i in range(self.get_vertex_count(v)):
+                values = self.get_vertex_values(v, i)
+                key = tuple(math.floor(j / epsilon) for j in values)
+
+                merge = i
+                for cell in itertools.product(*[(k - 1, k, k + 1) for k in key]):
+                    for j in grid.get(cell, []):
+                        if self.__is_within_epsilon(
+                            values, self.get_vertex_values(v, j), epsilon
+                        ):
+                            merge = j
+                            break
+                    else:
+                        continue
+                    break
+
+                if merge == i:
+                    grid.setdefault(key, []).append(i)
+                remap.append(merge)
+
+            self.__indices[v::stride] = array(
+                "I", [remap[i] for i in self.__indices[v::stride]]
+            )
+
+        # Now, drop the merged vertices, which may have been on our bounds.
+        self.compact()
+        self.recompute_bounds()
@@ -0,0 +1,181 @@
+"""
+vertex_cache.py
+
+Reorders a Shape's triangles so GPUs reuse more of their post transform
+vertex cache, using Tipsify.
+
+Fast Triangle Reordering for Vertex Locality and Reduced Overdraw
+Sander, Nehab, Barczak 2007
+
+A vertex, to the GPU, is one whole indice (position/normal/texture
+indices together), so that's what we cache on.
+
+ACMR (average cache miss ratio) is misses per triangle, 0.5 is the best
+a large regular grid can do, 3.0 the worst.
+ATVR (average transformed vertex ratio) is misses per vertex, 1.0 is best.
+"""
+
+from collections import deque
+
+from ..pyHelpers.type_validation import type_validation
+
+from .shape import Shape
+
+
+def _get_vertex_ids(shape: Shape) -> tuple[list[int], int]:
+    """
+    parameters
+        Shape
+    returns
+        tuple(list[int], int)
+            a vertex id for each indice, and the number of vertices
+
+    Ids are given in the order indices first use them.
+    """
+
+    stride = shape.get_indices_stride()
+    indices = shape.get_indices_array()
+
+    ids = {}
+    vertex_ids = []
+    for i in range(0, len(indices), stride):
+        key = tuple(indices[i : i + stride])
+        if key not in ids:
+            ids[key] = len(ids)
+        vertex_ids.append(ids[key])
+
+    return (vertex_ids, len(ids))
+
+
+def get_vertex_cache_metrics(shape: Shape, cache_size: int = 16) -> dict:
+    """
+    parameters
+        Shape
+        (optional)
+            int
+    returns
+        { acmr, atvr }
+
+    Simulates a FIFO cache of the given size over our indices.
+    """
+
+    type_validation([shape, cache_size], [Shape, int])
+
+    if cache_size <= 0:
+        raise ValueError("Cache Size must be > 0.")
+
+    vertex_ids, vertex_count = _get_vertex_ids(shape)
+    if len(vertex_ids) == 0:
+        return {"acmr": 0.0, "atvr": 0.0}
+
+    cache = deque()
+    cached = set()
+    misses = 0
+    for vertex_id in vertex_ids:
+        if vertex_id not in cached:
+            misses += 1
+            cache.append(vertex_id)
+            cached.add(vertex_id)
+            if len(cache) > cache_size:
+                cached.discard(cache.popleft())
+
+    return {
+        "acmr": misses / (len(vertex_ids) / 3),
+        "atvr": misses / vertex_count,
+    }
+
+
+def optimize_vertex_cache(shape: Shape, cache_size: int = 16) -> dict:
+    """
+    parameters
+        Shape
+        (optional)
+            int
+    returns
+        { before: { acmr, atvr }, after: { acmr, atvr } }
+
+    Reorders the triangles of the Shape with Tipsify, then its vertices
+    into the order the triangles use them.
+    """
+
+    type_validation([shape, cache_size], [Shape, int])
+
+    if not shape.is_valid():
+        raise ValueError("Shape must be made of triangles.")
+
+    before = get_vertex_cache_metrics(shape, cache_size)
+
+    vertex_ids, vertex_count = _get_vertex_ids(shape)
+    triangles = [vertex_ids[i : i + 3] for i in range(0, len(vertex_ids), 3)]
+
+    # Triangles using each vertex, and how many of them are yet to be emitted
+    adjacency = [[] for _ in range(vertex_count)]
+    for t in range(len(triangles)):
+        for v in triangles[t]:
+            adjacency[v].append(t)
+    live = [len(a) for a in adjacency]
+
+    # Time each vertex entered the cache
+    cache_time = [0] * vertex_count
+    time = cache_size + 1
+
+    dead_ends = []
+    emitted = [False] * len(triangles)
+    order = []
+
+    # Next vertex to check, when we run out of dead ends
+    cursor = 1
+
+    fanning = 0
+    while fanning >= 0:
+        candidates = []
+
+        # Emit every triangle around our fanning vertex
+        for t in adjacency[fanning]:
+            if emitted[t]:
+                continue
+
+            for v in triangles[t]:
+                dead_ends.append(v)
+                candidates.append(v)
+                live[v] -= 1
+
+                # Not in the cache anymore?  It is now.
+                if time - cache_time[v] > cache_size:
+                    cache_time[v] = time
+                    time += 1
+
+            emitted[t] = True
+            order.append(t)
+
+        # The candidate that'll still be in the cache after its triangles
+        fanning = -1
+        best = -1
+        for v in candidates:
+            if live[v] > 0:
+                priority = 0
+                if time - cache_time[v] + 2 * live[v] <= cache_size:
+                    priority = time - cache_time[v]
+                if priority > best:
+                    best = priority
+                    fanning = v
+
+        # None?  Try our dead ends, then anything left.
+        if fanning == -1:
+            while len(dead_ends) > 0:
+                v = dead_ends.pop()
+                if live[v] > 0:
+                    fanning = v
+                    break
+
+        if fanning == -1:
+            while cursor < vertex_count:
+                if live[cursor] > 0:
+                    fanning = cursor
+                    break
+                cursor += 1
+
+    shape.reorder_triangles(order)
+    shape.optimize_vertex_fetch()
+
+    return {"before": before, "after": get_vertex_cache_metrics(shape, cache_size)}
@@ -2,7 +2,10 @@
 aabb
 """
 
+import bisect
+
 from ..pyHelpers.descriptor import Descriptor
+from ..pyHelpers.type_validation import type_validation
 
 from .vector import Vector, Vector3f
 
@@ -82,7 +85,7 @@ class AABB:
             bool
         """
 
-        if not self.__type == type(aabb):
+        if not isinstance(aabb, AABB) or not self.__type == type(aabb.Minimum):
             raise ValueError(f"AABB is of type {self.__type}, received {type(aabb)}.")
 
         # Equivalent to (this.Maximum.X < aabb.Minimum.X) || (this.Minimum.X > aabb.Maximum.X)
@@ -127,5 +130,271 @@ class AABB3f(AABB):
         Vector3f
     """
 
-    def __init__(self, minimum: Vector3f = Vector3f(), maximum: Vector3f = Vector3f()):
-        super().__init__(minimum, maximum, Vector3f)
+    def __init__(
+        self, minimum: Vector3f | None = None, maximum: Vector3f | None = None
+    ):
+        # New Vectors each time, AABBs expand in place
+        super().__init__(
+            Vector3f() if minimum is None else minimum,
+            Vector3f() if maximum is None else maximum,
+            Vector3f,
+        )
+
+
+class AABBSet:
+    """
+    parameters
+        (optional)
+            int
+                axis we sweep along, 0/1/2 for x/y/z
+
+    Broad phase, finds every pair of overlapping AABB3fs.
+
+    Sweep and prune.  We keep each AABB's minimum along our axis sorted,
+    any AABB overlapping another starts between its minimum less our
+    largest extent along the axis, and its maximum.  Extents are kept
+    sorted too, so the largest shrinks again when its AABB does, or leaves.  The first search, or
+    after many moves, sweeps the whole sorted list.  After that, only the
+    AABBs that moved are searched for, everything else keeps its pairs.
+
+    Touching AABBs overlap, as with is_colliding_with_aabb.
+    """
+
+    __slots__ = [
+        "__axis",
+        "__bounds",
+        "__extents",
+        "__minimums",
+        "__moved",
+        "__next_id",
+        "__pairs",
+    ]
+
+    def __init__(self, axis: int = 0):
+        type_validation(axis, int)
+
+        if axis < 0 or axis > 2:
+            raise ValueError("Axis must be 0, 1 or 2.")
+
+        self.__axis = axis
+        self.__bounds = {}
+        self.__extents = []
+        self.__minimums = []
+        self.__moved = set()
+        self.__next_id = 0
+        self.__pairs = set()
+
+    def __repr__(self) -> str:
+        """
+        returns
+            str
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            str
+        """
+        return f"{len(self.__bounds)} AABBs, {len(self.__pairs)} pairs"
+
+    def add(self, aabb: AABB3f) -> int:
+        """
+        parameters
+            AABB3f
+        returns
+            int
+                its id
+        """
+
+        id = self.__next_id
+        self.__next_id += 1
+
+        self.__set_bounds(id, aabb)
+        return id
+
+    def get(self, id: int) -> AABB3f:
+        """
+        parameters
+            int
+        returns
+            AABB3f
+                a copy
+        """
+
+        bounds = self.__get_bounds(id)
+        return AABB3f(Vector3f(*bounds[0:3]), Vector3f(*bounds[3:6]))
+
+    def __get_bounds(self, id: int) -> tuple[float, ...]:
+        """
+        parameters
+            int
+        returns
+            tuple(float, ...)
+                minimum then maximum
+        """
+
+        type_validation(id, int)
+
+        if id not in self.__bounds:
+            raise ValueError(f"No AABB with id {id}.")
+
+        return self.__bounds[id]
+
+    def get_colliding(self, id: int) -> list[int]:
+        """
+        parameters
+            int
+        returns
+            list[int]
+                ids overlapping the given one, sorted
+        """
+
+        self.__get_bounds(id)
+
+        return sorted(
+            b if a == id else a for (a, b) in self.get_pairs() if id in (a, b)
+        )
+
+    def get_count(self) -> int:
+        """
+        returns
+            int
+        """
+        return len(self.__bounds)
+
+    def get_pairs(self) -> list[tuple[int, int]]:
+        """
+        returns
+            list[tuple(int, int)]
+                every overlapping pair of ids, lower id first, sorted
+        """
+
+        if len(self.__moved) > 0:
+            if len(self.__moved) * 4 > len(self.__bounds):
+                self.__sweep()
+            else:
+                self.__sweep_moved()
+            self.__moved = set()
+
+        return sorted(self.__pairs)
+
+    def __is_overlapping(self, a: int, b: int) -> bool:
+        """
+        parameters
+            int
+            int
+        returns
+            bool
+        """
+
+        a = self.__bounds[a]
+        b = self.__bounds[b]
+        return all(a[i] <= b[i + 3] and b[i] <= a[i + 3] for i in range(3))
+
+    def remove(self, id: int):
+        """
+        parameters
+            int
+        """
+
+        self.__get_bounds(id)
+
+        self.__remove_sorted(id)
+        del self.__bounds[id]
+        self.__moved.discard(id)
+        self.__pairs = {p for p in self.__pairs if id not in p}
+
+    def __remove_sorted(self, id: int):
+        """
+        parameters
+            int
+
+        Takes the AABB's minimum and extent out of our sorted lists.
+        """
+
+        axis = self.__axis
+        bounds = self.__bounds[id]
+
+        self.__minimums.remove((bounds[axis], id))
+        extent = bounds[axis + 3] - bounds[axis]
+        del self.__extents[bisect.bisect_left(self.__extents, extent)]
+
+    def __set_bounds(self, id: int, aabb: AABB3f):
+        """
+        parameters
+            int
+            AABB3f
+        """
+
+        type_validation(aabb, AABB3f)
+
+        bounds = tuple(
+            aabb.Minimum.get_values_as_list() + aabb.Maximum.get_values_as_list()
+        )
+        axis = self.__axis
+
+        bisect.insort(self.__minimums, (bounds[axis], id))
+        bisect.insort(self.__extents, bounds[axis + 3] - bounds[axis])
+        self.__bounds[id] = bounds
+        self.__moved.add(id)
+
+    def __sweep(self):
+        """
+        Every pair, walking our sorted minimums, keeping those AABBs we're
+        still inside of along our axis.
+        """
+
+        axis = self.__axis
+
+        pairs = set()
+        active = []
+        for minimum, id in self.__minimums:
+            active = [a for a in active if self.__bounds[a][axis + 3] >= minimum]
+            for a in active:
+                if self.__is_overlapping(a, id):
+                    pairs.add((min(a, id), max(a, id)))
+            active.append(id)
+
+        self.__pairs = pairs
+
+    def __sweep_moved(self):
+        """
+        Drops the pairs of our moved AABBs, then searches only around them.
+        """
+
+        axis = self.__axis
+        moved = self.__moved
+
+        self.__pairs = {
+            p for p in self.__pairs if p[0] not in moved and p[1] not in moved
+        }
+
+        for id in moved:
+            bounds = self.__bounds[id]
+            start = bisect.bisect_left(
+                self.__minimums, (bounds[axis] - self.__extents[-1], -1)
+            )
+            end = bisect.bisect_right(
+                self.__minimums, (bounds[axis + 3], self.__next_id)
+            )
+            for _, other in self.__minimums[start:end]:
+                if other != id and self.__is_overlapping(id, other):
+                    self.__pairs.add((min(id, other), max(id, other)))
+
+    def update(self, id: int, aabb: AABB3f):
+        """
+        parameters
+            int
+            AABB3f
+
+        Moves the AABB, only its pairs are searched again.
+        """
+
+        self.__get_bounds(id)
+
+        # Before we touch anything, a bad AABB leaves us as we were
+        type_validation(aabb, AABB3f)
+
+        self.__remove_sorted(id)
+        self.__set_bounds(id, aabb)
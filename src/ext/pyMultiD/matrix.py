@@ -1,8 +1,19 @@
 """
 matrix.py
+
+Values are stored flat, row major.  matmul multiplies one Matrix against a
+whole block of column vectors at once, with NumPy when it's installed.
 """
 
-from ..pyHelpers.math import dot_of_lists
+from array import array
+from typing import Sequence
+
+from ..pyHelpers.type_validation import type_validation
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Matrix:
@@ -13,7 +24,7 @@ class Matrix:
             int
     """
 
-    __slots__ = ["__matrix"]
+    __slots__ = ["__columns", "__rows", "__values"]
 
     def __init__(self, rows: int = 1, columns: int = 1):
         if (
@@ -22,16 +33,23 @@ class Matrix:
             or columns <= 0
             or rows <= 0
         ):
-            ValueError("Columns and Rows must be ints > 0")
+            raise ValueError("Columns and Rows must be ints > 0")
 
-        self.__matrix = [[0.0 for _ in range(columns)] for _ in range(rows)]
+        self.__columns = columns
+        self.__rows = rows
+        self.__values = [0.0] * (rows * columns)
 
     def __str__(self) -> str:
         """
         returns
             string
         """
-        return str(self.__matrix)
+        return str(
+            [
+                self.__values[i * self.__columns : (i + 1) * self.__columns]
+                for i in range(self.__rows)
+            ]
+        )
 
     def __mul__(self, other: "Matrix") -> "Matrix":
         """
@@ -39,31 +57,27 @@ class Matrix:
             Matrix
         returns
             Matrix
+
+        Each of other's columns is a column vector, all sent through matmul
+        together.
         """
 
         if not isinstance(other, Matrix):
-            ValueError(f"{type(other)} is not Matrix")
-        elif self.get_columns_length() != other.get_rows_length():
-            ValueError("Expected our columns to equal other's rows.")
-
-        # Create a new matrix, using our column length
-        new_matrix = Matrix(
-            self.get_rows_length(),
-            other.get_columns_length(),
-        )
+            raise ValueError(f"{type(other)} is not Matrix")
+        elif self.__columns != other.__rows:
+            raise ValueError("Expected our columns to equal other's rows.")
 
-        # Our Rows to Columns, multiplied by other Columns to Rows
-        for i in range(self.get_rows_length()):
-            for j in range(other.get_columns_length()):
-                new_matrix.set_value(
-                    i,
-                    j,
-                    dot_of_lists(
-                        self.__matrix[i],
-                        other.get_column_values(j),
-                    ),
-                )
+        rows = self.__rows
+        columns = other.__columns
 
+        # Other's columns, one after the other, come back as our rows
+        # for each
+        products = matmul(self, other.get_transpose().__values)
+
+        new_matrix = Matrix(rows, columns)
+        new_matrix.__values = [
+            products[j * rows + i] for i in range(rows) for j in range(columns)
+        ]
         return new_matrix
 
     def get_columns_length(self) -> int:
@@ -71,7 +85,7 @@ class Matrix:
         returns
             int
         """
-        return len(self.__matrix[0])
+        return self.__columns
 
     def get_column_values(self, column: int) -> list[float | int]:
         """
@@ -81,15 +95,64 @@ class Matrix:
             list[float/int]
         """
         if not self.is_valid_column(column):
-            ValueError(f"{column} not valid for Matrix")
-        return [row[column] for row in self.__matrix]
+            raise ValueError(f"{column} not valid for Matrix")
+        return self.__values[column :: self.__columns]
+
+    def get_inverse(self) -> "Matrix":
+        """
+        returns
+            Matrix
+
+        Gauss-Jordan elimination, pivoting on the largest value in
+        each column.
+        """
+
+        size = self.__rows
+        if size != self.__columns:
+            raise ValueError("Only square matrices can be inverted.")
+
+        # Our rows, with the identity beside them
+        rows = [
+            [float(j) for j in self.__values[i * size : (i + 1) * size]]
+            + [1.0 if i == j else 0.0 for j in range(size)]
+            for i in range(size)
+        ]
+
+        for column in range(size):
+            pivot = max(range(column, size), key=lambda r: abs(rows[r][column]))
+            if rows[pivot][column] == 0.0:
+                raise ValueError("Matrix is singular, it has no inverse.")
+            rows[column], rows[pivot] = rows[pivot], rows[column]
+
+            # Scale the pivot row to 1, then clear the column from the others
+            pivot_value = rows[column][column]
+            rows[column] = [j / pivot_value for j in rows[column]]
+            for i in range(size):
+                if i != column and rows[i][column] != 0.0:
+                    factor = rows[i][column]
+                    rows[i] = [j - factor * k for (j, k) in zip(rows[i], rows[column])]
+
+        inverse = Matrix(size, size)
+        inverse.__values = [j for row in rows for j in row[size:]]
+        return inverse
 
     def get_rows_length(self) -> int:
         """
         returns
             int
         """
-        return len(self.__matrix)
+        return self.__rows
+
+    def get_transpose(self) -> "Matrix":
+        """
+        returns
+            Matrix
+        """
+        transpose = Matrix(self.__columns, self.__rows)
+        transpose.__values = [
+            j for i in range(self.__columns) for j in self.get_column_values(i)
+        ]
+        return transpose
 
     def get_value(self, row: int, column: int) -> float | int:
         """
@@ -100,15 +163,16 @@ class Matrix:
             float/int
         """
         if not self.is_valid_column(column) or not self.is_valid_row(row):
-            ValueError(f"{column} or {row} not valid for Matrix")
-        return self.__matrix[row][column]
+            raise ValueError(f"{column} or {row} not valid for Matrix")
+        return self.__values[row * self.__columns + column]
 
-    def get_values_as_list(self) -> float | int:
+    def get_values_as_list(self) -> list[float | int]:
         """
         returns
             list[float/int]
+                row major
         """
-        return [j for sub in self.__matrix for j in sub]
+        return list(self.__values)
 
     def is_valid_column(self, column: int) -> bool:
         """
@@ -117,11 +181,7 @@ class Matrix:
         returns
             bool
         """
-        if (
-            not isinstance(column, int)
-            or column < 0
-            or self.get_columns_length() <= column
-        ):
+        if not isinstance(column, int) or column < 0 or self.__columns <= column:
             return False
         return True
 
@@ -132,7 +192,7 @@ class Matrix:
         returns
             bool
         """
-        if not isinstance(row, int) or row < 0 or self.get_rows_length() <= row:
+        if not isinstance(row, int) or row < 0 or self.__rows <= row:
             return False
         return True
 
@@ -144,7 +204,80 @@ class Matrix:
             float/int
         """
         if not self.is_valid_column(column) or not self.is_valid_row(row):
-            ValueError(f"{column} or {row} not valid for Matrix")
+            raise ValueError(f"{column} or {row} not valid for Matrix")
         elif not isinstance(value, (float, int)):
-            ValueError("Value must be a float or int.")
-        self.__matrix[row][column] = value
+            raise ValueError("Value must be a float or int.")
+        self.__values[row * self.__columns + column] = value
+
+
+def matmul(
+    matrix: Matrix, block: "Sequence[float] | numpy.ndarray", affine: bool = False
+) -> "array | numpy.ndarray":
+    """
+    parameters
+        Matrix(rows x k)
+        Sequence<float>, numpy.ndarray
+            N column vectors of k values, flat one after the other, or an
+            (N, k) numpy array
+        (optional)
+            bool
+                our Matrix is a (k + 1)x(k + 1) affine, each vector has an
+                unwritten 1 after its k values, and only the top k rows apply
+    returns
+        array("d"), numpy.ndarray
+            N vectors of rows values, flat, or (N, rows) as given
+
+    With NumPy installed, it does the work.  Otherwise each matrix row is
+    summed a component at a time, down the whole block, in the same order
+    as a * x + b * y + c * z (+ d), so results match one vector at a time.
+    """
+
+    type_validation([matrix, affine], [Matrix, bool])
+
+    rows = matrix.get_rows_length()
+    k = matrix.get_columns_length()
+    if affine:
+        if rows != k or k < 2:
+            raise ValueError("An affine Matrix must be square, 2x2 or larger.")
+        rows -= 1
+        k -= 1
+
+    m = matrix.get_values_as_list()
+    stride = matrix.get_columns_length()
+
+    if numpy is not None and isinstance(block, numpy.ndarray):
+        if block.ndim != 2 or block.shape[1] != k:
+            raise ValueError(f"Expected an (N, {k}) array.")
+    elif len(block) % k != 0:
+        raise ValueError(f"Expected a multiple of {k} values.")
+
+    if numpy is not None:
+        vectors = numpy.asarray(block, dtype=numpy.float64).reshape(-1, k)
+        values = numpy.asarray(m, dtype=numpy.float64).reshape(-1, stride)
+
+        products = vectors @ values[0:rows, 0:k].T
+        if affine:
+            products += values[0:rows, k]
+
+        if isinstance(block, numpy.ndarray):
+            return products
+        flat = array("d")
+        flat.frombytes(products.tobytes())
+        return flat
+
+    count = len(block) // k
+    components = [block[j::k] for j in range(k)]
+
+    flat = array("d", bytes(8 * count * rows))
+    for i in range(rows):
+        row = m[i * stride : (i + 1) * stride]
+
+        values = [row[0] * c for c in components[0]]
+        for j in range(1, k):
+            values = [v + row[j] * c for (v, c) in zip(values, components[j])]
+        if affine:
+            values = [v + row[k] for v in values]
+
+        flat[i::rows] = array("d", values)
+
+    return flat
@@ -0,0 +1,540 @@
+"""
+matrix4.py
+
+Fixed size 3x3 and 4x4 affine matrices.  Their values are a flat row major
+tuple and every product is written out, rather than going through Matrix's
+validated rows and columns.  They're never changed in place, so the same
+one can be shared, as our cached rotations are.
+"""
+
+import math
+from array import array
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+from ..pyHelpers.math import divide_by_zero
+from ..pyHelpers.type_validation import type_validation
+
+from .matrix import Matrix, matmul
+
+
+# Rotations kept, generators reuse a handful of angles over and over
+ROTATION_CACHE_SIZE = 1024
+
+
+class Matrix3:
+    """
+    parameters
+        (optional)
+            Iterable<float/int>
+                9 values, row major, identity when None
+    """
+
+    __slots__ = ["__values"]
+
+    def __init__(self, values: Iterable[float | int] | None = None):
+        if values is None:
+            values = [1.0 if i % 4 == 0 else 0.0 for i in range(9)]
+
+        values = tuple(values)
+        if len(values) != 9 or not all(isinstance(v, (float, int)) for v in values):
+            raise ValueError("Expected 9 floats/ints.")
+
+        self.__values = values
+
+    def __repr__(self) -> str:
+        """
+        returns
+            string
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            string
+        """
+        return str([list(self.__values[i * 3 : i * 3 + 3]) for i in range(3)])
+
+    def __eq__(self, other: "Matrix3") -> bool:
+        """
+        parameters
+            Matrix3
+        returns
+            bool
+        """
+        if not isinstance(other, Matrix3):
+            return False
+        return self.__values == other.__values
+
+    def __mul__(self, other: "Matrix3") -> "Matrix3":
+        """
+        parameters
+            Matrix3
+        returns
+            Matrix3
+        """
+
+        type_validation(other, Matrix3)
+
+        a0, a1, a2, a3, a4, a5, a6, a7, a8 = self.__values
+        b0, b1, b2, b3, b4, b5, b6, b7, b8 = other.__values
+
+        return Matrix3(
+            (
+                a0 * b0 + a1 * b3 + a2 * b6,
+                a0 * b1 + a1 * b4 + a2 * b7,
+                a0 * b2 + a1 * b5 + a2 * b8,
+                a3 * b0 + a4 * b3 + a5 * b6,
+                a3 * b1 + a4 * b4 + a5 * b7,
+                a3 * b2 + a4 * b5 + a5 * b8,
+                a6 * b0 + a7 * b3 + a8 * b6,
+                a6 * b1 + a7 * b4 + a8 * b7,
+                a6 * b2 + a7 * b5 + a8 * b8,
+            )
+        )
+
+    def get_determinant(self) -> float:
+        """
+        returns
+            float
+        """
+        a0, a1, a2, a3, a4, a5, a6, a7, a8 = self.__values
+        return (
+            a0 * (a4 * a8 - a5 * a7)
+            - a1 * (a3 * a8 - a5 * a6)
+            + a2 * (a3 * a7 - a4 * a6)
+        )
+
+    def get_inverse(self) -> "Matrix3":
+        """
+        returns
+            Matrix3
+
+        Our adjugate over our determinant.
+        """
+
+        determinant = self.get_determinant()
+        if determinant == 0.0:
+            raise ValueError("Matrix is singular, it has no inverse.")
+
+        a0, a1, a2, a3, a4, a5, a6, a7, a8 = self.__values
+        return Matrix3(
+            v / determinant
+            for v in (
+                a4 * a8 - a5 * a7,
+                a2 * a7 - a1 * a8,
+                a1 * a5 - a2 * a4,
+                a5 * a6 - a3 * a8,
+                a0 * a8 - a2 * a6,
+                a2 * a3 - a0 * a5,
+                a3 * a7 - a4 * a6,
+                a1 * a6 - a0 * a7,
+                a0 * a4 - a1 * a3,
+            )
+        )
+
+    def get_matrix(self) -> Matrix:
+        """
+        returns
+            Matrix(3x3)
+        """
+        matrix = Matrix(3, 3)
+        for i in range(9):
+            matrix.set_value(i // 3, i % 3, self.__values[i])
+        return matrix
+
+    def get_transpose(self) -> "Matrix3":
+        """
+        returns
+            Matrix3
+        """
+        a0, a1, a2, a3, a4, a5, a6, a7, a8 = self.__values
+        return Matrix3((a0, a3, a6, a1, a4, a7, a2, a5, a8))
+
+    def get_value(self, row: int, column: int) -> float | int:
+        """
+        parameters
+            int
+            int
+        returns
+            float/int
+        """
+
+        type_validation([row, column], int)
+
+        if row < 0 or row > 2 or column < 0 or column > 2:
+            raise ValueError(f"{column} or {row} not valid for Matrix3")
+
+        return self.__values[row * 3 + column]
+
+    def get_values_as_list(self) -> list[float | int]:
+        """
+        returns
+            list[float/int]
+        """
+        return list(self.__values)
+
+    def transform(self, values: list[float | int]) -> list[float]:
+        """
+        parameters
+            list[float/int]
+                x, y, z
+        returns
+            list[float]
+        """
+        a0, a1, a2, a3, a4, a5, a6, a7, a8 = self.__values
+        x, y, z = values
+        return [
+            a0 * x + a1 * y + a2 * z,
+            a3 * x + a4 * y + a5 * z,
+            a6 * x + a7 * y + a8 * z,
+        ]
+
+
+class Matrix4:
+    """
+    parameters
+        (optional)
+            Iterable<float/int>
+                16 values, row major, identity when None
+
+    Affine, our last row is always 0, 0, 0, 1, so only the top three rows
+    are ever multiplied.
+    """
+
+    __slots__ = ["__values"]
+
+    def __init__(self, values: Iterable[float | int] | None = None):
+        if values is None:
+            values = [1.0 if i % 5 == 0 else 0.0 for i in range(16)]
+
+        values = tuple(values)
+        if len(values) != 16 or not all(isinstance(v, (float, int)) for v in values):
+            raise ValueError("Expected 16 floats/ints.")
+        elif values[12:16] != (0, 0, 0, 1):
+            raise ValueError("Matrix4 is affine, its last row must be 0, 0, 0, 1.")
+
+        self.__values = values
+
+    def __repr__(self) -> str:
+        """
+        returns
+            string
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            string
+        """
+        return str([list(self.__values[i * 4 : i * 4 + 4]) for i in range(4)])
+
+    def __eq__(self, other: "Matrix4") -> bool:
+        """
+        parameters
+            Matrix4
+        returns
+            bool
+        """
+        if not isinstance(other, Matrix4):
+            return False
+        return self.__values == other.__values
+
+    def __mul__(self, other: "Matrix4") -> "Matrix4":
+        """
+        parameters
+            Matrix4
+        returns
+            Matrix4
+
+        other is applied first, then us.
+        """
+
+        type_validation(other, Matrix4)
+
+        a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11 = self.__values[0:12]
+        b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11 = other.__values[0:12]
+
+        return Matrix4(
+            (
+                a0 * b0 + a1 * b4 + a2 * b8,
+                a0 * b1 + a1 * b5 + a2 * b9,
+                a0 * b2 + a1 * b6 + a2 * b10,
+                a0 * b3 + a1 * b7 + a2 * b11 + a3,
+                a4 * b0 + a5 * b4 + a6 * b8,
+                a4 * b1 + a5 * b5 + a6 * b9,
+                a4 * b2 + a5 * b6 + a6 * b10,
+                a4 * b3 + a5 * b7 + a6 * b11 + a7,
+                a8 * b0 + a9 * b4 + a10 * b8,
+                a8 * b1 + a9 * b5 + a10 * b9,
+                a8 * b2 + a9 * b6 + a10 * b10,
+                a8 * b3 + a9 * b7 + a10 * b11 + a11,
+                0.0,
+                0.0,
+                0.0,
+                1.0,
+            )
+        )
+
+    def get_inverse(self) -> "Matrix4":
+        """
+        returns
+            Matrix4
+
+        Our top left 3x3 inverted, then our translation undone through it.
+        """
+
+        linear = self.get_linear().get_inverse()
+        v = self.__values
+        x, y, z = linear.transform([-v[3], -v[7], -v[11]])
+        l0, l1, l2, l3, l4, l5, l6, l7, l8 = linear.get_values_as_list()
+
+        return Matrix4(
+            (l0, l1, l2, x, l3, l4, l5, y, l6, l7, l8, z, 0.0, 0.0, 0.0, 1.0)
+        )
+
+    def get_linear(self) -> Matrix3:
+        """
+        returns
+            Matrix3
+                our top left 3x3, without our translation
+        """
+        v = self.__values
+        return Matrix3((v[0], v[1], v[2], v[4], v[5], v[6], v[8], v[9], v[10]))
+
+    def get_matrix(self) -> Matrix:
+        """
+        returns
+            Matrix(4x4)
+        """
+        matrix = Matrix(4, 4)
+        for i in range(16):
+            matrix.set_value(i // 4, i % 4, self.__values[i])
+        return matrix
+
+    def get_value(self, row: int, column: int) -> float | int:
+        """
+        parameters
+            int
+            int
+        returns
+            float/int
+        """
+
+        type_validation([row, column], int)
+
+        if row < 0 or row > 3 or column < 0 or column > 3:
+            raise ValueError(f"{column} or {row} not valid for Matrix4")
+
+        return self.__values[row * 4 + column]
+
+    def get_values_as_list(self) -> list[float | int]:
+        """
+        returns
+            list[float/int]
+        """
+        return list(self.__values)
+
+    def transform_direction(self, values: list[float | int]) -> list[float]:
+        """
+        parameters
+            list[float/int]
+                x, y, z
+        returns
+            list[float]
+
+        Directions don't move, only our top left 3x3 applies.
+        """
+        a0, a1, a2, _, a4, a5, a6, _, a8, a9, a10, _ = self.__values[0:12]
+        x, y, z = values
+        return [
+            a0 * x + a1 * y + a2 * z,
+            a4 * x + a5 * y + a6 * z,
+            a8 * x + a9 * y + a10 * z,
+        ]
+
+    def transform_point(self, values: list[float | int]) -> list[float]:
+        """
+        parameters
+            list[float/int]
+                x, y, z
+        returns
+            list[float]
+        """
+        a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11 = self.__values[0:12]
+        x, y, z = values
+        return [
+            a0 * x + a1 * y + a2 * z + a3,
+            a4 * x + a5 * y + a6 * z + a7,
+            a8 * x + a9 * y + a10 * z + a11,
+        ]
+
+
+@lru_cache(maxsize=ROTATION_CACHE_SIZE)
+def _get_rotation_matrix3(
+    roll: float | int, pitch: float | int, yaw: float | int
+) -> Matrix3:
+    """
+    parameters
+        float/int
+        float/int
+        float/int
+    returns
+        Matrix3
+    """
+
+    # Convert degrees to radians
+    pitch_radians = math.radians(pitch)
+    roll_radians = math.radians(roll)
+    yaw_radians = math.radians(yaw)
+
+    # Pitch, or Y
+    cos = math.cos(pitch_radians)
+    sin = math.sin(pitch_radians)
+    pitch_matrix = Matrix3((cos, 0.0, -sin, 0.0, 1.0, 0.0, sin, 0.0, cos))
+
+    # Roll, or X
+    cos = math.cos(roll_radians)
+    sin = math.sin(roll_radians)
+    roll_matrix = Matrix3((1.0, 0.0, 0.0, 0.0, cos, sin, 0.0, -sin, cos))
+
+    # Yaw, or Z
+    cos = math.cos(yaw_radians)
+    sin = math.sin(yaw_radians)
+    yaw_matrix = Matrix3((cos, sin, 0.0, -sin, cos, 0.0, 0.0, 0.0, 1.0))
+
+    # Order is Yaw * Pitch * Roll
+    return yaw_matrix * pitch_matrix * roll_matrix
+
+
+@lru_cache(maxsize=ROTATION_CACHE_SIZE)
+def _get_rotation_matrix4(
+    roll: float | int, pitch: float | int, yaw: float | int
+) -> Matrix4:
+    """
+    parameters
+        float/int
+        float/int
+        float/int
+    returns
+        Matrix4
+    """
+    l0, l1, l2, l3, l4, l5, l6, l7, l8 = _get_rotation_matrix3(
+        roll, pitch, yaw
+    ).get_values_as_list()
+    return Matrix4(
+        (l0, l1, l2, 0.0, l3, l4, l5, 0.0, l6, l7, l8, 0.0, 0.0, 0.0, 0.0, 1.0)
+    )
+
+
+def get_rotation_matrix3(
+    roll: float | int, pitch: float | int, yaw: float | int
+) -> Matrix3:
+    """
+    parameters
+        float/int
+        float/int
+        float/int
+    returns
+        Matrix3
+
+    Yaw * Pitch * Roll, each turning its axis clockwise.  Cached, so the
+    same angles give back the same Matrix3.
+
+    roll = x
+    pitch = y
+    yaw = z
+    """
+
+    type_validation([roll, pitch, yaw], (float, int))
+
+    return _get_rotation_matrix3(roll, pitch, yaw)
+
+
+def get_rotation_matrix4(
+    roll: float | int, pitch: float | int, yaw: float | int
+) -> Matrix4:
+    """
+    parameters
+        float/int
+        float/int
+        float/int
+    returns
+        Matrix4
+
+    get_rotation_matrix3, in the top left of an affine, also cached.
+
+    roll = x
+    pitch = y
+    yaw = z
+    """
+
+    type_validation([roll, pitch, yaw], (float, int))
+
+    return _get_rotation_matrix4(roll, pitch, yaw)
+
+
+def get_scale_matrix4(x: float | int, y: float | int, z: float | int) -> Matrix4:
+    """
+    parameters
+        float/int
+        float/int
+        float/int
+    returns
+        Matrix4
+    """
+
+    type_validation([x, y, z], (float, int))
+
+    return Matrix4(
+        (x, 0.0, 0.0, 0.0, 0.0, y, 0.0, 0.0, 0.0, 0.0, z, 0.0, 0.0, 0.0, 0.0, 1.0)
+    )
+
+
+def get_translation_matrix4(x: float | int, y: float | int, z: float | int) -> Matrix4:
+    """
+    parameters
+        float/int
+        float/int
+        float/int
+    returns
+        Matrix4
+    """
+
+    type_validation([x, y, z], (float, int))
+
+    return Matrix4(
+        (1.0, 0.0, 0.0, x, 0.0, 1.0, 0.0, y, 0.0, 0.0, 1.0, z, 0.0, 0.0, 0.0, 1.0)
+    )
+
+
+def transform_normals(linear: Matrix3, normals: Sequence[float]) -> array | None:
+    """
+    parameters
+        Matrix3
+            the top left of an affine
+        Sequence<float>
+            flat, 3 values per normal
+    returns
+        array("d")/None
+            None when the normals are left as they were
+
+    Normals get the inverse transpose, then are normalized, as one block
+    through matmul.  The identity leaves them alone.  Flattened, as by a
+    scale of 0.0, there is no inverse and no surface left to face, so we
+    leave them be.
+    """
+
+    type_validation(linear, Matrix3)
+
+    if linear == Matrix3() or linear.get_determinant() == 0.0:
+        return None
+
+    vn = matmul(linear.get_inverse().get_transpose().get_matrix(), normals)
+    transformed = array("d")
+    for normal in zip(vn[0::3], vn[1::3], vn[2::3]):
+        magnitude = math.sqrt(sum(i * i for i in normal))
+        transformed.extend([divide_by_zero(i, magnitude) for i in normal])
+    return transformed
@@ -0,0 +1,403 @@
+"""
+quaternion.py
+
+Rotations as unit quaternions.  Composing two is 16 multiplies, and rotating
+a vector never builds a matrix.
+
+Euler angles are in degrees, and match get_rotation_matrix3, so
+get_quaternion_from_euler(roll, pitch, yaw) rotates a Vector3f just as
+Vector3f.rotate(roll, pitch, yaw) does.
+"""
+
+import math
+
+from ..pyHelpers.type_validation import type_validation
+
+from .matrix import Matrix
+from .matrix4 import Matrix3, Matrix4
+from .vector import Vector3f
+
+
+# Closer than this, slerp's sin(angle) is too small to divide by, so we nlerp
+SLERP_THRESHOLD = 0.9995
+
+
+class Quaternion:
+    """
+    parameters
+        (optional)
+            float
+            float
+            float
+            float
+
+    w, x, y, z, the identity by default.  q * p rotates by p, then q.
+    """
+
+    __slots__ = ["W", "X", "Y", "Z"]
+
+    def __init__(self, w: float = 1.0, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.W = w
+        self.X = x
+        self.Y = y
+        self.Z = z
+
+    def __repr__(self) -> str:
+        """
+        returns
+            string
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            string
+        """
+        return f"{self.get()}"
+
+    def __eq__(self, other: "Quaternion") -> bool:
+        """
+        parameters
+            Quaternion
+        returns
+            bool
+        """
+        if not isinstance(other, Quaternion):
+            return False
+        return self.get_values_as_list() == other.get_values_as_list()
+
+    def __mul__(self, other: "Quaternion") -> "Quaternion":
+        """
+        parameters
+            Quaternion
+        returns
+            Quaternion
+        """
+
+        type_validation(other, Quaternion)
+
+        aw, ax, ay, az = self.W, self.X, self.Y, self.Z
+        bw, bx, by, bz = other.W, other.X, other.Y, other.Z
+
+        return Quaternion(
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+        )
+
+    def dot(self, other: "Quaternion") -> float:
+        """
+        parameters
+            Quaternion
+        returns
+            float
+        """
+
+        type_validation(other, Quaternion)
+
+        return self.W * other.W + self.X * other.X + self.Y * other.Y + self.Z * other.Z
+
+    def get(self) -> dict:
+        """
+        returns
+            dict
+        """
+        return {"W": self.W, "X": self.X, "Y": self.Y, "Z": self.Z}
+
+    def get_conjugate(self) -> "Quaternion":
+        """
+        returns
+            Quaternion
+                the opposite rotation, when we're unit length
+        """
+        return Quaternion(self.W, -self.X, -self.Y, -self.Z)
+
+    def get_euler(self) -> tuple[float, float, float]:
+        """
+        returns
+            tuple(float, float, float)
+                roll, pitch, yaw in degrees
+
+        Pitch is kept within -90 and 90.  At either, roll and yaw turn the
+        same axis, so roll is 0 and yaw takes all of it.
+        """
+
+        m = self.get_matrix3().get_values_as_list()
+
+        # Our matrix is Rz(-yaw) * Ry(-pitch) * Rx(-roll)
+        cos_pitch = math.hypot(m[7], m[8])
+        pitch = math.atan2(m[6], cos_pitch)
+        if cos_pitch > 1e-9:
+            roll = math.atan2(-m[7], m[8])
+            yaw = math.atan2(-m[3], m[0])
+        else:
+            roll = 0.0
+            yaw = math.atan2(m[1], m[4])
+
+        return (math.degrees(roll), math.degrees(pitch), math.degrees(yaw))
+
+    def get_inverse(self) -> "Quaternion":
+        """
+        returns
+            Quaternion
+        """
+
+        length = self.dot(self)
+        if length == 0.0:
+            raise ValueError("Quaternion is zero, it has no inverse.")
+
+        return Quaternion(
+            self.W / length, -self.X / length, -self.Y / length, -self.Z / length
+        )
+
+    def get_matrix3(self) -> Matrix3:
+        """
+        returns
+            Matrix3
+                the same rotation, when we're unit length
+        """
+
+        w, x, y, z = self.W, self.X, self.Y, self.Z
+
+        return Matrix3(
+            (
+                1.0 - 2.0 * (y * y + z * z),
+                2.0 * (x * y - w * z),
+                2.0 * (x * z + w * y),
+                2.0 * (x * y + w * z),
+                1.0 - 2.0 * (x * x + z * z),
+                2.0 * (y * z - w * x),
+                2.0 * (x * z - w * y),
+                2.0 * (y * z + w * x),
+                1.0 - 2.0 * (x * x + y * y),
+            )
+        )
+
+    def get_matrix4(self) -> Matrix4:
+        """
+        returns
+            Matrix4
+                get_matrix3, in the top left of an affine
+        """
+        l0, l1, l2, l3, l4, l5, l6, l7, l8 = self.get_matrix3().get_values_as_list()
+        return Matrix4(
+            (l0, l1, l2, 0.0, l3, l4, l5, 0.0, l6, l7, l8, 0.0, 0.0, 0.0, 0.0, 1.0)
+        )
+
+    def get_values_as_list(self) -> list[float]:
+        """
+        returns
+            list[float]
+                w, x, y, z
+        """
+        return [self.W, self.X, self.Y, self.Z]
+
+    def magnitude(self) -> float:
+        """
+        returns
+            float
+        """
+        return math.sqrt(self.dot(self))
+
+    def normalize(self) -> "Quaternion":
+        """
+        returns
+            Quaternion
+
+        A zero Quaternion stays zero, as with Vector.normalize.
+        """
+
+        magnitude = self.magnitude()
+        if magnitude == 0.0:
+            return Quaternion(0.0, 0.0, 0.0, 0.0)
+
+        return Quaternion(
+            self.W / magnitude,
+            self.X / magnitude,
+            self.Y / magnitude,
+            self.Z / magnitude,
+        )
+
+    def rotate(self, vector: Vector3f) -> Vector3f:
+        """
+        parameters
+            Vector3f
+        returns
+            Vector3f
+
+        We must be unit length.  v + w * t + q x t, with t = 2 * (q x v).
+        """
+
+        type_validation(vector, Vector3f)
+
+        w, x, y, z = self.W, self.X, self.Y, self.Z
+        vx, vy, vz = vector.X, vector.Y, vector.Z
+
+        tx = 2.0 * (y * vz - z * vy)
+        ty = 2.0 * (z * vx - x * vz)
+        tz = 2.0 * (x * vy - y * vx)
+
+        return Vector3f(
+            vx + w * tx + (y * tz - z * ty),
+            vy + w * ty + (z * tx - x * tz),
+            vz + w * tz + (x * ty - y * tx),
+        )
+
+
+def get_quaternion_from_axis_angle(axis: Vector3f, angle: float | int) -> Quaternion:
+    """
+    parameters
+        Vector3f
+        float/int
+            degrees, counter clockwise with the axis pointing at us
+    returns
+        Quaternion
+    """
+
+    type_validation([axis, angle], [Vector3f, (float, int)])
+
+    axis = axis.normalize()
+    half = math.radians(angle) / 2.0
+    sin = math.sin(half)
+
+    return Quaternion(math.cos(half), axis.X * sin, axis.Y * sin, axis.Z * sin)
+
+
+def get_quaternion_from_euler(
+    roll: float | int, pitch: float | int, yaw: float | int
+) -> Quaternion:
+    """
+    parameters
+        float/int
+        float/int
+        float/int
+    returns
+        Quaternion
+
+    roll = x
+    pitch = y
+    yaw = z
+    """
+
+    type_validation([roll, pitch, yaw], (float, int))
+
+    # get_rotation_matrix3 turns each axis clockwise, so each half angle is
+    # negated, then composed as Yaw * Pitch * Roll
+    roll_half = -math.radians(roll) / 2.0
+    pitch_half = -math.radians(pitch) / 2.0
+    yaw_half = -math.radians(yaw) / 2.0
+
+    return (
+        Quaternion(math.cos(yaw_half), 0.0, 0.0, math.sin(yaw_half))
+        * Quaternion(math.cos(pitch_half), 0.0, math.sin(pitch_half), 0.0)
+        * Quaternion(math.cos(roll_half), math.sin(roll_half), 0.0, 0.0)
+    )
+
+
+def get_quaternion_from_matrix(matrix: "Matrix | Matrix3 | Matrix4") -> Quaternion:
+    """
+    parameters
+        Matrix(3x3 or 4x4), Matrix3, Matrix4
+            a rotation, only the top left 3x3 is used
+    returns
+        Quaternion
+    """
+
+    type_validation(matrix, [Matrix, Matrix3, Matrix4])
+
+    if isinstance(matrix, Matrix4):
+        matrix = matrix.get_linear()
+    elif isinstance(matrix, Matrix):
+        size = matrix.get_rows_length()
+        if size not in (3, 4) or matrix.get_columns_length() != size:
+            raise ValueError("Expected a 3x3 or 4x4 Matrix.")
+        matrix = Matrix3(matrix.get_value(i, j) for i in range(3) for j in range(3))
+
+    m0, m1, m2, m3, m4, m5, m6, m7, m8 = matrix.get_values_as_list()
+
+    # Work from the largest of w, x, y, z, keeping our square root away
+    # from zero
+    trace = m0 + m4 + m8
+    if trace > 0.0:
+        s = math.sqrt(trace + 1.0) * 2.0
+        quaternion = Quaternion(0.25 * s, (m7 - m5) / s, (m2 - m6) / s, (m3 - m1) / s)
+    elif m0 > m4 and m0 > m8:
+        s = math.sqrt(1.0 + m0 - m4 - m8) * 2.0
+        quaternion = Quaternion((m7 - m5) / s, 0.25 * s, (m1 + m3) / s, (m2 + m6) / s)
+    elif m4 > m8:
+        s = math.sqrt(1.0 + m4 - m0 - m8) * 2.0
+        quaternion = Quaternion((m2 - m6) / s, (m1 + m3) / s, 0.25 * s, (m5 + m7) / s)
+    else:
+        s = math.sqrt(1.0 + m8 - m0 - m4) * 2.0
+        quaternion = Quaternion((m3 - m1) / s, (m2 + m6) / s, (m5 + m7) / s, 0.25 * s)
+
+    return quaternion.normalize()
+
+
+def nlerp(start: Quaternion, end: Quaternion, t: float | int) -> Quaternion:
+    """
+    parameters
+        Quaternion
+        Quaternion
+        float/int
+            0.0 is start, 1.0 is end
+    returns
+        Quaternion
+
+    Straight between the two, then normalized.  Cheaper than slerp, but
+    its speed along the way isn't constant.  Takes the shorter way around.
+    """
+
+    type_validation([start, end, t], [Quaternion, Quaternion, (float, int)])
+
+    # q and -q are the same rotation, pick whichever is closer
+    sign = -1.0 if start.dot(end) < 0.0 else 1.0
+    u = 1.0 - t
+    v = t * sign
+
+    return Quaternion(
+        u * start.W + v * end.W,
+        u * start.X + v * end.X,
+        u * start.Y + v * end.Y,
+        u * start.Z + v * end.Z,
+    ).normalize()
+
+
+def slerp(start: Quaternion, end: Quaternion, t: float | int) -> Quaternion:
+    """
+    parameters
+        Quaternion
+        Quaternion
+        float/int
+            0.0 is start, 1.0 is end
+    returns
+        Quaternion
+
+    Along the arc between the two, at a constant speed.  Takes the shorter
+    way around.
+    """
+
+    type_validation([start, end, t], [Quaternion, Quaternion, (float, int)])
+
+    dot = start.dot(end)
+    sign = 1.0
+    if dot < 0.0:
+        dot = -dot
+        sign = -1.0
+
+    if dot > SLERP_THRESHOLD:
+        return nlerp(start, end, t)
+
+    angle = math.acos(dot)
+    sin = math.sin(angle)
+    u = math.sin((1.0 - t) * angle) / sin
+    v = math.sin(t * angle) / sin * sign
+
+    return Quaternion(
+        u * start.W + v * end.W,
+        u * start.X + v * end.X,
+        u * start.Y + v * end.Y,
+        u * start.Z + v * end.Z,
+    )
@@ -0,0 +1,250 @@
+"""
+quaternion_array.py
+
+Many Quaternions at once, as one contiguous array of floats per component,
+so whole sets of keyframes blend in one call.
+"""
+
+import math
+from array import array
+from itertools import repeat
+from typing import Iterable
+
+from ..pyHelpers.type_validation import type_validation
+
+from .quaternion import SLERP_THRESHOLD, Quaternion
+
+
+class QuaternionArray:
+    """
+    parameters
+        (optional)
+            Iterable<float>
+            Iterable<float>
+            Iterable<float>
+            Iterable<float>
+
+    w, x, y, z, all the same length.
+    """
+
+    __slots__ = ["__columns"]
+
+    def __init__(
+        self,
+        w: Iterable[float] = (),
+        x: Iterable[float] = (),
+        y: Iterable[float] = (),
+        z: Iterable[float] = (),
+    ):
+        self.__columns = [array("d", column) for column in (w, x, y, z)]
+
+        if len(set(len(column) for column in self.__columns)) > 1:
+            raise ValueError("Columns must all be the same length.")
+
+    def __repr__(self) -> str:
+        """
+        returns
+            string
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            string
+        """
+        return f"{self.get_quaternions()}"
+
+    def __get_blend_arguments(
+        self, end: "QuaternionArray | Quaternion", t: "float | int | Iterable[float]"
+    ) -> tuple[list[Iterable[float]], Iterable[float]]:
+        """
+        parameters
+            QuaternionArray, Quaternion
+            float/int, Iterable<float>
+        returns
+            tuple(list<Iterable<float>>, Iterable<float>)
+                end's columns, and t, lined up with ours
+        """
+
+        type_validation(end, [QuaternionArray, Quaternion])
+
+        if isinstance(end, Quaternion):
+            ends = [repeat(value) for value in end.get_values_as_list()]
+        elif end.get_count() != self.get_count():
+            raise ValueError(
+                f"Expected {self.get_count()} Quaternions, received {end.get_count()}."
+            )
+        else:
+            ends = end.__columns
+
+        if isinstance(t, (float, int)):
+            t = repeat(t)
+        else:
+            t = array("d", t)
+            if len(t) != self.get_count():
+                raise ValueError(f"Expected {self.get_count()} t, received {len(t)}.")
+
+        return (ends, t)
+
+    def append(self, quaternion: Quaternion):
+        """
+        parameters
+            Quaternion
+        """
+
+        type_validation(quaternion, Quaternion)
+
+        for column, value in zip(self.__columns, quaternion.get_values_as_list()):
+            column.append(value)
+
+    def extend(self, quaternions: Iterable[Quaternion]):
+        """
+        parameters
+            Iterable<Quaternion>
+        """
+        for quaternion in quaternions:
+            self.append(quaternion)
+
+    def get(self, index: int) -> Quaternion:
+        """
+        parameters
+            int
+        returns
+            Quaternion
+                a copy
+        """
+
+        type_validation(index, int)
+
+        if index < 0 or index >= self.get_count():
+            raise ValueError(f"Index must be within range({self.get_count()}).")
+
+        return Quaternion(*[column[index] for column in self.__columns])
+
+    def get_count(self) -> int:
+        """
+        returns
+            int
+        """
+        return len(self.__columns[0])
+
+    def get_quaternions(self) -> list[Quaternion]:
+        """
+        returns
+            list<Quaternion>
+        """
+        return [Quaternion(*values) for values in zip(*self.__columns)]
+
+    def nlerp(
+        self, end: "QuaternionArray | Quaternion", t: "float | int | Iterable[float]"
+    ) -> "QuaternionArray":
+        """
+        parameters
+            QuaternionArray, Quaternion
+                a single Quaternion is the end of every one of ours
+            float/int, Iterable<float>
+                one t for all, or one each
+        returns
+            QuaternionArray
+
+        As nlerp, for each of ours.
+        """
+
+        ends, t = self.__get_blend_arguments(end, t)
+
+        blended = QuaternionArray()
+        for aw, ax, ay, az, bw, bx, by, bz, s in zip(*self.__columns, *ends, t):
+            # q and -q are the same rotation, pick whichever is closer
+            u = 1.0 - s
+            v = -s if aw * bw + ax * bx + ay * by + az * bz < 0.0 else s
+            blended.__add_normalized(
+                u * aw + v * bw, u * ax + v * bx, u * ay + v * by, u * az + v * bz
+            )
+        return blended
+
+    def __add_normalized(self, w: float, x: float, y: float, z: float):
+        """
+        parameters
+            float
+            float
+            float
+            float
+        """
+
+        magnitude = math.sqrt(w * w + x * x + y * y + z * z)
+        if magnitude == 0.0:
+            magnitude = 1.0
+
+        for column, value in zip(self.__columns, (w, x, y, z)):
+            column.append(value / magnitude)
+
+    def normalize(self) -> "QuaternionArray":
+        """
+        returns
+            QuaternionArray
+
+        Zero Quaternions stay zero, as with Quaternion.normalize.
+        """
+        normalized = QuaternionArray()
+        for values in zip(*self.__columns):
+            normalized.__add_normalized(*values)
+        return normalized
+
+    def slerp(
+        self, end: "QuaternionArray | Quaternion", t: "float | int | Iterable[float]"
+    ) -> "QuaternionArray":
+        """
+        parameters
+            QuaternionArray, Quaternion
+                a single Quaternion is the end of every one of ours
+            float/int, Iterable<float>
+                one t for all, or one each
+        returns
+            QuaternionArray
+
+        As slerp, for each of ours.
+        """
+
+        ends, t = self.__get_blend_arguments(end, t)
+
+        blended = QuaternionArray()
+        for aw, ax, ay, az, bw, bx, by, bz, s in zip(*self.__columns, *ends, t):
+            dot = aw * bw + ax * bx + ay * by + az * bz
+            sign = 1.0
+            if dot < 0.0:
+                dot = -dot
+                sign = -1.0
+
+            # Too close to divide by sin(angle), nlerp instead
+            if dot > SLERP_THRESHOLD:
+                u = 1.0 - s
+                v = s * sign
+                blended.__add_normalized(
+                    u * aw + v * bw, u * ax + v * bx, u * ay + v * by, u * az + v * bz
+                )
+                continue
+
+            angle = math.acos(dot)
+            sin = math.sin(angle)
+            u = math.sin((1.0 - s) * angle) / sin
+            v = math.sin(s * angle) / sin * sign
+            for column, value in zip(
+                blended.__columns,
+                (u * aw + v * bw, u * ax + v * bx, u * ay + v * by, u * az + v * bz),
+            ):
+                column.append(value)
+
+        return blended
+
+
+def get_quaternion_array(quaternions: Iterable[Quaternion]) -> QuaternionArray:
+    """
+    parameters
+        Iterable<Quaternion>
+    returns
+        QuaternionArray
+    """
+    quaternion_array = QuaternionArray()
+    quaternion_array.extend(quaternions)
+    return quaternion_array
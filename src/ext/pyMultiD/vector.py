@@ -10,41 +10,19 @@ from ..pyHelpers.descriptor import Descriptor
 from ..pyHelpers.math import divide_by_zero
 from ..pyHelpers.type_validation import type_validation
 
-from .matrix import Matrix
+from .matrix import Matrix, matmul
+from .matrix4 import get_rotation_matrix3
 
 
 class Vector:
     """
-    parameters
-        *args
-        list<str>
-        type
-
-    args are default values for the attributes
+    The arithmetic every vector shares, written against
+    get_attributes_as_list and get_values_as_list.  Holds nothing itself,
+    so Vector2f/Vector3f keep to their slots, see GenericVector for
+    attributes given at runtime.
     """
 
-    __slots__ = ["__attributes", "__attribute_type", "__dict__"]
-
-    def __init__(self, *args, attributes: list[str], attribute_type: type) -> None:
-        if (
-            not isinstance(attributes, list)
-            or len(attributes) == 0
-            or not all(isinstance(a, str) for a in attributes)
-        ):
-            raise ValueError(
-                f"Expected list of Strings for attributes, received {attributes}."
-            )
-
-        self.__attributes = attributes
-        self.__attribute_type = attribute_type
-
-        # Here we create our Descriptors for the given attributes and set their initial values
-        for i in range(len(self.__attributes)):
-            attribute = self.__attributes[i]
-            value = args[i]
-
-            setattr(self, attribute, Descriptor(self.__attribute_type))
-            setattr(self, attribute, value)
+    __slots__ = []
 
     def __repr__(self) -> str:
         """
@@ -136,16 +114,20 @@ class Vector:
                 ]
             )
         # Matrix
-        # Here we let Matrix handle the operation, then we
-        # get those values back and store them in a new classes
-        # attributes.
+        # Here we let matmul handle the operation, as a block of one,
+        # then store its values in a new classes attributes.  A Matrix
+        # one larger than us is an affine, translating as well.
         elif isinstance(other, Matrix):
-            return self.__class__(
-                *[
-                    (other * self.get_values_as_matrix()).get_value(i, 0)
-                    for i in range(len(self.__attributes))
-                ]
-            )
+            values = self.get_values_as_list()
+            size = other.get_rows_length()
+            if size not in (len(values), len(values) + 1) or (
+                other.get_columns_length() != size
+            ):
+                raise ValueError(
+                    f"Expected a {len(values)}x{len(values)} or "
+                    f"{len(values) + 1}x{len(values) + 1} Matrix."
+                )
+            return self.__class__(*matmul(other, values, size > len(values)))
 
         # Error
         else:
@@ -168,7 +150,7 @@ class Vector:
         # the below loop, otherwise our values update causing oddities.
         updated_values = self.__oper(other, operator)
 
-        for attribute in self.__attributes:
+        for attribute in self.get_attributes_as_list():
             setattr(
                 self,
                 attribute,
@@ -215,7 +197,8 @@ class Vector:
             dict
         """
         return {
-            attribute: self.get_attribute(attribute) for attribute in self.__attributes
+            attribute: self.get_attribute(attribute)
+            for attribute in self.get_attributes_as_list()
         }
 
     def get_attribute(self, attribute: "str | int") -> float | int:
@@ -238,11 +221,12 @@ class Vector:
         returns
             float/int
         """
-        if not isinstance(id, int) or id < 0 or id >= len(self.__attributes):
+        attributes = self.get_attributes_as_list()
+        if not isinstance(id, int) or id < 0 or id >= len(attributes):
             raise ValueError(
-                f"Id must be of type int and within range({len(self.__attributes)})."
+                f"Id must be of type int and within range({len(attributes)})."
             )
-        return getattr(self, self.__attributes[id])
+        return getattr(self, attributes[id])
 
     def get_attribute_by_name(self, name: str) -> float | int:
         """ "
@@ -251,17 +235,24 @@ class Vector:
         returns
             float/int
         """
-        if name not in self.__attributes:
-            raise ValueError(f"{name} not in {self.__attributes}.")
+        if name not in self.get_attributes_as_list():
+            raise ValueError(f"{name} not in {self.get_attributes_as_list()}.")
 
         return getattr(self, name)
 
+    def _get_attribute_type(self) -> type:
+        """
+        returns
+            type
+        """
+        raise NotImplementedError
+
     def get_attributes_as_list(self) -> list[str]:
         """
         returns
             list<str>
         """
-        return list(self.__attributes)
+        raise NotImplementedError
 
     def get_values_as_list(self) -> list[float | int]:
         """
@@ -275,9 +266,10 @@ class Vector:
         returns
             Matrix(Num Properties)x1
         """
-        m = Matrix(len(self.__attributes), 1)
-        for i in range(len(self.__attributes)):
-            m.set_value(i, 0, getattr(self, self.__attributes[i]))
+        values = self.get_values_as_list()
+        m = Matrix(len(values), 1)
+        for i in range(len(values)):
+            m.set_value(i, 0, values[i])
         return m
 
     def magnitude(self) -> float:
@@ -322,13 +314,16 @@ class Vector:
             int
             int/float
         """
-        if not isinstance(id, int) or id < 0 or id >= len(self.__attributes):
+        attributes = self.get_attributes_as_list()
+        if not isinstance(id, int) or id < 0 or id >= len(attributes):
+            raise ValueError(
+                f"Id must be of type int and within range({len(attributes)})."
+            )
+        elif self._get_attribute_type() != type(value):
             raise ValueError(
-                f"Id must be of type int and within range({len(self.__attributes)})."
+                f"Expected {self._get_attribute_type()} received {type(value)}"
             )
-        elif self.__attribute_type != type(value):
-            raise ValueError(f"Expected {self.__attribute_type} received {type(value)}")
-        setattr(self, self.__attributes[id], value)
+        setattr(self, attributes[id], value)
 
     def set_attribute_by_name(self, name: str, value: "int | float"):
         """ "
@@ -336,10 +331,12 @@ class Vector:
             str
             int/float
         """
-        if name not in self.__attributes:
-            raise ValueError(f"{name} not in {self.__attributes}.")
-        elif self.__attribute_type != type(value):
-            raise ValueError(f"Expected {self.__attribute_type} received {type(value)}")
+        if name not in self.get_attributes_as_list():
+            raise ValueError(f"{name} not in {self.get_attributes_as_list()}.")
+        elif self._get_attribute_type() != type(value):
+            raise ValueError(
+                f"Expected {self._get_attribute_type()} received {type(value)}"
+            )
         setattr(self, name, value)
 
     def sum(self) -> float:
@@ -360,15 +357,232 @@ class Vector:
         self._update(other, operator.add)
 
 
+class GenericVector(Vector):
+    """
+    parameters
+        *args
+        list<str>
+        type
+
+    args are default values for the attributes
+    """
+
+    __slots__ = ["__attributes", "__attribute_type", "__dict__"]
+
+    def __init__(self, *args, attributes: list[str], attribute_type: type) -> None:
+        if (
+            not isinstance(attributes, list)
+            or len(attributes) == 0
+            or not all(isinstance(a, str) for a in attributes)
+        ):
+            raise ValueError(
+                f"Expected list of Strings for attributes, received {attributes}."
+            )
+
+        self.__attributes = attributes
+        self.__attribute_type = attribute_type
+
+        # Here we create our Descriptors for the given attributes and set their initial values
+        for i in range(len(self.__attributes)):
+            attribute = self.__attributes[i]
+            value = args[i]
+
+            setattr(self, attribute, Descriptor(self.__attribute_type))
+            setattr(self, attribute, value)
+
+    def _get_attribute_type(self) -> type:
+        """
+        returns
+            type
+        """
+        return self.__attribute_type
+
+    def get_attributes_as_list(self) -> list[str]:
+        """
+        returns
+            list<str>
+        """
+        return list(self.__attributes)
+
+
 class Vector2f(Vector):
     """
     parameters
         float
         float
+
+    X/Y live in slots, with the arithmetic written out for each, rather
+    than going through Vector's attribute lists.
     """
 
+    __slots__ = ["X", "Y"]
+
+    ATTRIBUTES = ["X", "Y"]
+
     def __init__(self, x: float = 0.0, y: float = 0.0):
-        super().__init__(x, y, attributes=["X", "Y"], attribute_type=float)
+        self.X = x
+        self.Y = y
+
+    def __add__(self, other: "Vector2f | float | int") -> "Vector2f":
+        """
+        parameters
+            Vector2f, float, int
+        returns
+            Vector2f
+        """
+        if isinstance(other, (int, float)):
+            return Vector2f(self.X + other, self.Y + other)
+        elif isinstance(other, Vector2f):
+            return Vector2f(self.X + other.X, self.Y + other.Y)
+        return super().__add__(other)
+
+    def __eq__(self, other: "Vector") -> bool:
+        """
+        parameters
+            Vector
+        returns
+            bool
+        """
+        if isinstance(other, Vector2f):
+            return self.X == other.X and self.Y == other.Y
+        return super().__eq__(other)
+
+    def __mul__(self, other: "Vector2f | float | int") -> "Vector2f":
+        """
+        parameters
+            Vector2f, int, float
+        returns
+            Vector2f
+        """
+        if isinstance(other, (int, float)):
+            return Vector2f(self.X * other, self.Y * other)
+        elif isinstance(other, Vector2f):
+            return Vector2f(self.X * other.X, self.Y * other.Y)
+        return super().__mul__(other)
+
+    def __sub__(self, other: "Vector2f | float | int") -> "Vector2f":
+        """
+        parameters
+            Vector2f, int, float
+        returns
+            Vector2f
+        """
+        if isinstance(other, (int, float)):
+            return Vector2f(self.X - other, self.Y - other)
+        elif isinstance(other, Vector2f):
+            return Vector2f(self.X - other.X, self.Y - other.Y)
+        return super().__sub__(other)
+
+    def __truediv__(self, other: "Vector2f | float | int") -> "Vector2f":
+        """
+        parameters
+            Vector2f, int, float
+        returns
+            Vector2f
+
+        As divide_by_zero, dividing by zero gives 0.0.
+        """
+        if isinstance(other, (int, float)):
+            if other == 0:
+                return Vector2f(0.0, 0.0)
+            return Vector2f(self.X / other, self.Y / other)
+        elif isinstance(other, Vector2f):
+            return Vector2f(
+                0.0 if other.X == 0 else self.X / other.X,
+                0.0 if other.Y == 0 else self.Y / other.Y,
+            )
+        return super().__truediv__(other)
+
+    def _update(self, other: "Vector2f | float | int", operator: operator):
+        """
+        parameters
+            Vector2f, int, float
+            Python Operator
+        """
+
+        # Our operators are specialised, so run the one asked for on us whole
+        if operator is divide_by_zero:
+            updated = self.__truediv__(other)
+        else:
+            updated = operator(self, other)
+
+        self.X = updated.X
+        self.Y = updated.Y
+
+    def distance(self, other: "Vector2f") -> float:
+        """
+        parameters
+            Vector2f
+        returns
+            float
+        """
+
+        type_validation(other, Vector2f)
+
+        x = other.X - self.X
+        y = other.Y - self.Y
+        return math.sqrt(x * x + y * y)
+
+    def dot(self, other: "Vector2f") -> float:
+        """
+        parameters
+            Vector2f
+        returns
+            float
+        """
+
+        type_validation(other, Vector2f)
+
+        return self.X * other.X + self.Y * other.Y
+
+    def get(self):
+        """
+        returns
+            dict
+        """
+        return {"X": self.X, "Y": self.Y}
+
+    def _get_attribute_type(self) -> type:
+        """
+        returns
+            type
+        """
+        return float
+
+    def get_attributes_as_list(self) -> list[str]:
+        """
+        returns
+            list<str>
+        """
+        return list(self.ATTRIBUTES)
+
+    def get_values_as_list(self) -> list[float | int]:
+        """
+        returns
+            list<float/int>
+        """
+        return [self.X, self.Y]
+
+    def magnitude(self) -> float:
+        """
+        returns
+            float
+        """
+        return math.sqrt(self.X * self.X + self.Y * self.Y)
+
+    def normalize(self) -> "Vector2f":
+        """
+        returns
+            Vector2f
+        """
+        return self.__truediv__(self.magnitude())
+
+    def sum(self) -> float:
+        """
+        returns
+            float
+        """
+        return self.X + self.Y
 
 
 class Vector3f(Vector):
@@ -377,59 +591,197 @@ class Vector3f(Vector):
         float
         float
         float
+
+    X/Y/Z live in slots, with the arithmetic written out for each, rather
+    than going through Vector's attribute lists.
     """
 
+    __slots__ = ["X", "Y", "Z"]
+
+    ATTRIBUTES = ["X", "Y", "Z"]
+
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
-        super().__init__(x, y, z, attributes=["X", "Y", "Z"], attribute_type=float)
+        self.X = x
+        self.Y = y
+        self.Z = z
 
-    def rotate(self, roll: float | int, pitch: float | int, yaw: float | int):
+    def __add__(self, other: "Vector3f | float | int") -> "Vector3f":
         """
         parameters
-            float/int
-            float/int
-            float/int
+            Vector3f, float, int
+        returns
+            Vector3f
+        """
+        if isinstance(other, (int, float)):
+            return Vector3f(self.X + other, self.Y + other, self.Z + other)
+        elif isinstance(other, Vector3f):
+            return Vector3f(self.X + other.X, self.Y + other.Y, self.Z + other.Z)
+        return super().__add__(other)
 
-        roll = x
-        pitch = y
-        yaw = z
+    def __eq__(self, other: "Vector") -> bool:
+        """
+        parameters
+            Vector
+        returns
+            bool
+        """
+        if isinstance(other, Vector3f):
+            return self.X == other.X and self.Y == other.Y and self.Z == other.Z
+        return super().__eq__(other)
+
+    def __mul__(self, other: "Vector3f | float | int") -> "Vector3f":
+        """
+        parameters
+            Vector3f, int, float
+        returns
+            Vector3f
+        """
+        if isinstance(other, (int, float)):
+            return Vector3f(self.X * other, self.Y * other, self.Z * other)
+        elif isinstance(other, Vector3f):
+            return Vector3f(self.X * other.X, self.Y * other.Y, self.Z * other.Z)
+        return super().__mul__(other)
+
+    def __sub__(self, other: "Vector3f | float | int") -> "Vector3f":
+        """
+        parameters
+            Vector3f, int, float
+        returns
+            Vector3f
+        """
+        if isinstance(other, (int, float)):
+            return Vector3f(self.X - other, self.Y - other, self.Z - other)
+        elif isinstance(other, Vector3f):
+            return Vector3f(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+        return super().__sub__(other)
+
+    def __truediv__(self, other: "Vector3f | float | int") -> "Vector3f":
         """
+        parameters
+            Vector3f, int, float
+        returns
+            Vector3f
 
-        type_validation([roll, pitch, yaw], (float, int))
+        As divide_by_zero, dividing by zero gives 0.0.
+        """
+        if isinstance(other, (int, float)):
+            if other == 0:
+                return Vector3f(0.0, 0.0, 0.0)
+            return Vector3f(self.X / other, self.Y / other, self.Z / other)
+        elif isinstance(other, Vector3f):
+            return Vector3f(
+                0.0 if other.X == 0 else self.X / other.X,
+                0.0 if other.Y == 0 else self.Y / other.Y,
+                0.0 if other.Z == 0 else self.Z / other.Z,
+            )
+        return super().__truediv__(other)
 
-        # Convert degrees to radians
-        pitch_radians = math.radians(pitch)
-        roll_radians = math.radians(roll)
-        yaw_radians = math.radians(yaw)
+    def _update(self, other: "Vector3f | float | int", operator: operator):
+        """
+        parameters
+            Vector3f, int, float
+            Python Operator
+        """
 
-        # Pitch, or Y
-        pitch_matrix = Matrix(3, 3)
+        # Our operators are specialised, so run the one asked for on us whole
+        if operator is divide_by_zero:
+            updated = self.__truediv__(other)
+        else:
+            updated = operator(self, other)
 
-        pitch_matrix.set_value(0, 0, math.cos(pitch_radians))
-        pitch_matrix.set_value(2, 0, math.sin(pitch_radians))
-        pitch_matrix.set_value(1, 1, 1.0)
-        pitch_matrix.set_value(0, 2, -math.sin(pitch_radians))
-        pitch_matrix.set_value(2, 2, math.cos(pitch_radians))
+        self.X = updated.X
+        self.Y = updated.Y
+        self.Z = updated.Z
 
-        # Roll, or X
-        roll_matrix = Matrix(3, 3)
+    def distance(self, other: "Vector3f") -> float:
+        """
+        parameters
+            Vector3f
+        returns
+            float
+        """
 
-        roll_matrix.set_value(0, 0, 1.0)
-        roll_matrix.set_value(1, 1, math.cos(roll_radians))
-        roll_matrix.set_value(2, 1, -math.sin(roll_radians))
-        roll_matrix.set_value(1, 2, math.sin(roll_radians))
-        roll_matrix.set_value(2, 2, math.cos(roll_radians))
+        type_validation(other, Vector3f)
 
-        # Yaw, or Z
-        yaw_matrix = Matrix(3, 3)
+        x = other.X - self.X
+        y = other.Y - self.Y
+        z = other.Z - self.Z
+        return math.sqrt(x * x + y * y + z * z)
 
-        yaw_matrix.set_value(0, 0, math.cos(yaw_radians))
-        yaw_matrix.set_value(1, 0, -math.sin(yaw_radians))
-        yaw_matrix.set_value(0, 1, math.sin(yaw_radians))
-        yaw_matrix.set_value(1, 1, math.cos(yaw_radians))
-        yaw_matrix.set_value(2, 2, 1.0)
+    def dot(self, other: "Vector3f") -> float:
+        """
+        parameters
+            Vector3f
+        returns
+            float
+        """
+
+        type_validation(other, Vector3f)
+
+        return self.X * other.X + self.Y * other.Y + self.Z * other.Z
+
+    def get(self):
+        """
+        returns
+            dict
+        """
+        return {"X": self.X, "Y": self.Y, "Z": self.Z}
 
-        # Order is Yaw * Pitch * Roll
-        rotation_matrix = yaw_matrix * pitch_matrix * roll_matrix
+    def _get_attribute_type(self) -> type:
+        """
+        returns
+            type
+        """
+        return float
+
+    def get_attributes_as_list(self) -> list[str]:
+        """
+        returns
+            list<str>
+        """
+        return list(self.ATTRIBUTES)
 
-        # Update ourself
-        self._update(rotation_matrix, operator.mul)
+    def get_values_as_list(self) -> list[float | int]:
+        """
+        returns
+            list<float/int>
+        """
+        return [self.X, self.Y, self.Z]
+
+    def magnitude(self) -> float:
+        """
+        returns
+            float
+        """
+        return math.sqrt(self.X * self.X + self.Y * self.Y + self.Z * self.Z)
+
+    def normalize(self) -> "Vector3f":
+        """
+        returns
+            Vector3f
+        """
+        return self.__truediv__(self.magnitude())
+
+    def rotate(self, roll: float | int, pitch: float | int, yaw: float | int):
+        """
+        parameters
+            float/int
+            float/int
+            float/int
+
+        roll = x
+        pitch = y
+        yaw = z
+        """
+
+        # Update ourself, the same angles share one cached Matrix3
+        self.X, self.Y, self.Z = get_rotation_matrix3(roll, pitch, yaw).transform(
+            [self.X, self.Y, self.Z]
+        )
+
+    def sum(self) -> float:
+        """
+        returns
+            float
+        """
+        return self.X + self.Y + self.Z
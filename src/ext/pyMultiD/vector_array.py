@@ -0,0 +1,519 @@
+"""
+vector_array.py
+
+Many Vectors at once, as one contiguous array of floats per attribute.
+"""
+
+import math
+import operator
+from array import array
+from itertools import repeat
+from typing import Iterable
+
+from ..pyHelpers.type_validation import type_validation
+
+from .matrix import Matrix
+from .matrix4 import Matrix3, Matrix4, get_rotation_matrix3
+from .vector import Vector, Vector2f, Vector3f
+
+
+def _divide(a: float, b: float) -> float:
+    """
+    parameters
+        float
+        float
+    returns
+        float
+
+    divide_by_zero, without validating every element.
+    """
+    return 0.0 if b == 0 else a / b
+
+
+class VectorArray:
+    """
+    parameters
+        *Iterable<float>
+            one per attribute of the vector type, all the same length
+        type
+            Vector2f/Vector3f
+
+    Structure of arrays.  Operations run down each attribute's array
+    instead of through one Vector at a time.  Like Vector, operations
+    return new instances, while scale/translate change ours.
+    """
+
+    __slots__ = ["__columns", "__vector_type"]
+
+    def __init__(self, *columns: Iterable[float], vector_type: type):
+        if vector_type not in (Vector2f, Vector3f):
+            raise ValueError(f"Expected Vector2f or Vector3f, received {vector_type}.")
+        elif len(columns) != len(vector_type.ATTRIBUTES):
+            raise ValueError(
+                f"Expected {len(vector_type.ATTRIBUTES)} columns, "
+                f"received {len(columns)}."
+            )
+
+        self.__columns = [array("d", column) for column in columns]
+        self.__vector_type = vector_type
+
+        if len(set(len(column) for column in self.__columns)) > 1:
+            raise ValueError("Columns must all be the same length.")
+
+    def __repr__(self) -> str:
+        """
+        returns
+            string
+        """
+        return self.__str__()
+
+    def __str__(self) -> str:
+        """
+        returns
+            string
+        """
+        return f"{self.get_vectors()}"
+
+    def __add__(self, other: "VectorArray | Vector | float | int") -> "VectorArray":
+        """
+        parameters
+            VectorArray, Vector, float, int
+        returns
+            VectorArray
+        """
+        return self.__oper(other, operator.add)
+
+    def __mul__(
+        self, other: "VectorArray | Vector | Matrix | Matrix3 | Matrix4 | float | int"
+    ) -> "VectorArray":
+        """
+        parameters
+            VectorArray, Vector, Matrix, Matrix3, Matrix4, float, int
+        returns
+            VectorArray
+
+        A Matrix is applied to each Vector, either square over our
+        attributes, or an affine one larger, translating as well.
+        """
+        if isinstance(other, (Matrix, Matrix3, Matrix4)):
+            return self.__transform(other)
+        return self.__oper(other, operator.mul)
+
+    def __sub__(self, other: "VectorArray | Vector | float | int") -> "VectorArray":
+        """
+        parameters
+            VectorArray, Vector, float, int
+        returns
+            VectorArray
+        """
+        return self.__oper(other, operator.sub)
+
+    def __truediv__(self, other: "VectorArray | Vector | float | int") -> "VectorArray":
+        """
+        parameters
+            VectorArray, Vector, float, int
+        returns
+            VectorArray
+
+        As divide_by_zero, dividing by zero gives 0.0.
+        """
+        return self.__oper(other, _divide)
+
+    def __get_other_columns(
+        self, other: "VectorArray | Vector | float | int"
+    ) -> list[Iterable[float]]:
+        """
+        parameters
+            VectorArray, Vector, float, int
+        returns
+            list<Iterable<float>>
+                one per attribute, lined up with ours
+
+        Single Vectors and numbers repeat for every one of ours.
+        """
+
+        # Int/Float
+        if isinstance(other, (int, float)):
+            return [repeat(other) for _ in self.__columns]
+        # Vector
+        elif type(other) is self.__vector_type:
+            return [repeat(value) for value in other.get_values_as_list()]
+        # VectorArray
+        elif isinstance(other, type(self)):
+            if other.get_count() != self.get_count():
+                raise ValueError(
+                    f"Expected {self.get_count()} Vectors, "
+                    f"received {other.get_count()}."
+                )
+            return other.__columns
+
+        # Error
+        raise ValueError(
+            f"Expected {type(self)}, {self.__vector_type}, int, float, or Matrix"
+        )
+
+    def __new_array(self, columns: list[Iterable[float]]) -> "VectorArray":
+        """
+        parameters
+            list<Iterable<float>>
+        returns
+            VectorArray
+                of our class and vector type, as the subclasses don't take
+                a vector type
+        """
+        vector_array = self.__class__.__new__(self.__class__)
+        VectorArray.__init__(vector_array, *columns, vector_type=self.__vector_type)
+        return vector_array
+
+    def __oper(
+        self, other: "VectorArray | Vector | float | int", operator: operator
+    ) -> "VectorArray":
+        """
+        parameters
+            VectorArray, Vector, float, int
+            Python Operator
+        returns
+            VectorArray
+        """
+        return self.__new_array(
+            [
+                array("d", map(operator, column, other_column))
+                for (column, other_column) in zip(
+                    self.__columns, self.__get_other_columns(other)
+                )
+            ]
+        )
+
+    def __transform(self, matrix: "Matrix | Matrix3 | Matrix4") -> "VectorArray":
+        """
+        parameters
+            Matrix, Matrix3, Matrix4
+        returns
+            VectorArray
+        """
+
+        m = matrix.get_values_as_list()
+
+        size = len(self.__columns)
+        if isinstance(matrix, Matrix):
+            rows = matrix.get_rows_length()
+            columns = matrix.get_columns_length()
+        else:
+            rows = columns = 3 if isinstance(matrix, Matrix3) else 4
+        if rows not in (size, size + 1) or columns != rows:
+            raise ValueError(
+                f"Expected a {size}x{size} or {size + 1}x{size + 1} Matrix."
+            )
+
+        # Each row of the matrix gives us one attribute, summed a column
+        # of ours at a time
+        columns = []
+        for i in range(size):
+            row = m[i * rows : i * rows + rows]
+            values = [row[size] if rows > size else 0.0] * self.get_count()
+            for j in range(size):
+                if row[j] != 0:
+                    values = [
+                        v + row[j] * c for (v, c) in zip(values, self.__columns[j])
+                    ]
+            columns.append(values)
+
+        return self.__new_array(columns)
+
+    def _update(self, other: "VectorArray | Vector | float | int", operator: operator):
+        """
+        parameters
+            VectorArray, Vector, Matrix, float, int
+            Python Operator
+
+        Runs the operation as normal, then keeps its arrays as ours.
+        """
+        self.__columns = operator(self, other).__columns
+
+    def append(self, vector: Vector):
+        """
+        parameters
+            Vector
+        """
+
+        type_validation(vector, self.__vector_type)
+
+        for column, value in zip(self.__columns, vector.get_values_as_list()):
+            column.append(value)
+
+    def distance(self, other: "VectorArray | Vector") -> array:
+        """
+        parameters
+            VectorArray, Vector
+        returns
+            array("d")
+                one per Vector
+        """
+
+        type_validation(other, (type(self), self.__vector_type))
+
+        return (self - other).magnitude()
+
+    def dot(self, other: "VectorArray | Vector") -> array:
+        """
+        parameters
+            VectorArray, Vector
+        returns
+            array("d")
+                one per Vector
+        """
+
+        type_validation(other, (type(self), self.__vector_type))
+
+        values = [0.0] * self.get_count()
+        for column, other_column in zip(
+            self.__columns, self.__get_other_columns(other)
+        ):
+            values = [v + a * b for (v, a, b) in zip(values, column, other_column)]
+        return array("d", values)
+
+    def extend(self, vectors: Iterable[Vector]):
+        """
+        parameters
+            Iterable<Vector>
+        """
+        for vector in vectors:
+            self.append(vector)
+
+    def get(self, index: int) -> Vector:
+        """
+        parameters
+            int
+        returns
+            Vector
+                a copy
+        """
+
+        type_validation(index, int)
+
+        if index < 0 or index >= self.get_count():
+            raise ValueError(f"Index must be within range({self.get_count()}).")
+
+        return self.__vector_type(*[column[index] for column in self.__columns])
+
+    def get_attribute_view(self, attribute: str) -> memoryview:
+        """
+        parameters
+            str
+        returns
+            memoryview
+                read only, over the attribute's floats
+        """
+
+        attributes = self.__vector_type.ATTRIBUTES
+        if attribute not in attributes:
+            raise ValueError(f"{attribute} not in {attributes}.")
+
+        return memoryview(self.__columns[attributes.index(attribute)]).toreadonly()
+
+    def get_count(self) -> int:
+        """
+        returns
+            int
+        """
+        return len(self.__columns[0])
+
+    def get_maximum(self) -> Vector:
+        """
+        returns
+            Vector
+                the largest of each attribute
+        """
+
+        if self.get_count() == 0:
+            raise ValueError("No Vectors to find the maximum of.")
+
+        return self.__vector_type(*[max(column) for column in self.__columns])
+
+    def get_minimum(self) -> Vector:
+        """
+        returns
+            Vector
+                the smallest of each attribute
+        """
+
+        if self.get_count() == 0:
+            raise ValueError("No Vectors to find the minimum of.")
+
+        return self.__vector_type(*[min(column) for column in self.__columns])
+
+    def get_type(self) -> type:
+        """
+        returns
+            type
+                Vector2f/Vector3f
+        """
+        return self.__vector_type
+
+    def get_vectors(self) -> list[Vector]:
+        """
+        returns
+            list<Vector>
+        """
+        return [self.__vector_type(*values) for values in zip(*self.__columns)]
+
+    def magnitude(self) -> array:
+        """
+        returns
+            array("d")
+                one per Vector
+        """
+        return array("d", map(math.sqrt, self.dot(self)))
+
+    def normalize(self) -> "VectorArray":
+        """
+        returns
+            VectorArray
+
+        Zero length Vectors stay zero, as with Vector.normalize.
+        """
+        magnitudes = self.magnitude()
+        return self.__new_array(
+            [
+                [0.0 if m == 0 else c / m for (c, m) in zip(column, magnitudes)]
+                for column in self.__columns
+            ]
+        )
+
+    def scale(self, other: "VectorArray | Vector | float | int"):
+        """
+        parameters
+            VectorArray, Vector, float, int
+        """
+
+        type_validation(other, [type(self), self.__vector_type, int, float])
+
+        self._update(other, operator.mul)
+
+    def set(self, index: int, vector: Vector):
+        """
+        parameters
+            int
+            Vector
+        """
+
+        type_validation([index, vector], [int, self.__vector_type])
+
+        if index < 0 or index >= self.get_count():
+            raise ValueError(f"Index must be within range({self.get_count()}).")
+
+        for column, value in zip(self.__columns, vector.get_values_as_list()):
+            column[index] = value
+
+    def transform(self, matrix: "Matrix | Matrix3 | Matrix4"):
+        """
+        parameters
+            Matrix, Matrix3, Matrix4
+                square over our attributes, or an affine one larger
+        """
+
+        type_validation(matrix, [Matrix, Matrix3, Matrix4])
+
+        self._update(matrix, operator.mul)
+
+    def translate(self, other: "VectorArray | Vector | float | int"):
+        """
+        parameters
+            VectorArray, Vector, float, int
+        """
+
+        type_validation(other, (type(self), self.__vector_type, int, float))
+
+        self._update(other, operator.add)
+
+
+class Vector2fArray(VectorArray):
+    """
+    parameters
+        (optional)
+            Iterable<float>
+            Iterable<float>
+    """
+
+    def __init__(self, x: Iterable[float] = (), y: Iterable[float] = ()):
+        super().__init__(x, y, vector_type=Vector2f)
+
+
+class Vector3fArray(VectorArray):
+    """
+    parameters
+        (optional)
+            Iterable<float>
+            Iterable<float>
+            Iterable<float>
+    """
+
+    def __init__(
+        self,
+        x: Iterable[float] = (),
+        y: Iterable[float] = (),
+        z: Iterable[float] = (),
+    ):
+        super().__init__(x, y, z, vector_type=Vector3f)
+
+    def cross(self, other: "Vector3fArray | Vector3f") -> "Vector3fArray":
+        """
+        parameters
+            Vector3fArray, Vector3f
+        returns
+            Vector3fArray
+        """
+
+        type_validation(other, (Vector3fArray, Vector3f))
+
+        ax, ay, az = [self.get_attribute_view(a) for a in Vector3f.ATTRIBUTES]
+        if isinstance(other, Vector3f):
+            bx, by, bz = [repeat(value) for value in other.get_values_as_list()]
+        else:
+            if other.get_count() != self.get_count():
+                raise ValueError(
+                    f"Expected {self.get_count()} Vectors, "
+                    f"received {other.get_count()}."
+                )
+            bx, by, bz = [other.get_attribute_view(a) for a in Vector3f.ATTRIBUTES]
+
+        return Vector3fArray(
+            [y * c - z * b for (y, z, b, c) in zip(ay, az, by, bz)],
+            [z * a - x * c for (x, z, a, c) in zip(ax, az, bx, bz)],
+            [x * b - y * a for (x, y, a, b) in zip(ax, ay, bx, by)],
+        )
+
+    def rotate(self, roll: float | int, pitch: float | int, yaw: float | int):
+        """
+        parameters
+            float/int
+            float/int
+            float/int
+
+        roll = x
+        pitch = y
+        yaw = z
+        """
+        self.transform(get_rotation_matrix3(roll, pitch, yaw))
+
+
+def get_vector_array(vectors: Iterable[Vector]) -> VectorArray:
+    """
+    parameters
+        Iterable<Vector2f/Vector3f>
+            at least one, all the same type
+    returns
+        Vector2fArray/Vector3fArray
+    """
+
+    vectors = list(vectors)
+    if len(vectors) == 0:
+        raise ValueError("Expected at least one Vector.")
+
+    array_types = {Vector2f: Vector2fArray, Vector3f: Vector3fArray}
+    if type(vectors[0]) not in array_types:
+        raise ValueError(f"Expected Vector2f or Vector3f, received {type(vectors[0])}.")
+
+    vector_array = array_types[type(vectors[0])]()
+    vector_array.extend(vectors)
+    return vector_array
@@ -0,0 +1,108 @@
+"""
+test_aabb.py
+
+python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+from src.ext.pyMultiD.aabb import AABB3f, AABBSet
+from src.ext.pyMultiD.vector import Vector3f
+
+
+def get_random_aabb(size: float) -> AABB3f:
+    """
+    parameters
+        float
+            largest extent on each axis
+    returns
+        AABB3f
+    """
+    minimum = [random.uniform(0.0, 100.0) for _ in range(3)]
+    return AABB3f(
+        Vector3f(*minimum),
+        Vector3f(*[i + random.uniform(0.0, size) for i in minimum]),
+    )
+
+
+class TestAABBSet(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+
+    def assert_pairs(self, aabb_set: AABBSet, aabbs: dict):
+        """
+        parameters
+            AABBSet
+            dict
+                id to AABB3f, what the set should hold
+        """
+        ids = sorted(aabbs)
+        expected = [
+            (a, b)
+            for i, a in enumerate(ids)
+            for b in ids[i + 1 :]
+            if aabbs[a].is_colliding_with_aabb(aabbs[b])
+        ]
+        self.assertEqual(aabb_set.get_pairs(), expected)
+
+    def test_pairs(self):
+        aabb_set = AABBSet()
+        aabbs = {}
+        for _ in range(60):
+            aabb = get_random_aabb(10.0)
+            aabbs[aabb_set.add(aabb)] = aabb
+        self.assert_pairs(aabb_set, aabbs)
+
+        # A few at a time, so only those moved are searched
+        for _ in range(40):
+            id = random.choice(sorted(aabbs))
+            choice = random.random()
+            if choice < 0.2:
+                aabb_set.remove(id)
+                del aabbs[id]
+            elif choice < 0.4:
+                aabb = get_random_aabb(10.0)
+                aabbs[aabb_set.add(aabb)] = aabb
+            else:
+                aabbs[id] = get_random_aabb(10.0)
+                aabb_set.update(id, aabbs[id])
+            self.assert_pairs(aabb_set, aabbs)
+
+    def test_largest_leaves(self):
+        aabb_set = AABBSet()
+        aabbs = {}
+        for _ in range(40):
+            aabb = get_random_aabb(2.0)
+            aabbs[aabb_set.add(aabb)] = aabb
+
+        # The largest is shrunk, then another removed, pairs still hold
+        large = AABB3f(Vector3f(0.0, 0.0, 0.0), Vector3f(100.0, 100.0, 100.0))
+        id = aabb_set.add(large)
+        aabbs[id] = large
+        self.assert_pairs(aabb_set, aabbs)
+
+        aabbs[id] = get_random_aabb(2.0)
+        aabb_set.update(id, aabbs[id])
+        self.assert_pairs(aabb_set, aabbs)
+
+        aabb_set.remove(id)
+        del aabbs[id]
+        for other in sorted(aabbs)[0:3]:
+            aabbs[other] = get_random_aabb(2.0)
+            aabb_set.update(other, aabbs[other])
+        self.assert_pairs(aabb_set, aabbs)
+
+    def test_bad_update(self):
+        aabb_set = AABBSet()
+        id = aabb_set.add(get_random_aabb(1.0))
+
+        with self.assertRaises(ValueError):
+            aabb_set.update(id, "bad")
+
+        aabb_set.remove(id)
+        self.assertEqual(aabb_set.get_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+test_boxes.py
+
+python -m unittest discover tests
+"""
+
+import unittest
+
+from src.core.shapes.boxes import generate_boxes
+
+
+class TestGenerateBoxes(unittest.TestCase):
+    def test_merge_faces(self):
+        for count, size in [(1, 1.0), (3, 0.5)]:
+            merged = generate_boxes(count, size, merge_faces=True)
+            culled = generate_boxes(count, size, cull_interior=True)
+
+            # One box, six quads, over the same bounds as the pile
+            self.assertEqual(len(list(merged.iter_triangles())), 12)
+            for a, b in [
+                (merged.get_aabb().Minimum, culled.get_aabb().Minimum),
+                (merged.get_aabb().Maximum, culled.get_aabb().Maximum),
+            ]:
+                for i, j in zip(a.get_values_as_list(), b.get_values_as_list()):
+                    self.assertAlmostEqual(i, j)
+
+
+if __name__ == "__main__":
+    unittest.main()
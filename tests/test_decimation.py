@@ -0,0 +1,135 @@
+"""
+test_decimation.py
+
+python -m unittest discover tests
+"""
+
+import math
+import unittest
+
+from src.ext.pyGraphics.decimation import decimate_shape
+from src.ext.pyGraphics.shape import Shape
+from src.ext.pyGraphics.shapes.quadrilateral import generate_quadrilateral
+from src.ext.pyGraphics.shapes.triangle import generate_triangle
+from src.ext.pyGraphics.vertex import VertexPositionNormalTexture
+from src.ext.pyMultiD.vector import Vector2f, Vector3f
+
+
+SIZE = 8
+
+
+def get_grid(height=lambda x, z: 0.0) -> Shape:
+    """
+    parameters
+        (optional)
+            function(int, int) -> float
+    returns
+        Shape
+            SIZE x SIZE cells, one texture stretched over the whole grid
+    """
+
+    def get_vertex(x: int, z: int) -> VertexPositionNormalTexture:
+        return VertexPositionNormalTexture(
+            Vector3f(float(x), height(x, z), float(z)),
+            Vector3f(0.0, 1.0, 0.0),
+            Vector2f(x / SIZE, z / SIZE),
+        )
+
+    shape = Shape(VertexPositionNormalTexture)
+    for z in range(SIZE):
+        for x in range(SIZE):
+            shape.add(
+                generate_triangle(
+                    get_vertex(x, z), get_vertex(x, z + 1), get_vertex(x + 1, z + 1)
+                )
+            )
+            shape.add(
+                generate_triangle(
+                    get_vertex(x, z), get_vertex(x + 1, z + 1), get_vertex(x + 1, z)
+                )
+            )
+    return shape
+
+
+def get_tiled_grid(texture_minimum: Vector2f, texture_size: Vector2f) -> Shape:
+    """
+    parameters
+        Vector2f
+        Vector2f
+    returns
+        Shape
+            flat, SIZE x SIZE cells, each its own copy of the texture region,
+            as generate_heightmap tiles
+    """
+
+    shape = Shape(VertexPositionNormalTexture)
+    for z in range(1, SIZE + 1):
+        for x in range(1, SIZE + 1):
+            shape.add(
+                generate_quadrilateral(
+                    Vector3f(float(x - 1), 0.0, float(z - 1)),
+                    Vector3f(float(x), 0.0, float(z - 1)),
+                    Vector3f(float(x), 0.0, float(z)),
+                    Vector3f(float(x - 1), 0.0, float(z)),
+                    texture_minimum,
+                    texture_size,
+                )
+            )
+    return shape
+
+
+class TestDecimateShape(unittest.TestCase):
+    def test_flat(self):
+        shape = get_grid()
+
+        result = decimate_shape(shape, max_error=1e-9)
+
+        self.assertLess(result["after"], result["before"])
+        self.assertEqual(result["after"], len(list(shape.iter_triangles())))
+
+        # Borders stay, and the texture is still stretched over the grid
+        positions = {position for (position, _, _) in shape.iter_vertices()}
+        for i in range(SIZE + 1):
+            for x, z in [(i, 0), (i, SIZE), (0, i), (SIZE, i)]:
+                self.assertIn((float(x), 0.0, float(z)), positions)
+        for position, _, texture in shape.iter_vertices():
+            self.assertAlmostEqual(texture[0], position[0] / SIZE)
+            self.assertAlmostEqual(texture[1], position[2] / SIZE)
+
+    def test_atlas_tile_seams(self):
+        minimum = Vector2f(0.0625, 0.0625)
+        size = Vector2f(0.0625, 0.0625)
+        shape = get_tiled_grid(minimum, size)
+
+        decimate_shape(shape, max_error=1e-9)
+
+        for _, _, texture in shape.iter_vertices():
+            for i in range(2):
+                self.assertGreaterEqual(texture[i], 0.0625)
+                self.assertLessEqual(texture[i], 0.125)
+
+    def test_normals(self):
+        shape = get_grid(lambda x, z: 3.0 * math.sin(x / 2.0) * math.cos(z / 3.0))
+        shape.compute_normals()
+
+        decimate_shape(shape, target_count=SIZE * SIZE // 2)
+
+        # Every normal is what smoothing what's left would give
+        expected = Shape(VertexPositionNormalTexture)
+        expected.extend(shape)
+        expected.compute_normals()
+        for (_, normal, _), (_, other, _) in zip(
+            shape.iter_vertices(), expected.iter_vertices()
+        ):
+            for a, b in zip(normal, other):
+                self.assertAlmostEqual(a, b)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            decimate_shape(get_grid())
+        with self.assertRaises(ValueError):
+            decimate_shape(get_grid(), target_count=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+test_instanced_shape.py
+
+python -m unittest discover tests
+"""
+
+import unittest
+
+from src.ext.pyGraphics.instanced_shape import InstancedShape
+from src.ext.pyGraphics.shape import Shape
+from src.ext.pyGraphics.shapes.box import generate_box
+from src.ext.pyMultiD.matrix4 import (
+    get_rotation_matrix4,
+    get_scale_matrix4,
+    get_translation_matrix4,
+)
+from src.ext.pyMultiD.vector import Vector2f, Vector3f
+
+
+def get_instances() -> InstancedShape:
+    """
+    returns
+        InstancedShape
+            boxes, moved, turned and scaled, some touching
+    """
+
+    instances = InstancedShape(
+        generate_box(Vector3f(), Vector3f(1.0, 1.0, 1.0), [Vector2f()] * 6)
+    )
+    instances.add(Vector3f(0.0, 0.0, 0.0))
+    instances.add(Vector3f(1.0, 0.0, 0.0))
+    instances.add(
+        get_translation_matrix4(0.0, 3.0, 0.0) * get_rotation_matrix4(30, 45, 60)
+    )
+    instances.add(get_scale_matrix4(2.0, 0.5, 1.0))
+    instances.add(get_scale_matrix4(0.0, 0.0, 0.0))
+    return instances
+
+
+class TestInstancedShape(unittest.TestCase):
+    def test_get_shape(self):
+        instances = get_instances()
+        prototype = instances.get_prototype()
+
+        for deduplicate in [False, True]:
+            # Each instance its own Shape, transformed, then extended
+            expected = Shape(prototype.get_type())
+            for i in range(instances.get_count()):
+                instance = Shape(prototype.get_type())
+                instance.extend(prototype)
+                instance.transform(instances.get_transform(i))
+                expected.extend(instance, deduplicate)
+
+            shape = instances.get_shape(deduplicate)
+
+            self.assertEqual(
+                list(shape.iter_vertices()), list(expected.iter_vertices())
+            )
+            for v in range(shape.get_indices_stride()):
+                self.assertEqual(
+                    shape.get_vertex_count(v), expected.get_vertex_count(v)
+                )
+
+            # A box's corners are its positions, so its AABBs are exact too
+            aabb = shape.get_aabb()
+            instances_aabb = instances.get_aabb()
+            for a, b in zip(
+                aabb.Minimum.get_values_as_list() + aabb.Maximum.get_values_as_list(),
+                instances_aabb.Minimum.get_values_as_list()
+                + instances_aabb.Maximum.get_values_as_list(),
+            ):
+                self.assertAlmostEqual(a, b)
+
+    def test_empty(self):
+        instances = InstancedShape(
+            generate_box(Vector3f(), Vector3f(1.0, 1.0, 1.0), [Vector2f()] * 6)
+        )
+
+        self.assertEqual(instances.get_shape().get_indices_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+test_matrix.py
+
+python -m unittest discover tests
+"""
+
+import random
+import unittest
+from unittest import mock
+
+from src.ext.pyMultiD import matrix as matrix_module
+from src.ext.pyMultiD.matrix import Matrix, matmul
+from src.ext.pyMultiD.vector import Vector3f
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def get_random_matrix(rows: int, columns: int) -> Matrix:
+    """
+    parameters
+        int
+        int
+    returns
+        Matrix
+    """
+    m = Matrix(rows, columns)
+    for i in range(rows):
+        for j in range(columns):
+            m.set_value(i, j, random.uniform(-10.0, 10.0))
+    return m
+
+
+@unittest.skipUnless(numpy is not None, "NumPy isn't installed.")
+class TestMatmulNumPy(unittest.TestCase):
+    """
+    The NumPy path against the flat list one, which is what runs without it.
+    """
+
+    def setUp(self):
+        random.seed(1)
+
+    def assert_lists_equal(self, first: list[float], second: list[float]):
+        """
+        parameters
+            list[float]
+            list[float]
+        """
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b, places=9)
+
+    def test_block(self):
+        for rows, k, affine in [(3, 3, False), (4, 4, True), (2, 3, False)]:
+            m = get_random_matrix(rows, k)
+            block = [random.uniform(-10.0, 10.0) for _ in range(5 * (k - affine))]
+
+            with_numpy = matmul(m, block, affine)
+            with mock.patch.object(matrix_module, "numpy", None):
+                without = matmul(m, block, affine)
+
+            self.assertEqual(with_numpy.typecode, without.typecode)
+            self.assert_lists_equal(with_numpy.tolist(), without.tolist())
+
+    def test_empty_block(self):
+        m = get_random_matrix(3, 3)
+
+        with mock.patch.object(matrix_module, "numpy", None):
+            without = matmul(m, [])
+
+        self.assertEqual(matmul(m, []).tolist(), without.tolist())
+
+    def test_ndarray(self):
+        m = get_random_matrix(4, 4)
+        block = [random.uniform(-10.0, 10.0) for _ in range(3 * 6)]
+
+        products = matmul(m, numpy.array(block).reshape(-1, 3), True)
+        with mock.patch.object(matrix_module, "numpy", None):
+            without = matmul(m, block, True)
+
+        self.assertEqual(products.shape, (6, 3))
+        self.assert_lists_equal(products.ravel().tolist(), without.tolist())
+
+    def test_matrix_multiply(self):
+        a = get_random_matrix(3, 4)
+        b = get_random_matrix(4, 2)
+
+        with_numpy = a * b
+        with mock.patch.object(matrix_module, "numpy", None):
+            without = a * b
+
+        self.assertEqual(with_numpy.get_rows_length(), without.get_rows_length())
+        self.assertEqual(with_numpy.get_columns_length(), without.get_columns_length())
+        self.assert_lists_equal(
+            with_numpy.get_values_as_list(), without.get_values_as_list()
+        )
+
+    def test_vector_multiply(self):
+        m = get_random_matrix(4, 4)
+        v = Vector3f(1.5, -2.0, 3.25)
+
+        with_numpy = v * m
+        with mock.patch.object(matrix_module, "numpy", None):
+            without = v * m
+
+        self.assert_lists_equal(
+            with_numpy.get_values_as_list(), without.get_values_as_list()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()